@@ -0,0 +1,63 @@
+"""Per-worker admission control for solves, sized by their estimated cost"""
+
+import math
+import threading
+from contextlib import contextmanager
+
+
+class Overloaded(Exception):
+    """Raised when no solve slot frees up in time; retry_after is a hint in seconds"""
+
+    def __init__(self, retry_after):
+        super().__init__(f"No solve slot free, retry after {retry_after}s")
+        self.retry_after = retry_after
+
+
+class AdmissionController:
+    """
+    Caps the solves running at once in this worker. A request waits up to
+    max_wait seconds for a slot and is turned away after that, so a burst
+    is shed instead of stretching every solve behind the GIL. The retry
+    hint is the estimated work still running per slot.
+    """
+
+    def __init__(self, max_concurrent=1, max_wait=1.0):
+        self.max_concurrent = max_concurrent
+        self.max_wait = max_wait
+        self._slots = threading.BoundedSemaphore(max_concurrent)
+        self._lock = threading.Lock()
+        self._running_seconds = 0.0
+        self.running = 0
+        self.admitted = 0
+        self.rejected = 0
+
+    @contextmanager
+    def slot(self, estimated_seconds=0.0):
+        """Hold a solve slot for the duration of the block, or raise Overloaded"""
+        if not self._slots.acquire(timeout=self.max_wait):
+            with self._lock:
+                self.rejected += 1
+                retry_after = max(1, math.ceil(self._running_seconds / self.max_concurrent))
+            raise Overloaded(retry_after)
+
+        with self._lock:
+            self.admitted += 1
+            self.running += 1
+            self._running_seconds += estimated_seconds
+        try:
+            yield
+        finally:
+            with self._lock:
+                self.running -= 1
+                self._running_seconds -= estimated_seconds
+            self._slots.release()
+
+    def stats(self):
+        with self._lock:
+            return {
+                "running": self.running,
+                "admitted": self.admitted,
+                "rejected": self.rejected,
+                "max_concurrent": self.max_concurrent,
+                "max_wait": self.max_wait,
+            }
@@ -1,10 +1,15 @@
 """Flask Serve Endpoint"""
 
+import base64
+import gc
+import json
 import logging
 import os
+import threading
 import time
+from contextlib import ExitStack
 
-from flask import Flask, jsonify, render_template, request
+from flask import Flask, Response, jsonify, render_template, request, url_for
 
 logging.basicConfig(
     level=logging.INFO,
@@ -14,7 +19,26 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 try:
-    from letterboxd_solver import GraphLetterBoxedSolver, SpellBeeSolver, read_word_list
+    from admission import AdmissionController, Overloaded
+    from batch import iter_batch_lines, parse_board
+    from board_index import BoardIndex
+    from compiled_dictionary import load_word_index
+    from jobs import DONE, FAILED, QUEUED, JobQueue, QueueFull
+    from metrics import SolverMetrics
+    from solution_cache import (
+        SolutionCache,
+        SqliteCacheBackend,
+        canonical_letterboxed_key,
+        canonical_spellbee_key,
+    )
+    from letterboxd_solver import (
+        GraphLetterBoxedSolver,
+        PartitionPool,
+        SpellBeeSolver,
+        build_word_index,
+        read_word_list,
+        solution_sort_key,
+    )
 except ImportError as e:
     logger.critical(f"Failed to import required modules: {e}")
     raise
@@ -22,15 +46,114 @@ except ImportError as e:
 app = Flask(__name__, static_folder="static", template_folder="templates")
 
 WORD_LIST_PATH = os.path.join("word_lists", "2of12.txt")
+# Built by compiled_dictionary.py; used instead of the text list when present
+WORD_DICTIONARY_PATH = os.environ.get(
+    "WORD_DICTIONARY_PATH", os.path.join("word_lists", "2of12.dict")
+)
+BOARD_INDEX_PATH = os.path.join("word_lists", "boards.txt")
 DEFAULT_MAX_PATH = 3
 SOLVER_TIMEOUT = 60  # seconds
+SOLUTION_CACHE_SIZE = int(os.environ.get("SOLUTION_CACHE_SIZE", "512"))
+SOLUTION_CACHE_TTL = int(os.environ.get("SOLUTION_CACHE_TTL", "86400"))  # seconds
+SOLUTION_CACHE_DB = os.environ.get("SOLUTION_CACHE_DB")  # sqlite path shared by workers
+# Processes of each worker's solve_parallel pool, used for iterative
+# deepening solves (max_path 3); 0 keeps every solve inside the request worker
+PARALLEL_SOLVE_WORKERS = int(os.environ.get("PARALLEL_SOLVE_WORKERS", "0"))
+# Per-solve search limits, so a worker degrades or stops instead of being OOM killed
+SOLVER_MEMORY_BUDGET = int(os.environ.get("SOLVER_MEMORY_BUDGET_MB", "256")) * 2**20
+SOLVER_STATE_BUDGET = int(os.environ.get("SOLVER_STATE_BUDGET", "0")) or None
+# Solution pages: JSON API default and cap, and the rows rendered into
+# result.html before the page fetches the rest from the API
+API_PAGE_SIZE = 50
+API_MAX_PAGE_SIZE = 500
+HTML_PAGE_SIZE = 100
+# Boards accepted by one /api/solve/batch request
+MAX_BATCH_BOARDS = int(os.environ.get("MAX_BATCH_BOARDS", "1000"))
+# Background solves: Letter Boxed requests with at least ASYNC_MIN_MAX_PATH
+# words per chain are queued as jobs and polled, instead of holding a
+# request thread for up to SOLVER_TIMEOUT
+ASYNC_MIN_MAX_PATH = int(os.environ.get("ASYNC_MIN_MAX_PATH", "5"))
+JOB_WORKERS = int(os.environ.get("JOB_WORKERS", "2"))
+JOB_QUEUE_SIZE = int(os.environ.get("JOB_QUEUE_SIZE", "32"))
+JOB_RETENTION = int(os.environ.get("JOB_RETENTION", "3600"))  # seconds
+JOB_MAX_RETAINED = int(os.environ.get("JOB_MAX_RETAINED", "256"))
+JOB_POLL_SECONDS = 2
+# Admission control from GraphLetterBoxedSolver.estimate_cost: estimates
+# above ADMIT_INLINE_SECONDS run as jobs, max_path is lowered until the
+# estimate fits ADMIT_MAX_SECONDS, and at most MAX_CONCURRENT_SOLVES inline
+# solves run per worker, each request waiting ADMISSION_WAIT seconds for a
+# slot before it gets a 503. On 2of12 estimates stay under 0.1s up to
+# max_path 3 and reach about 2s for sparse boards at max_path 10
+ADMIT_INLINE_SECONDS = float(os.environ.get("ADMIT_INLINE_SECONDS", "0.1"))
+ADMIT_MAX_SECONDS = float(os.environ.get("ADMIT_MAX_SECONDS", "1"))
+MAX_CONCURRENT_SOLVES = int(os.environ.get("MAX_CONCURRENT_SOLVES", "1"))
+ADMISSION_WAIT = float(os.environ.get("ADMISSION_WAIT", "1"))
+# Puzzles solved into the cache by warmup(): comma-separated boards, each
+# optionally followed by ":max_path", and Spelling Bee letters
+WARMUP_BOARDS = os.environ.get("WARMUP_BOARDS", "")
+WARMUP_SPELLBEE = os.environ.get("WARMUP_SPELLBEE", "")
+
+# Cleaned words, masks and inverted indexes shared by every request. The
+# compiled dictionary is memory-mapped, so its masks are loaded rather than
+# recomputed and the mapped pages are shared by every worker
+word_index = None
+if os.path.exists(WORD_DICTIONARY_PATH):
+    try:
+        word_index = load_word_index(WORD_DICTIONARY_PATH)
+        word_list = word_index.words
+        logger.info(f"Mapped compiled dictionary with {len(word_list)} words")
+    except (OSError, ValueError) as e:
+        logger.warning(f"Compiled dictionary unusable, reading the word list: {e}")
+
+if word_index is None:
+    try:
+        word_list = read_word_list(WORD_LIST_PATH)
+        logger.info(f"Successfully loaded word list with {len(word_list)} words")
+    except Exception as e:
+        logger.critical(f"Failed to load word list: {e}")
+        word_list = []  # Empty fallback to prevent app from crashing
+    word_index = build_word_index(word_list)
+
+# Solved puzzles, optionally shared across workers through a sqlite file
+solution_cache = SolutionCache(
+    maxsize=SOLUTION_CACHE_SIZE,
+    ttl=SOLUTION_CACHE_TTL,
+    backend=SqliteCacheBackend(SOLUTION_CACHE_DB, SOLUTION_CACHE_TTL)
+    if SOLUTION_CACHE_DB
+    else None,
+)
+
+# Long solves waiting for or running on the background workers
+job_queue = JobQueue(
+    workers=JOB_WORKERS,
+    max_queued=JOB_QUEUE_SIZE,
+    retention=JOB_RETENTION,
+    max_retained=JOB_MAX_RETAINED,
+)
+
+# Serializes writes of the job records that queue_letterboxed shares through the cache
+job_record_lock = threading.Lock()
+
+# Inline solves running in this worker
+admission = AdmissionController(max_concurrent=MAX_CONCURRENT_SOLVES, max_wait=ADMISSION_WAIT)
 
+# Long-lived solve_parallel pool of this process, started by the first
+# request solve that deepens iteratively. Warm-up never starts one, and a
+# pool inherited across a fork belongs to its parent's pid and is not reused
+partition_pool = None
+partition_pool_pid = None
+partition_pool_lock = threading.Lock()
+
+# Per-phase solver timings and counters, exposed at /metrics
+solver_metrics = SolverMetrics()
+
+# Solvable boards built offline by board_index.py, sampled for random puzzles
 try:
-    word_list = read_word_list(WORD_LIST_PATH)
-    logger.info(f"Successfully loaded word list with {len(word_list)} words")
-except Exception as e:
-    logger.critical(f"Failed to load word list: {e}")
-    word_list = []  # Empty fallback to prevent app from crashing
+    board_index = BoardIndex.load(BOARD_INDEX_PATH)
+    logger.info(f"Loaded board index with {len(board_index)} boards")
+except OSError as e:
+    logger.warning(f"Board index unavailable, random boards will be solved on demand: {e}")
+    board_index = None
 
 
 def sort_letterboxed_solutions(solutions):
@@ -38,8 +161,58 @@ def sort_letterboxed_solutions(solutions):
     Sort letterboxed results by:
     - Fewest words first
     - Then by most letters used
+    - Then alphabetically, so equal boards always render in the same order
     """
-    return sorted(solutions, key=lambda chain: (len(chain), -len(set("".join(chain)))))
+    return sorted(solutions, key=solution_sort_key)
+
+
+def parse_max_path(value):
+    """Parse a requested max_path, falling back to the default when invalid"""
+    try:
+        max_path = int(value)
+        if max_path <= 0 or max_path > 10:
+            max_path = DEFAULT_MAX_PATH
+            logger.warning(
+                f"Invalid max_path value, using default: {DEFAULT_MAX_PATH}"
+            )
+    except (TypeError, ValueError):
+        max_path = DEFAULT_MAX_PATH
+        logger.warning(
+            f"Non-integer max_path value, using default: {DEFAULT_MAX_PATH}"
+        )
+    return max_path
+
+
+def parse_page_limit(value):
+    """Page size from a limit parameter, clamped to API_MAX_PAGE_SIZE"""
+    if value is None:
+        return API_PAGE_SIZE
+    return min(max(1, int(value)), API_MAX_PAGE_SIZE)
+
+
+def encode_cursor(cache_key, offset):
+    """Opaque pagination cursor holding the puzzle's cache key and the next offset"""
+    return base64.urlsafe_b64encode(json.dumps([cache_key, offset]).encode()).decode()
+
+
+def decode_cursor(cursor, cache_key):
+    """Offset stored in a cursor; ValueError when malformed or for another puzzle"""
+    try:
+        key, offset = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (ValueError, TypeError) as e:
+        raise ValueError("Malformed cursor") from e
+    if key != cache_key or not isinstance(offset, int) or offset < 0:
+        raise ValueError("Cursor does not belong to this puzzle")
+    return offset
+
+
+def paginate(items, cache_key, cursor, limit):
+    """Return one page of a cached, sorted result and the cursor of the next page"""
+    offset = decode_cursor(cursor, cache_key) if cursor else 0
+    page = items[offset : offset + limit]
+    next_offset = offset + len(page)
+    next_cursor = encode_cursor(cache_key, next_offset) if next_offset < len(items) else None
+    return page, next_cursor
 
 
 @app.errorhandler(404)
@@ -55,11 +228,56 @@ def server_error(e):
     return render_template("error.html", error="Internal server error"), 500
 
 
+def random_solvable_box_edges(vowels=None, difficulty=None):
+    """
+    Sample a solvable board from the precomputed board index, falling back
+    to generating and solving random boards when no indexed board matches.
+    """
+    if board_index is not None:
+        box_edges = board_index.sample(vowels=vowels, difficulty=difficulty)
+        if box_edges is not None:
+            return box_edges
+        logger.warning(f"No indexed board with vowels={vowels}, difficulty={difficulty}")
+
+    from letterboxd_solver import generate_solvable_box_edges
+    box_edges, _ = generate_solvable_box_edges(word_index)
+    return box_edges
+
+
+# Set by warmup(); /ready reports it
+warmup_state = {"ready": False, "seconds": None, "boards": 0, "spellbee": 0}
+
+
+@app.route("/ready")
+def ready():
+    """Readiness probe: 200 once warm-up has finished, 503 until then"""
+    return jsonify(warmup_state), 200 if warmup_state["ready"] else 503
+
+
+@app.route("/metrics")
+def metrics():
+    """Prometheus histograms of solver stats for this worker"""
+    return Response(solver_metrics.render(), mimetype="text/plain; version=0.0.4")
+
+
+@app.route("/api/cache_stats")
+def api_cache_stats():
+    """Solution cache hit/miss counters for this worker"""
+    return jsonify(solution_cache.stats())
+
+
+@app.route("/api/admission_stats")
+def api_admission_stats():
+    """Inline solve slots in use and admission counters for this worker"""
+    return jsonify(admission.stats())
+
+
 @app.route("/api/random_letterboxed")
 def api_random_letterboxed():
     try:
-        from letterboxd_solver import generate_solvable_box_edges
-        box_edges, _ = generate_solvable_box_edges(word_list)
+        vowels = request.args.get("vowels", type=int)
+        difficulty = request.args.get("difficulty") or None
+        box_edges = random_solvable_box_edges(vowels=vowels, difficulty=difficulty)
         letters = "".join([l for edge in box_edges for l in edge])
         return jsonify({"letters": letters})
     except Exception as e:
@@ -74,7 +292,7 @@ def api_random_letterboxed():
 def api_random_spellbee():
     try:
         from letterboxd_solver import generate_solvable_spellbee_letters
-        letters = generate_solvable_spellbee_letters(word_list)
+        letters = generate_solvable_spellbee_letters(word_index)
         return jsonify({"letters": letters})
     except Exception as e:
         logger.error(f"API random spellbee failed: {e}")
@@ -84,6 +302,285 @@ def api_random_spellbee():
         return jsonify({"letters": letters})
 
 
+@app.route("/api/solve/letterboxed")
+def api_solve_letterboxed():
+    """
+    One page of a board's sorted solutions. The full result is solved and
+    cached once; pass next_cursor back as cursor to fetch the next page.
+    Expensive boards are queued instead and answered with 202 and the job
+    to poll; see serve_letterboxed. The response's max_path is the one
+    actually solved, which admission control may have lowered.
+    """
+    letters_input = request.args.get("letters", "").upper().strip()
+    if len(letters_input) != 12 or not letters_input.isalpha():
+        return jsonify({"error": "Letter Boxed requires exactly 12 letters."}), 400
+
+    max_path = parse_max_path(request.args.get("max_path", DEFAULT_MAX_PATH))
+    try:
+        limit = parse_page_limit(request.args.get("limit"))
+    except ValueError:
+        return jsonify({"error": "limit must be an integer."}), 400
+
+    box_edges = [list(letters_input[i : i + 3]) for i in range(0, 12, 3)]
+    start_time = time.time()
+    try:
+        solutions, job, max_path = serve_letterboxed(box_edges, max_path)
+    except QueueFull:
+        return queue_full_response()
+    except Overloaded as e:
+        return overloaded_response(e)
+    if job is not None:
+        return job_response(job)
+
+    try:
+        page, next_cursor = paginate(
+            solutions, canonical_letterboxed_key(box_edges, max_path),
+            request.args.get("cursor"), limit,
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    return jsonify({
+        "letters": letters_input,
+        "max_path": max_path,
+        "count": len(solutions),
+        "solutions": page,
+        "next_cursor": next_cursor,
+        "solve_time": round(time.time() - start_time, 3),
+    })
+
+
+@app.route("/api/solve/spellbee")
+def api_solve_spellbee():
+    """One page of a Spelling Bee's scored words, highest score first"""
+    letters_input = request.args.get("letters", "").upper().strip()
+    if len(letters_input) < 7 or not letters_input.isalpha():
+        return jsonify({"error": "Spell Bee input must be at least 7 letters (center + 6)."}), 400
+
+    try:
+        limit = parse_page_limit(request.args.get("limit"))
+    except ValueError:
+        return jsonify({"error": "limit must be an integer."}), 400
+
+    start_time = time.time()
+    result = solve_spellbee(letters_input)
+    words = list(result["words"].items())
+    try:
+        page, next_cursor = paginate(
+            words, canonical_spellbee_key(letters_input), request.args.get("cursor"), limit
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    return jsonify({
+        "letters": letters_input,
+        "count": len(words),
+        "total_points": result["total_points"],
+        "pangram_count": result["pangram_count"],
+        "words": page,
+        "next_cursor": next_cursor,
+        "solve_time": round(time.time() - start_time, 3),
+    })
+
+
+@app.route("/api/jobs/letterboxed", methods=["POST"])
+def api_submit_letterboxed_job():
+    """Queue a Letter Boxed solve of any max_path and return the job to poll"""
+    letters_input = request.values.get("letters", "").upper().strip()
+    if len(letters_input) != 12 or not letters_input.isalpha():
+        return jsonify({"error": "Letter Boxed requires exactly 12 letters."}), 400
+
+    max_path = parse_max_path(request.values.get("max_path", DEFAULT_MAX_PATH))
+    box_edges = [list(letters_input[i : i + 3]) for i in range(0, 12, 3)]
+    solver, _ = admitted_solver(box_edges, max_path)
+    try:
+        job = queue_letterboxed(box_edges, solver.max_path_length, solver=solver)
+    except QueueFull:
+        return queue_full_response()
+    return job_response(job)
+
+
+@app.route("/api/jobs/<job_id>")
+def api_job(job_id):
+    """
+    Status and progress of a job. Once it is done the response also holds
+    one page of its solutions, paged with cursor and limit like
+    /api/solve/letterboxed. A job this worker does not hold, because
+    another worker queued it or it expired, is answered from the solve
+    cache and the job record queue_letterboxed left there; it is never
+    solved again here, and a job unknown to the cache is a 404.
+    """
+    job = job_queue.get(job_id)
+    if job is None:
+        return shared_job_response(job_id)
+
+    response = job_queue.describe(job)
+    if not job.finished:
+        response["poll_after"] = JOB_POLL_SECONDS
+        return jsonify(response), 200, {"Retry-After": str(JOB_POLL_SECONDS)}
+    if job.result is not None:
+        try:
+            add_solutions_page(response, job.result, job.id)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+    return jsonify(response)
+
+
+def shared_job_response(job_id):
+    """Status of a Letter Boxed job held by another worker, from the solve cache"""
+    board = parse_letterboxed_job_id(job_id)
+    if board is None:
+        return jsonify({"error": "Unknown job."}), 404
+    box_edges, max_path = board
+    solutions = solution_cache.get(canonical_letterboxed_key(box_edges, max_path))
+    record = solution_cache.get(job_record_key(job_id))
+    if record is not None and time.time() - record["updated_at"] > JOB_RETENTION:
+        record = None
+    if solutions is None and record is None:
+        return jsonify({
+            "error": "Unknown or expired job, submit the board again.",
+            "submit_url": url_for("api_submit_letterboxed_job"),
+        }), 404
+
+    response = {
+        "job_id": job_id,
+        "kind": "letterboxed",
+        "params": {"letters": "".join("".join(edge) for edge in box_edges), "max_path": max_path},
+        "status": DONE if solutions is not None else record["status"],
+        "progress": {},
+    }
+    if solutions is not None:
+        try:
+            add_solutions_page(response, solutions, job_id)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        return jsonify(response)
+    if record.get("error") is not None:
+        response["error"] = record["error"]
+        return jsonify(response)
+    # Only the worker holding the job knows its place in the queue and timings
+    response.update(position=None, wait_seconds=None, run_seconds=None)
+    response["poll_after"] = JOB_POLL_SECONDS
+    return jsonify(response), 200, {"Retry-After": str(JOB_POLL_SECONDS)}
+
+
+def add_solutions_page(response, solutions, cache_key):
+    """Add the requested page of a job's solutions to its status response"""
+    limit = parse_page_limit(request.args.get("limit"))
+    page, next_cursor = paginate(solutions, cache_key, request.args.get("cursor"), limit)
+    response.update(count=len(solutions), solutions=page, next_cursor=next_cursor)
+
+
+@app.route("/api/jobs")
+def api_job_stats():
+    return jsonify(job_queue.stats())
+
+
+@app.route("/api/solve/batch", methods=["POST"])
+def api_solve_batch():
+    """
+    Solve many Letter Boxed boards in one request. The body is either
+    text with one 'LETTERS' or 'LETTERS:max_path' per line, or JSON
+    {"boards": [...], "max_path": 3}. Results stream back as JSON lines
+    in input order, followed by a summary line with the throughput. Each
+    board goes through the solve cache and an admission slot like a single
+    solve; a board turned away gets an error line.
+    """
+    default_max_path = parse_max_path(request.args.get("max_path", DEFAULT_MAX_PATH))
+    if request.is_json:
+        payload = request.get_json(silent=True)
+        if not isinstance(payload, dict) or not isinstance(payload.get("boards"), list):
+            return jsonify({"error": "JSON body must be an object with a boards list."}), 400
+        default_max_path = parse_max_path(payload.get("max_path", default_max_path))
+        lines = [str(board) for board in payload["boards"]]
+    else:
+        lines = request.get_data(as_text=True).splitlines()
+
+    boards = [
+        board for board in (parse_board(line, default_max_path) for line in lines)
+        if board is not None
+    ]
+    if not boards:
+        return jsonify({"error": "No boards given."}), 400
+    if len(boards) > MAX_BATCH_BOARDS:
+        return jsonify({"error": f"At most {MAX_BATCH_BOARDS} boards per batch."}), 413
+
+    logger.info(f"Solving a batch of {len(boards)} boards")
+    headers = {"X-Accel-Buffering": "no", "Cache-Control": "no-cache"}
+    return Response(
+        iter_batch_lines(boards, word_index, solve=solve_batch_board),
+        mimetype="application/x-ndjson", headers=headers,
+    )
+
+
+@app.route("/api/stream/letterboxed")
+def api_stream_letterboxed():
+    """
+    Stream Letter Boxed solutions as JSON lines, shortest chains first.
+    With order=best they arrive in exactly the sorted result order, so
+    the first lines are the best answers. The search stops at the limit,
+    at SOLVER_TIMEOUT, or as soon as the client disconnects and the server
+    closes the response iterator. The stream holds an admission slot until
+    the response is closed, so it counts against MAX_CONCURRENT_SOLVES.
+    """
+    letters_input = request.args.get("letters", "").upper().strip()
+    if len(letters_input) != 12 or not letters_input.isalpha():
+        return jsonify({"error": "Letter Boxed requires exactly 12 letters."}), 400
+
+    max_path = parse_max_path(request.args.get("max_path", DEFAULT_MAX_PATH))
+    try:
+        limit = max(1, int(request.args.get("limit", 1000)))
+    except ValueError:
+        return jsonify({"error": "limit must be an integer."}), 400
+    best_first = request.args.get("order") == "best"
+
+    box_edges = [list(letters_input[i : i + 3]) for i in range(0, 12, 3)]
+    solver, estimate = admitted_solver(box_edges, max_path)
+    max_path = solver.max_path_length
+    slot = ExitStack()
+    try:
+        slot.enter_context(admission.slot(estimate["seconds"]))
+    except Overloaded as e:
+        return overloaded_response(e)
+
+    def generate():
+        start_time = time.time()
+        deadline = start_time + SOLVER_TIMEOUT
+        if best_first:
+            solutions = solver.iter_best_first(deadline=deadline)
+        else:
+            solutions = solver.iter_solutions(stop_depth=max_path, deadline=deadline)
+        count = 0
+        try:
+            for chain in solutions:
+                count += 1
+                yield json.dumps({"chain": chain}) + "\n"
+                if count >= limit:
+                    break
+            solutions.close()
+            solve_time = time.time() - start_time
+            logger.info(
+                f"Letterboxed stream completed in {solve_time:.2f}s with {count} solutions"
+            )
+            yield json.dumps({
+                "done": True,
+                "count": count,
+                "solve_time": round(solve_time, 3),
+                "stats": solver.stats,
+            }) + "\n"
+        finally:
+            solutions.close()
+            solver_metrics.observe(solver.stats)
+            slot.close()
+
+    # Let nginx forward each line as soon as it is written
+    headers = {"X-Accel-Buffering": "no", "Cache-Control": "no-cache"}
+    response = Response(generate(), mimetype="application/x-ndjson", headers=headers)
+    # Closing the response also releases the slot of a stream that never started
+    response.call_on_close(slot.close)
+    return response
+
+
 @app.route("/", methods=["GET", "POST"])
 def index():
     """Flask routing setup with improved error handling"""
@@ -99,18 +596,7 @@ def index():
         if not letters_input:
             return render_template("index.html", error="Letters input is required")
 
-        try:
-            max_path = int(request.form.get("max_path", DEFAULT_MAX_PATH))
-            if max_path <= 0 or max_path > 10:
-                max_path = DEFAULT_MAX_PATH
-                logger.warning(
-                    f"Invalid max_path value, using default: {DEFAULT_MAX_PATH}"
-                )
-        except ValueError:
-            max_path = DEFAULT_MAX_PATH
-            logger.warning(
-                f"Non-integer max_path value, using default: {DEFAULT_MAX_PATH}"
-            )
+        max_path = parse_max_path(request.form.get("max_path", DEFAULT_MAX_PATH))
 
         is_random = request.form.get("random") == "on"
 
@@ -136,12 +622,247 @@ def index():
         )
 
 
+def build_letterboxed_solver(box_edges, max_path):
+    return GraphLetterBoxedSolver(
+        word_index, box_edges, max_path_length=max_path, use_bitmask=True,
+        word_order="coverage", memory_budget=SOLVER_MEMORY_BUDGET,
+        state_budget=SOLVER_STATE_BUDGET,
+    )
+
+
+def get_partition_pool():
+    """This worker's solve_parallel pool, or None when PARALLEL_SOLVE_WORKERS is 0"""
+    global partition_pool, partition_pool_pid
+    if PARALLEL_SOLVE_WORKERS <= 0:
+        return None
+    with partition_pool_lock:
+        if partition_pool is None or partition_pool_pid != os.getpid():
+            partition_pool = PartitionPool(word_index, workers=PARALLEL_SOLVE_WORKERS)
+            partition_pool_pid = os.getpid()
+    return partition_pool
+
+
+def solve_letterboxed(box_edges, max_path, progress=None, solver=None, parallel=True):
+    """
+    Solve a Letter Boxed board with the engine suited to max_path and
+    return up to 1000 chains, best first. Results are cached per
+    canonical board. A progress dict, when given, gets the live solver
+    stats while the search runs; solver reuses one already built for
+    admission. parallel=False keeps the solve off the partition pool.
+    """
+    cache_key = canonical_letterboxed_key(box_edges, max_path)
+    cached = solution_cache.get(cache_key)
+    if cached is not None:
+        logger.info(f"Letterboxed cache hit for {cache_key}")
+        return cached
+
+    if solver is None:
+        solver = build_letterboxed_solver(box_edges, max_path)
+    if progress is not None:
+        progress["stats"] = solver.stats
+
+    start_time = time.time()
+    # Only multi-word iterative deepening is split over the pool, so the
+    # other engines never start it
+    pool = None
+    if parallel and solver.auto_engine() == "iterative_deepening" and solver.max_path_length > 1:
+        pool = get_partition_pool()
+    raw_solutions = solver.solve_auto(pool=pool)
+    solve_time = time.time() - start_time
+
+    logger.info(
+        f"Letterboxed solve completed in {solve_time:.2f}s with {len(raw_solutions)} solutions"
+    )
+    logger.info(f"Letterboxed solve stats: {json.dumps(solver.stats)}")
+    solver_metrics.observe(solver.stats)
+
+    if solve_time > SOLVER_TIMEOUT:
+        logger.warning(
+            f"Solve operation took {solve_time:.2f}s, exceeding recommended timeout"
+        )
+
+    sorted_solutions = sort_letterboxed_solutions(raw_solutions)
+    if len(sorted_solutions) > 1000:  # Arbitrary limit
+        logger.info(f"Trimming results from {len(sorted_solutions)} to 1000")
+        sorted_solutions = sorted_solutions[:1000]
+
+    sorted_solutions = [list(chain) for chain in sorted_solutions]
+    solution_cache.set(cache_key, sorted_solutions)
+    return sorted_solutions
+
+
+def admitted_solver(box_edges, max_path):
+    """
+    Build the solver for a board with its cost estimate, lowering
+    max_path_length until the estimate fits ADMIT_MAX_SECONDS. Searches
+    stop at the first length with solutions, so this only loses boards
+    whose shortest solution is longer than the lowered max_path.
+    """
+    solver = build_letterboxed_solver(box_edges, max_path)
+    estimate = solver.estimate_cost()
+    while estimate["seconds"] > ADMIT_MAX_SECONDS and solver.max_path_length > 1:
+        # The graph does not depend on max_path_length, so the solver is kept
+        solver.max_path_length -= 1
+        estimate = solver.estimate_cost()
+    if solver.max_path_length < max_path:
+        logger.warning(
+            f"Lowered max_path from {max_path} to {solver.max_path_length}, "
+            f"estimated {estimate['seconds']:.2f}s"
+        )
+    return solver, estimate
+
+
+def serve_letterboxed(box_edges, max_path):
+    """
+    Admit a Letter Boxed solve by its estimated cost. Cached boards are
+    answered at once, cheap solves run inline in an admission slot, and
+    solves over ADMIT_INLINE_SECONDS or with max_path of at least
+    ASYNC_MIN_MAX_PATH are queued as jobs. Returns (solutions, job,
+    max_path) with one of solutions or job set and the max_path used.
+    Raises Overloaded or QueueFull when the solve cannot be admitted.
+    """
+    cached = solution_cache.get(canonical_letterboxed_key(box_edges, max_path))
+    if cached is not None:
+        return cached, None, max_path
+
+    solver, estimate = admitted_solver(box_edges, max_path)
+    max_path = solver.max_path_length
+    if max_path >= ASYNC_MIN_MAX_PATH or estimate["seconds"] > ADMIT_INLINE_SECONDS:
+        return None, queue_letterboxed(box_edges, max_path, solver=solver), max_path
+    with admission.slot(estimate["seconds"]):
+        return solve_letterboxed(box_edges, max_path, solver=solver), None, max_path
+
+
+def solve_batch_board(box_edges, max_path):
+    """Solve one /api/solve/batch board, returning its solutions and the max_path used"""
+    cached = solution_cache.get(canonical_letterboxed_key(box_edges, max_path))
+    if cached is not None:
+        return cached, max_path
+
+    solver, estimate = admitted_solver(box_edges, max_path)
+    with admission.slot(estimate["seconds"]):
+        return solve_letterboxed(box_edges, solver.max_path_length, solver=solver), solver.max_path_length
+
+
+def letterboxed_job_id(box_edges, max_path):
+    """
+    Job ID naming the canonical board, so an identical board shares its
+    job and any gunicorn worker can rebuild the job from its ID
+    """
+    edges = sorted("".join(sorted(edge)) for edge in box_edges)
+    return f"letterboxed-{'-'.join(edges)}-{max_path}"
+
+
+def parse_letterboxed_job_id(job_id):
+    """Return (box_edges, max_path) for a letterboxed job ID, or None"""
+    parts = job_id.split("-")
+    if len(parts) != 6 or parts[0] != "letterboxed" or not parts[5].isdigit():
+        return None
+    if not all(len(edge) == 3 and edge.isalpha() and edge.isupper() for edge in parts[1:5]):
+        return None
+    max_path = int(parts[5])
+    if not 1 <= max_path <= 10:
+        return None
+    return [list(edge) for edge in parts[1:5]], max_path
+
+
+def job_record_key(job_id):
+    return f"job:{job_id}"
+
+
+def queue_letterboxed(box_edges, max_path, solver=None):
+    """
+    Queue solve_letterboxed, sharing the job of an identical board. A job
+    record in the solve cache tells workers polled for a job they do not
+    hold that it is in progress, or why it failed.
+    """
+    job_id = letterboxed_job_id(box_edges, max_path)
+
+    def run(job):
+        try:
+            return solve_letterboxed(box_edges, max_path, progress=job.progress, solver=solver)
+        except Exception as e:
+            with job_record_lock:
+                solution_cache.set(
+                    job_record_key(job_id),
+                    {"status": FAILED, "error": str(e), "updated_at": time.time()},
+                )
+            raise
+
+    # Held until the record is written, so it never overwrites a failure
+    with job_record_lock:
+        job = job_queue.submit(
+            "letterboxed",
+            {"letters": "".join("".join(edge) for edge in box_edges), "max_path": max_path},
+            run,
+            job_id=job_id,
+        )
+        if not job.finished:
+            solution_cache.set(job_record_key(job_id), {"status": QUEUED, "updated_at": time.time()})
+    return job
+
+
+def queue_full_response():
+    logger.warning("Job queue full, rejecting Letter Boxed job")
+    return (
+        jsonify({"error": "Too many queued solves, try again shortly."}),
+        429,
+        {"Retry-After": str(JOB_POLL_SECONDS * 5)},
+    )
+
+
+def overloaded_response(e):
+    logger.warning(f"All solve slots busy, rejecting request: {e}")
+    return (
+        jsonify({"error": "The solver is busy, try again shortly.", "retry_after": e.retry_after}),
+        503,
+        {"Retry-After": str(e.retry_after)},
+    )
+
+
+def job_response(job):
+    """202 with a queued job and where to poll it"""
+    response = job_queue.describe(job)
+    response["status_url"] = url_for("api_job", job_id=job.id)
+    response["poll_after"] = JOB_POLL_SECONDS
+    return jsonify(response), 202, {"Location": response["status_url"]}
+
+
+def solve_spellbee(letters_input):
+    """
+    Solve a Spelling Bee puzzle and return its scored words with the puzzle
+    totals. Results are cached per canonical letter set.
+    """
+    cache_key = canonical_spellbee_key(letters_input)
+    cached = solution_cache.get(cache_key)
+    if cached is not None:
+        logger.info(f"SpellBee cache hit for {cache_key}")
+        return cached
+
+    start_time = time.time()
+    solver = SpellBeeSolver(word_index, list(letters_input))
+    scored_words = solver.solve()
+    solve_time = time.time() - start_time
+
+    # Log performance
+    logger.info(
+        f"SpellBee solve completed in {solve_time:.2f}s with {len(scored_words)} words"
+    )
+
+    result = {
+        "words": scored_words,
+        "total_points": solver.total_points,
+        "pangram_count": solver.pangram_count,
+    }
+    solution_cache.set(cache_key, result)
+    return result
+
+
 def handle_letterboxed(letters_input, max_path, is_random):
     """Handle Letter Boxed game with error handling"""
     if is_random:
         try:
-            from letterboxd_solver import generate_solvable_box_edges
-            box_edges, _ = generate_solvable_box_edges(word_list)
+            box_edges = random_solvable_box_edges()
             letters_input = "".join([letter for edge in box_edges for letter in edge])
         except Exception as e:
             logger.error(f"Failed to generate random letters: {e}")
@@ -159,39 +880,53 @@ def handle_letterboxed(letters_input, max_path, is_random):
     try:
         box_edges = [list(letters_input[i : i + 3]) for i in range(0, 12, 3)]
 
-        solver = GraphLetterBoxedSolver(word_list, box_edges, max_path_length=max_path)
-
         start_time = time.time()
-        raw_solutions = solver.solve_bfs()
+        sorted_solutions, job, max_path = serve_letterboxed(box_edges, max_path)
         solve_time = time.time() - start_time
 
-        logger.info(
-            f"Letterboxed solve completed in {solve_time:.2f}s with {len(raw_solutions)} solutions"
-        )
-
-        if solve_time > SOLVER_TIMEOUT:
-            logger.warning(
-                f"Solve operation took {solve_time:.2f}s, exceeding recommended timeout"
+        # Long solves run in the background; result.html polls the job
+        if job is not None:
+            job_url = url_for("api_job", job_id=job.id, limit=HTML_PAGE_SIZE)
+            return render_template(
+                "result.html",
+                game="Letter Boxed",
+                solutions=[],
+                job_url=job_url,
+                api_url=job_url,
+                poll_seconds=JOB_POLL_SECONDS,
             )
 
-        if not raw_solutions:
+        if not sorted_solutions:
             return render_template(
                 "index.html",
                 error=f"No solutions found. Try increasing the maximum path length beyond {max_path}.",
             )
 
-        sorted_solutions = sort_letterboxed_solutions(raw_solutions)
-        if len(sorted_solutions) > 1000:  # Arbitrary limit
-            logger.info(f"Trimming results from {len(sorted_solutions)} to 1000")
-            sorted_solutions = sorted_solutions[:1000]
-
+        # Later pages are fetched from the JSON API by result.html
+        cache_key = canonical_letterboxed_key(box_edges, max_path)
+        page, next_cursor = paginate(sorted_solutions, cache_key, None, HTML_PAGE_SIZE)
         return render_template(
             "result.html",
             game="Letter Boxed",
-            solutions=sorted_solutions,
+            solutions=page,
+            total=len(sorted_solutions),
+            next_cursor=next_cursor,
+            api_url=url_for("api_solve_letterboxed", letters=letters_input, max_path=max_path),
             solve_time=f"{solve_time:.2f}",
         )
 
+    except QueueFull:
+        logger.warning("Job queue full, rejecting Letter Boxed solve")
+        return render_template(
+            "index.html",
+            error="The solver is busy with long puzzles. Please try again shortly or reduce the maximum path length.",
+        ), 429, {"Retry-After": str(JOB_POLL_SECONDS * 5)}
+    except Overloaded as e:
+        logger.warning(f"All solve slots busy, rejecting request: {e}")
+        return render_template(
+            "index.html",
+            error=f"The solver is busy. Please try again in {e.retry_after} seconds.",
+        ), 503, {"Retry-After": str(e.retry_after)}
     except MemoryError:
         logger.error("Memory error during letterboxed solve")
         return render_template(
@@ -216,25 +951,27 @@ def handle_spellbee(letters_input):
 
     try:
         start_time = time.time()
-        solver = SpellBeeSolver(word_list, list(letters_input))
-        scored_words = solver.solve()
+        result = solve_spellbee(letters_input)
+        scored_words = result["words"]
         solve_time = time.time() - start_time
 
-        # Log performance
-        logger.info(
-            f"SpellBee solve completed in {solve_time:.2f}s with {len(scored_words)} words"
-        )
-
         if not scored_words:
             return render_template(
                 "index.html", error="No valid words found for these letters."
             )
 
+        cache_key = canonical_spellbee_key(letters_input)
+        page, next_cursor = paginate(list(scored_words.items()), cache_key, None, HTML_PAGE_SIZE)
         return render_template(
             "result.html",
             game="Spelling Bee",
-            solutions=scored_words,
+            solutions=dict(page),
+            total=len(scored_words),
+            next_cursor=next_cursor,
+            api_url=url_for("api_solve_spellbee", letters=letters_input),
             solve_time=f"{solve_time:.2f}",
+            total_points=result["total_points"],
+            pangram_count=result["pangram_count"],
         )
 
     except Exception as e:
@@ -245,9 +982,69 @@ def handle_spellbee(letters_input):
         )
 
 
+def parse_warmup_boards(value):
+    """Parse WARMUP_BOARDS into (letters, max_path) pairs, skipping invalid boards"""
+    boards = []
+    for item in value.split(","):
+        letters, _, max_path = item.strip().upper().partition(":")
+        if not letters:
+            continue
+        if len(letters) != 12 or not letters.isalpha():
+            logger.warning(f"Skipping invalid warm-up board: {item}")
+            continue
+        boards.append((letters, parse_max_path(max_path or DEFAULT_MAX_PATH)))
+    return boards
+
+
+def warmup(boards=None, spellbee_puzzles=None, freeze=True):
+    """
+    Solve popular puzzles into the solution cache, then freeze the heap.
+    wsgi.py calls this at import, which gunicorn's preload_app runs once in
+    the master: the word index, board index and warm cache built before
+    the fork are then shared copy-on-write by every worker. gc.freeze moves
+    them to the permanent generation, so worker collections never write to
+    their pages; reference counting still copies the pages a worker touches.
+    """
+    start_time = time.time()
+    if boards is None:
+        boards = parse_warmup_boards(WARMUP_BOARDS)
+    if spellbee_puzzles is None:
+        spellbee_puzzles = [letters.strip().upper() for letters in WARMUP_SPELLBEE.split(",")
+                            if len(letters.strip()) >= 7]
+
+    for letters, max_path in boards:
+        try:
+            box_edges = [list(letters[i : i + 3]) for i in range(0, 12, 3)]
+            # Serial, so a preloading master never starts the partition pool
+            solve_letterboxed(box_edges, max_path, parallel=False)
+        except Exception as e:
+            logger.warning(f"Warm-up solve failed for {letters}: {e}")
+    for letters in spellbee_puzzles:
+        try:
+            solve_spellbee(letters)
+        except Exception as e:
+            logger.warning(f"Warm-up solve failed for {letters}: {e}")
+
+    if freeze:
+        gc.collect()
+        gc.freeze()
+
+    warmup_state.update(
+        ready=True,
+        seconds=round(time.time() - start_time, 3),
+        boards=len(boards),
+        spellbee=len(spellbee_puzzles),
+    )
+    logger.info(
+        f"Warm-up finished in {warmup_state['seconds']}s with {len(boards)} boards "
+        f"and {len(spellbee_puzzles)} Spelling Bee puzzles"
+    )
+
+
 if __name__ == "__main__":
     if not os.path.exists(os.path.join(app.template_folder, "error.html")):
         logger.warning("error.html template missing, errors will not display properly")
 
+    warmup(freeze=False)
     app.run(debug=False, host="0.0.0.0", port=5001)
 
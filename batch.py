@@ -0,0 +1,152 @@
+"""Solve many Letter Boxed boards at once, writing JSON Lines as results arrive"""
+
+import json
+import logging
+import multiprocessing
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from letterboxd_solver import GraphLetterBoxedSolver, solution_sort_key
+
+DEFAULT_MAX_PATH = 3
+MAX_SOLUTIONS = 1000  # per board, best first
+
+# Word index inherited by forked batch workers
+_batch_index = None
+
+
+def parse_board(line, default_max_path=DEFAULT_MAX_PATH):
+    """
+    Parse a 'LETTERS' or 'LETTERS:max_path' line into (letters, max_path).
+    Returns None for blank and '#' comment lines; max_path is None when it
+    is not an integer, which solve_board reports as an error.
+    """
+    line = line.strip()
+    if not line or line.startswith("#"):
+        return None
+    letters, _, max_path = line.upper().partition(":")
+    if not max_path:
+        return letters.strip(), default_max_path
+    try:
+        return letters.strip(), int(max_path)
+    except ValueError:
+        return letters.strip(), None
+
+
+def solve_board(board, word_index=None, max_solutions=MAX_SOLUTIONS, solve=None):
+    """
+    Solve one board into a JSON-ready result, or an error entry for bad
+    input. solve(box_edges, max_path), when given, replaces the solver and
+    returns the sorted solutions with the max_path actually used; its
+    errors become error entries.
+    """
+    letters, max_path = board
+    if len(letters) != 12 or not letters.isalpha():
+        return {"letters": letters, "error": "Letter Boxed requires exactly 12 letters."}
+    if max_path is None or not 1 <= max_path <= 10:
+        return {"letters": letters, "error": "max_path must be an integer from 1 to 10."}
+
+    start_time = time.time()
+    box_edges = [list(letters[i: i + 3]) for i in range(0, 12, 3)]
+    if solve is not None:
+        try:
+            solutions, max_path = solve(box_edges, max_path)
+        except Exception as e:
+            logging.warning(f"Batch solve failed for {letters}: {e}")
+            return {"letters": letters, "max_path": max_path, "error": str(e)}
+        solutions = solutions[:max_solutions]
+    else:
+        solver = GraphLetterBoxedSolver(
+            word_index or _batch_index, box_edges, max_path_length=max_path,
+            use_bitmask=True, word_order="coverage",
+        )
+        solutions = sorted(solver.solve_auto(), key=solution_sort_key)[:max_solutions]
+    return {
+        "letters": letters,
+        "max_path": max_path,
+        "count": len(solutions),
+        "solutions": [list(chain) for chain in solutions],
+        "solve_time": round(time.time() - start_time, 3),
+    }
+
+
+def iter_batch(boards, word_index, workers=None, max_solutions=MAX_SOLUTIONS, solve=None):
+    """
+    Yield one result per board in input order, each as soon as it and
+    every board before it are solved. workers=1 or a solve function
+    solves in this process; otherwise boards fan out over a forked pool
+    that inherits word_index, with a bounded window of boards in flight so
+    input streams are read lazily.
+    """
+    global _batch_index
+
+    context = None
+    if workers != 1 and solve is None:
+        try:
+            context = multiprocessing.get_context("fork")
+        except ValueError:
+            logging.warning("fork start method unavailable, solving the batch serially")
+
+    if context is None:
+        for board in boards:
+            yield solve_board(board, word_index, max_solutions, solve)
+        return
+
+    window = 4 * (workers or os.cpu_count() or 1)
+    pending = deque()
+    _batch_index = word_index
+    try:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+            for board in boards:
+                pending.append(executor.submit(solve_board, board, None, max_solutions))
+                if len(pending) >= window:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+        _batch_index = None
+
+
+def batch_summary(boards, errors, start_time):
+    """Totals and throughput of a batch run"""
+    seconds = time.time() - start_time
+    return {
+        "done": True,
+        "boards": boards,
+        "errors": errors,
+        "seconds": round(seconds, 3),
+        "boards_per_second": round(boards / seconds, 2) if seconds else None,
+    }
+
+
+def iter_batch_lines(boards, word_index, workers=None, max_solutions=MAX_SOLUTIONS, solve=None):
+    """JSON Lines for every board result, then a summary line with the throughput"""
+    start_time = time.time()
+    count = errors = 0
+    for result in iter_batch(boards, word_index, workers, max_solutions, solve):
+        count += 1
+        errors += "error" in result
+        yield json.dumps(result) + "\n"
+    yield json.dumps(batch_summary(count, errors, start_time)) + "\n"
+
+
+def run_batch(lines, out, word_index, workers=None, max_solutions=MAX_SOLUTIONS,
+              default_max_path=DEFAULT_MAX_PATH):
+    """
+    Solve the boards in lines (a file or any iterable of strings), writing
+    each result to out as soon as it is ready. Returns the summary.
+    """
+    boards = (
+        board for board in (parse_board(line, default_max_path) for line in lines)
+        if board is not None
+    )
+    summary = None
+    for line in iter_batch_lines(boards, word_index, workers, max_solutions):
+        out.write(line)
+        out.flush()
+        summary = line
+    return json.loads(summary)
@@ -0,0 +1,267 @@
+"""Benchmark the LetterBoxd solver on the 2of12 word list"""
+
+import argparse
+import contextlib
+import io
+import json
+import logging
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from compiled_dictionary import compile_word_list, load_word_index
+from letterboxd_solver import (
+    GraphLetterBoxedSolver,
+    SpellBeeSolver,
+    build_word_index,
+    generate_solvable_box_edges,
+    generate_solvable_spellbee_letters,
+    read_word_list,
+)
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+WORD_LIST_PATH = os.path.join(BASE_DIR, "word_lists", "2of12.txt")
+BASELINE_PATH = os.path.join(BASE_DIR, "benchmark_baseline.json")
+
+BOARDS = ["TIAUWLDBYRMO", "ORACTLJSXNIU", "GIYHUOTWNRAL", "EKOLCRVAIMNS"]
+SPELLBEE_PUZZLES = ["MAWRING", "TLACEIR", "ONIDGRW"]
+SUITE_MAX_PATHS = (2, 3, 4, 5)
+
+# A timing regresses when it is this much slower than the baseline and the
+# slowdown is above the noise floor
+REGRESSION_TOLERANCE = 0.25
+NOISE_FLOOR = 0.005  # seconds
+
+
+def board_to_edges(letters):
+    """Split a 12 letter board string into its 4 edges"""
+    return [list(letters[i: i + 3]) for i in range(0, 12, 3)]
+
+
+def measure(func):
+    """Return (result, wall seconds, peak traced bytes) for a zero-arg callable"""
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+
+    # Trace allocations on a second run so tracing overhead stays out of the timing
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def bench_bitmask(word_list, boards=BOARDS, max_paths=(3, 4, 5)):
+    """Compare solve_bfs with set-based and bitmask letter coverage"""
+    rows = []
+    for letters in boards:
+        for max_path in max_paths:
+            row = {"board": letters, "max_path": max_path}
+            for label, use_bitmask in (("set", False), ("bitmask", True)):
+                solver = GraphLetterBoxedSolver(
+                    word_list, board_to_edges(letters),
+                    max_path_length=max_path, use_bitmask=use_bitmask,
+                    word_order="coverage")
+                solutions, elapsed, peak = measure(solver.solve_bfs)
+                row[label] = {"seconds": elapsed, "peak_bytes": peak, "solutions": len(solutions)}
+            rows.append(row)
+    return rows
+
+
+def print_bitmask_report(rows):
+    print(f"{'board':<14}{'path':>5}{'set s':>9}{'mask s':>9}{'set MiB':>10}{'mask MiB':>10}")
+    for row in rows:
+        before, after = row["set"], row["bitmask"]
+        print(
+            f"{row['board']:<14}{row['max_path']:>5}"
+            f"{before['seconds']:>9.3f}{after['seconds']:>9.3f}"
+            f"{before['peak_bytes'] / 2**20:>10.1f}{after['peak_bytes'] / 2**20:>10.1f}"
+        )
+
+
+def best_of(func, repeat):
+    """Return (result, fastest wall seconds) over repeat calls"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return result, best
+
+
+def run_suite(boards=BOARDS, max_paths=SUITE_MAX_PATHS, spellbee_puzzles=SPELLBEE_PUZZLES,
+              repeat=3, word_list_path=WORD_LIST_PATH, handlers=True):
+    """
+    Time every stage from word-list load to web handler over a fixed
+    corpus. Returns {name: {"seconds": ..., "solutions": ...}}, where
+    seconds is the fastest of repeat runs.
+    """
+    results = {}
+
+    def record(name, func, count=len):
+        result, seconds = best_of(func, repeat)
+        results[name] = {"seconds": round(seconds, 6)}
+        if count is not None:
+            results[name]["solutions"] = count(result)
+        return result
+
+    word_list = record("load_word_list", lambda: read_word_list(word_list_path), count=None)
+    word_index = record("build_word_index", lambda: build_word_index(word_list), count=None)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        dictionary_path = os.path.join(temp_dir, "words.dict")
+        compile_word_list(word_list, dictionary_path)
+        record("load_compiled_index", lambda: load_word_index(dictionary_path), count=None)
+
+    for letters in boards:
+        for max_path in max_paths:
+            solver = GraphLetterBoxedSolver(
+                word_index, board_to_edges(letters), max_path_length=max_path,
+                use_bitmask=True, word_order="coverage")
+            suffix = f"{letters}/{max_path}"
+            if max_path == max_paths[0]:
+                record(f"build_graph/{letters}",
+                       lambda: solver._build_graph(solver.valid_words), count=None)
+            record(f"solve/{suffix}", solver.solve)
+            record(f"solve_bfs/{suffix}", solver.solve_bfs)
+            record(f"solve_best_first/{suffix}", solver.solve_best_first)
+
+    # SpellBeeSolver.solve prints its pangrams
+    with contextlib.redirect_stdout(io.StringIO()):
+        for letters in spellbee_puzzles:
+            record(f"spellbee/{letters}", lambda: SpellBeeSolver(word_index, list(letters)).solve())
+
+    # Reseed before every run so each repeat generates the same boards
+    def seeded(func):
+        random.seed(0)
+        return func(word_index)
+
+    record("random_letterboxed", lambda: seeded(generate_solvable_box_edges), count=None)
+    record("random_spellbee", lambda: seeded(generate_solvable_spellbee_letters), count=None)
+
+    if handlers:
+        results.update(run_handler_suite(boards, repeat))
+    return results
+
+
+def run_handler_suite(boards, repeat):
+    """Time the Flask handlers through the test client; streams are never cached"""
+    from app import app
+
+    results = {}
+    client = app.test_client()
+    for letters in boards:
+        url = f"/api/stream/letterboxed?letters={letters}&max_path=3&limit=20&order=best"
+        _, seconds = best_of(lambda: client.get(url).get_data(), repeat)
+        results[f"handler/stream_best/{letters}"] = {"seconds": round(seconds, 6)}
+    for name in ("random_letterboxed", "random_spellbee"):
+        _, seconds = best_of(lambda: client.get(f"/api/{name}").get_data(), repeat)
+        results[f"handler/{name}"] = {"seconds": round(seconds, 6)}
+    return results
+
+
+def compare_to_baseline(results, baseline, tolerance=REGRESSION_TOLERANCE, noise_floor=NOISE_FLOOR):
+    """
+    Return (name, baseline seconds, current seconds) for every timing that
+    regressed, plus every benchmark whose solution count changed, which
+    points at a behaviour change rather than a slowdown.
+    """
+    regressions = []
+    for name, current in results.items():
+        before = baseline.get(name)
+        if before is None:
+            continue
+        slower = current["seconds"] - before["seconds"]
+        if slower > noise_floor and current["seconds"] > before["seconds"] * (1 + tolerance):
+            regressions.append((name, before["seconds"], current["seconds"]))
+        elif current.get("solutions") != before.get("solutions"):
+            regressions.append((name, before["seconds"], current["seconds"]))
+    return regressions
+
+
+def suite_report(results, repeat):
+    """JSON document for a suite run, with enough context to compare runs"""
+    return {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "repeat": repeat,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "results": results,
+    }
+
+
+def print_suite_report(results, baseline=None):
+    print(f"{'benchmark':<40}{'seconds':>10}{'baseline':>10}{'solutions':>11}")
+    for name, current in results.items():
+        before = (baseline or {}).get(name)
+        before_seconds = f"{before['seconds']:>10.4f}" if before else f"{'-':>10}"
+        print(f"{name:<40}{current['seconds']:>10.4f}{before_seconds}"
+              f"{current.get('solutions', ''):>11}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the LetterBoxd solver.")
+    parser.add_argument("--boards", nargs="+", default=BOARDS, help="12 letter boards to solve.")
+    parser.add_argument("--max-path", type=int, nargs="+", default=None,
+                        help="max_path_length values to benchmark "
+                             "(default: 3 4 5, or 2 3 4 5 with --suite).")
+    parser.add_argument("--suite", action="store_true",
+                        help="Run the full suite and compare it with the stored baseline.")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="Runs per suite benchmark; the fastest counts (default: 3).")
+    parser.add_argument("--json", help="Write suite results to this file.")
+    parser.add_argument("--baseline", default=BASELINE_PATH,
+                        help="Baseline results to compare with (default: benchmark_baseline.json).")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="Store this run as the new baseline instead of comparing.")
+    parser.add_argument("--tolerance", type=float, default=REGRESSION_TOLERANCE,
+                        help="Allowed slowdown before a timing counts as a regression (default: 0.25).")
+    parser.add_argument("--no-handlers", action="store_true", help="Skip the web handler benchmarks.")
+    args = parser.parse_args(argv)
+
+    if not args.suite:
+        word_list = read_word_list(WORD_LIST_PATH)
+        print_bitmask_report(bench_bitmask(word_list, args.boards, args.max_path or [3, 4, 5]))
+        return 0
+
+    # Solver progress logs would drown the report
+    logging.disable(logging.WARNING)
+    results = run_suite(args.boards, tuple(args.max_path or SUITE_MAX_PATHS),
+                        repeat=args.repeat, handlers=not args.no_handlers)
+    report = suite_report(results, args.repeat)
+    if args.json:
+        with open(args.json, "w", encoding="UTF-8") as f:
+            json.dump(report, f, indent=2)
+
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="UTF-8") as f:
+            json.dump(report, f, indent=2)
+        print_suite_report(results)
+        print(f"Saved baseline to {args.baseline}")
+        return 0
+
+    baseline = None
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="UTF-8") as f:
+            baseline = json.load(f)["results"]
+    print_suite_report(results, baseline)
+    if baseline is None:
+        print(f"No baseline at {args.baseline}, run with --save-baseline to create one")
+        return 0
+
+    regressions = compare_to_baseline(results, baseline, tolerance=args.tolerance)
+    for name, before, after in regressions:
+        message = f"REGRESSION {name}: {before:.4f}s -> {after:.4f}s"
+        if baseline[name].get("solutions") != results[name].get("solutions"):
+            message += f", solutions {baseline[name].get('solutions')} -> {results[name].get('solutions')}"
+        print(message)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,190 @@
+"""Precomputed index of solvable LetterBoxd boards for instant random puzzles"""
+
+import argparse
+import logging
+import os
+import random
+from collections import defaultdict
+
+from letterboxd_solver import (
+    GraphLetterBoxedSolver,
+    build_word_index,
+    letter_mask,
+    read_word_list,
+)
+
+VOWELS = set("AEIOU")
+DIFFICULTIES = ("easy", "medium", "hard")
+
+# Boards with at least this many two-word solutions are easy / medium
+EASY_PAIRS = 20
+MEDIUM_PAIRS = 5
+
+
+def difficulty_for(pair_count):
+    """Difficulty label from the number of two-word solutions on a board"""
+    if pair_count >= EASY_PAIRS:
+        return "easy"
+    if pair_count >= MEDIUM_PAIRS:
+        return "medium"
+    return "hard"
+
+
+def _assign_edges(letters, adjacent_pairs, rng):
+    """
+    Split 12 letters into 4 edges of 3 so that no adjacent pair shares an
+    edge. Returns the edges, or None when no split exists.
+    """
+    neighbours = defaultdict(set)
+    for first, second in adjacent_pairs:
+        neighbours[first].add(second)
+        neighbours[second].add(first)
+
+    order = sorted(letters, key=lambda letter: (-len(neighbours[letter]), rng.random()))
+    edges = [[] for _ in range(4)]
+
+    def place(i):
+        if i == len(order):
+            return True
+        letter = order[i]
+        for edge in rng.sample(edges, len(edges)):
+            if len(edge) < 3 and not neighbours[letter] & set(edge):
+                edge.append(letter)
+                if place(i + 1):
+                    return True
+                edge.pop()
+        return False
+
+    return edges if place(0) else None
+
+
+def generate_pair_board(words_by_start, candidates, rng, max_attempts=1000):
+    """
+    Build a board from a random word pair that uses exactly 12 distinct
+    letters, so the board is solvable in two words by construction.
+    """
+    for _ in range(max_attempts):
+        first = rng.choice(candidates)
+        first_mask = letter_mask(first)
+        partners = [
+            word for word in words_by_start[first[-1]]
+            if bin(first_mask | letter_mask(word)).count("1") == 12
+            and word != first
+        ]
+        if not partners:
+            continue
+        second = rng.choice(partners)
+        pairs = set(zip(first, first[1:])) | set(zip(second, second[1:]))
+        edges = _assign_edges(set(first + second), pairs, rng)
+        if edges is None:
+            continue
+        for edge in edges:
+            rng.shuffle(edge)
+        rng.shuffle(edges)
+        return edges
+    return None
+
+
+def build_board_index(word_index, count=5000, seed=0):
+    """
+    Generate up to count distinct solvable boards. Returns (letters, vowels,
+    pair_count) rows, where pair_count is the number of two-word solutions.
+    """
+    rng = random.Random(seed)
+    playable = [
+        word for word in word_index.words
+        if len(word) >= 3 and word.isalpha()
+        and all(a != b for a, b in zip(word, word[1:]))
+    ]
+    words_by_start = defaultdict(list)
+    for word in playable:
+        words_by_start[word[0]].append(word)
+    candidates = [word for word in playable if 5 <= len(set(word)) <= 9]
+
+    rows = []
+    seen = set()
+    # Small word lists run out of distinct boards, so bound the attempts
+    for _ in range(count * 20):
+        if len(rows) == count:
+            break
+        edges = generate_pair_board(words_by_start, candidates, rng)
+        if edges is None:
+            break
+        canonical = tuple(sorted("".join(sorted(edge)) for edge in edges))
+        if canonical in seen:
+            continue
+        seen.add(canonical)
+
+        solver = GraphLetterBoxedSolver(word_index, edges, max_path_length=2, use_bitmask=True)
+        pair_count = len(solver.solve_pairs())
+        letters = "".join(letter for edge in edges for letter in edge)
+        vowels = sum(letter in VOWELS for letter in letters)
+        rows.append((letters, vowels, pair_count))
+        if len(rows) % 500 == 0:
+            logging.info(f"Built {len(rows)}/{count} boards")
+    return rows
+
+
+def write_board_index(rows, filename):
+    """Write one 'LETTERS VOWELS PAIRS' line per board"""
+    with open(filename, "w", encoding="UTF-8") as f:
+        for letters, vowels, pair_count in rows:
+            f.write(f"{letters} {vowels} {pair_count}\n")
+
+
+class BoardIndex:
+    """
+    Solvable boards loaded from a board index file and bucketed by vowel
+    count and difficulty, so sampling a board is a single random.choice.
+    """
+
+    def __init__(self, rows):
+        self.buckets = defaultdict(list)
+        for letters, vowels, pair_count in rows:
+            difficulty = difficulty_for(pair_count)
+            for vowel_key in (vowels, None):
+                for difficulty_key in (difficulty, None):
+                    self.buckets[(vowel_key, difficulty_key)].append(letters)
+
+    @classmethod
+    def load(cls, filename):
+        rows = []
+        with open(filename, encoding="UTF-8") as f:
+            for line in f:
+                letters, vowels, pair_count = line.split()
+                rows.append((letters, int(vowels), int(pair_count)))
+        return cls(rows)
+
+    def __len__(self):
+        return len(self.buckets[(None, None)])
+
+    def sample(self, vowels=None, difficulty=None, rng=random):
+        """
+        Return the edges of a random solvable board, or None when no board
+        matches the requested vowel count and difficulty.
+        """
+        boards = self.buckets.get((vowels, difficulty))
+        if not boards:
+            return None
+        letters = rng.choice(boards)
+        return [list(letters[i: i + 3]) for i in range(0, 12, 3)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the solvable board index.")
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    parser.add_argument("--word-list", default=os.path.join(base_dir, "word_lists", "2of12.txt"))
+    parser.add_argument("--output", default=os.path.join(base_dir, "word_lists", "boards.txt"))
+    parser.add_argument("--count", type=int, default=5000, help="Number of boards (default: 5000).")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed (default: 0).")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    word_index = build_word_index(read_word_list(args.word_list))
+    rows = build_board_index(word_index, count=args.count, seed=args.seed)
+    write_board_index(rows, args.output)
+    print(f"Wrote {len(rows)} boards to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
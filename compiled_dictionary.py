@@ -0,0 +1,174 @@
+"""Compiled binary word lists, memory-mapped so processes share their pages"""
+
+import argparse
+import mmap
+import os
+import struct
+
+import letterboxd_solver
+from letterboxd_solver import (
+    BIGRAM_CHUNKS,
+    NumpyWordIndex,
+    WordIndex,
+    bigram_mask,
+    clean_word,
+    letter_mask,
+    read_word_list,
+)
+
+# Layout, little-endian, every section starting on an 8-byte boundary:
+#   header        magic, word count, packed word bytes
+#   offsets       uint32 * (count + 1), start of each word in the packed words
+#   masks         uint32 * count, letter_mask of each word
+#   bigrams       uint64 * count * BIGRAM_CHUNKS, bigram_mask of each word
+#   first, last   uint8 * count each, first and last byte of each word (0 if empty)
+#   words         cleaned words, each followed by a newline
+MAGIC = b"LBXDICT1"
+HEADER = struct.Struct("<8sII")
+BIGRAM_BYTES = 8 * BIGRAM_CHUNKS
+
+
+def _align(offset):
+    return (offset + 7) & ~7
+
+
+def _layout(count, packed_size):
+    """Byte offset of every section, and the total file size"""
+    sections = {}
+    offset = HEADER.size
+    for name, size in (
+        ("offsets", 4 * (count + 1)),
+        ("masks", 4 * count),
+        ("bigrams", BIGRAM_BYTES * count),
+        ("first", count),
+        ("last", count),
+        ("words", packed_size),
+    ):
+        offset = _align(offset)
+        sections[name] = offset
+        offset += size
+    return sections, offset
+
+
+def compile_word_list(list_of_words, filename):
+    """
+    Write the compiled dictionary for a word list. The file is written
+    beside filename and renamed into place, so a running app never maps a
+    half-written dictionary.
+    """
+    words = [clean_word(word) for word in list_of_words]
+    encoded = [word.encode("UTF-8") for word in words]
+    packed = b"".join(word + b"\n" for word in encoded)
+    count = len(words)
+
+    offsets = [0]
+    for word in encoded:
+        offsets.append(offsets[-1] + len(word) + 1)
+
+    sections, size = _layout(count, len(packed))
+    buffer = bytearray(size)
+    HEADER.pack_into(buffer, 0, MAGIC, count, len(packed))
+    struct.pack_into(f"<{count + 1}I", buffer, sections["offsets"], *offsets)
+    struct.pack_into(f"<{count}I", buffer, sections["masks"], *(letter_mask(word) for word in words))
+    for i, word in enumerate(words):
+        start = sections["bigrams"] + i * BIGRAM_BYTES
+        buffer[start: start + BIGRAM_BYTES] = bigram_mask(word).to_bytes(BIGRAM_BYTES, "little")
+    buffer[sections["first"]: sections["first"] + count] = bytes(word[0] if word else 0 for word in encoded)
+    buffer[sections["last"]: sections["last"] + count] = bytes(word[-1] if word else 0 for word in encoded)
+    buffer[sections["words"]: sections["words"] + len(packed)] = packed
+
+    temp_filename = f"{filename}.tmp"
+    with open(temp_filename, "wb") as f:
+        f.write(buffer)
+    os.replace(temp_filename, filename)
+
+
+class CompiledDictionary:
+    """
+    Read-only view of a compiled dictionary file through mmap. Offsets,
+    masks and the first/last letter tables are memoryviews over the
+    mapping, so nothing is parsed until it is used.
+    """
+
+    def __init__(self, filename):
+        with open(filename, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, self.count, self.packed_size = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{filename} is not a compiled dictionary")
+        self.sections, size = _layout(self.count, self.packed_size)
+        if len(self._mmap) != size:
+            raise ValueError(f"{filename} is truncated or corrupt")
+
+        view = memoryview(self._mmap)
+        self.offsets = self._section(view, "offsets", 4 * (self.count + 1)).cast("I")
+        self.masks = self._section(view, "masks", 4 * self.count).cast("I")
+        self.first_letters = self._section(view, "first", self.count)
+        self.last_letters = self._section(view, "last", self.count)
+        self._bigrams = self._section(view, "bigrams", BIGRAM_BYTES * self.count)
+
+    def _section(self, view, name, size):
+        start = self.sections[name]
+        return view[start: start + size]
+
+    def __len__(self):
+        return self.count
+
+    def word(self, word_id):
+        start = self.sections["words"] + self.offsets[word_id]
+        end = self.sections["words"] + self.offsets[word_id + 1] - 1
+        return self._mmap[start:end].decode("UTF-8")
+
+    def words(self):
+        """Every word, decoded in one pass"""
+        start = self.sections["words"]
+        packed = self._mmap[start: start + self.packed_size].decode("UTF-8")
+        return packed.split("\n")[:-1]
+
+    def bigram_masks(self):
+        return [
+            int.from_bytes(self._bigrams[i: i + BIGRAM_BYTES], "little")
+            for i in range(0, len(self._bigrams), BIGRAM_BYTES)
+        ]
+
+    def mask_array(self):
+        """Letter masks as a read-only NumPy view of the mapping"""
+        return letterboxd_solver.np.frombuffer(
+            self._mmap, dtype="<u4", count=self.count, offset=self.sections["masks"])
+
+    def bigram_array(self):
+        """Bigram masks as a read-only (count, BIGRAM_CHUNKS) NumPy view of the mapping"""
+        return letterboxd_solver.np.frombuffer(
+            self._mmap, dtype="<u8", count=self.count * BIGRAM_CHUNKS,
+            offset=self.sections["bigrams"],
+        ).reshape(self.count, BIGRAM_CHUNKS)
+
+
+def load_word_index(filename, use_numpy=None):
+    """
+    Build the shared word index from a compiled dictionary, picking the
+    backend like build_word_index.
+    """
+    dictionary = CompiledDictionary(filename)
+    if use_numpy is None:
+        use_numpy = letterboxd_solver.np is not None
+    if use_numpy:
+        return NumpyWordIndex.from_dictionary(dictionary)
+    return WordIndex.from_dictionary(dictionary)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile a word list for memory-mapped loading.")
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    parser.add_argument("--word-list", default=os.path.join(base_dir, "word_lists", "2of12.txt"))
+    parser.add_argument("--output", default=os.path.join(base_dir, "word_lists", "2of12.dict"))
+    args = parser.parse_args()
+
+    word_list = read_word_list(args.word_list)
+    compile_word_list(word_list, args.output)
+    print(f"Compiled {len(word_list)} words to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
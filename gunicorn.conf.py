@@ -0,0 +1,16 @@
+"""Gunicorn settings for the container: warm the app once in the master, then fork"""
+
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '5000')}"
+workers = int(os.environ.get("GUNICORN_WORKERS", "4"))
+threads = 2
+timeout = 120
+loglevel = "info"
+accesslog = "/app/logs/access.log"
+errorlog = "/app/logs/error.log"
+capture_output = True
+
+# Import wsgi.py, which runs warmup(), in the master so every worker starts
+# warm and shares the word index and cache pages copy-on-write
+preload_app = True
@@ -0,0 +1,190 @@
+"""Bounded background queue for long solves, polled by job ID"""
+
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+
+class QueueFull(Exception):
+    """Raised by JobQueue.submit when max_queued jobs are already waiting"""
+
+
+class Job:
+    """
+    One submitted solve. func(job) runs on a queue worker and may update
+    job.progress while it runs; its return value becomes job.result.
+    """
+
+    def __init__(self, kind, params, func, created_at, job_id=None):
+        self.id = job_id or uuid.uuid4().hex
+        self.kind = kind
+        self.params = params
+        self.func = func
+        self.status = QUEUED
+        self.progress = {}
+        self.result = None
+        self.error = None
+        self.created_at = created_at
+        self.started_at = None
+        self.finished_at = None
+
+    @property
+    def finished(self):
+        return self.status in (DONE, FAILED)
+
+
+def _snapshot(progress):
+    """Copy of a progress dict, one level deep, safe to serialize while the job runs"""
+    return {
+        name: dict(value) if isinstance(value, dict) else value
+        for name, value in list(progress.items())
+    }
+
+
+class JobQueue:
+    """
+    In-process job queue served by a fixed number of worker threads, so a
+    few long solves wait here instead of holding request threads. At most
+    max_queued jobs wait at once; finished jobs are kept for retention
+    seconds, and only the max_retained most recent ones.
+
+    Worker threads start on the first submit, so a gunicorn master that
+    preloads the app forks without any running.
+    """
+
+    def __init__(self, workers=2, max_queued=32, retention=3600, max_retained=256,
+                 clock=time.monotonic):
+        self.workers = workers
+        self.max_queued = max_queued
+        self.retention = retention
+        self.max_retained = max_retained
+        self.clock = clock
+        self._jobs = {}
+        self._pending = deque()
+        self._finished = OrderedDict()  # job id -> job, oldest first
+        self._threads = []
+        self._running = 0
+        self._cond = threading.Condition()
+        self.submitted = 0
+        self.rejected = 0
+        self.failed = 0
+
+    def submit(self, kind, params, func, job_id=None):
+        """
+        Queue func(job) and return the job. Jobs get a random ID unless
+        job_id is given, in which case a queued, running or retained job
+        with that ID is returned instead of queueing a duplicate. Raises
+        QueueFull when the queue is at max_queued.
+        """
+        with self._cond:
+            self._evict()
+            if job_id is not None and job_id in self._jobs:
+                return self._jobs[job_id]
+            if len(self._pending) >= self.max_queued:
+                self.rejected += 1
+                raise QueueFull(f"{len(self._pending)} jobs already queued")
+
+            job = Job(kind, params, func, self.clock(), job_id=job_id)
+            self._jobs[job.id] = job
+            self._pending.append(job)
+            self.submitted += 1
+            self._start_workers()
+            self._cond.notify()
+        logging.info(f"Queued {kind} job {job.id}")
+        return job
+
+    def get(self, job_id):
+        """Return the job with this ID, or None once it is unknown or evicted"""
+        with self._cond:
+            self._evict()
+            return self._jobs.get(job_id)
+
+    def describe(self, job):
+        """JSON-ready status of a job, without its result"""
+        with self._cond:
+            now = self.clock()
+            info = {
+                "job_id": job.id,
+                "kind": job.kind,
+                "params": job.params,
+                "status": job.status,
+                "progress": _snapshot(job.progress),
+                "wait_seconds": round((job.started_at or now) - job.created_at, 3),
+                "run_seconds": None,
+            }
+            if job.status == QUEUED:
+                info["position"] = self._pending.index(job) + 1
+            if job.started_at is not None:
+                info["run_seconds"] = round((job.finished_at or now) - job.started_at, 3)
+            if job.error is not None:
+                info["error"] = job.error
+            return info
+
+    def stats(self):
+        """Queue occupancy and counters"""
+        with self._cond:
+            return {
+                "queued": len(self._pending),
+                "running": self._running,
+                "retained": len(self._finished),
+                "submitted": self.submitted,
+                "rejected": self.rejected,
+                "failed": self.failed,
+                "workers": self.workers,
+                "max_queued": self.max_queued,
+            }
+
+    def _start_workers(self):
+        self._threads = [thread for thread in self._threads if thread.is_alive()]
+        while len(self._threads) < self.workers:
+            thread = threading.Thread(target=self._work, name="job-worker", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def _work(self):
+        while True:
+            with self._cond:
+                while not self._pending:
+                    self._cond.wait()
+                job = self._pending.popleft()
+                job.status = RUNNING
+                job.started_at = self.clock()
+                self._running += 1
+
+            try:
+                result, error = job.func(job), None
+            except Exception as e:
+                logging.exception(f"{job.kind} job {job.id} failed")
+                result, error = None, str(e)
+
+            with self._cond:
+                job.result = result
+                job.error = error
+                job.status = DONE if error is None else FAILED
+                job.finished_at = self.clock()
+                job.func = None
+                self._running -= 1
+                if error is not None:
+                    self.failed += 1
+                self._finished[job.id] = job
+                self._evict()
+            logging.info(
+                f"{job.kind} job {job.id} {job.status} in {job.finished_at - job.started_at:.2f}s"
+            )
+
+    def _evict(self):
+        """Drop finished jobs past retention or beyond max_retained; caller holds the lock"""
+        expired_before = self.clock() - self.retention
+        while self._finished:
+            job = next(iter(self._finished.values()))
+            if len(self._finished) <= self.max_retained and job.finished_at > expired_before:
+                break
+            del self._finished[job.id]
+            del self._jobs[job.id]
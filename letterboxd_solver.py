@@ -1,14 +1,25 @@
 """A Class to Solve the NYTimes LetterBoxd and SpellBee Puzzles"""  # %%
 
+import heapq
+import multiprocessing
 import random
 import string
-from collections import defaultdict, deque
+from collections import OrderedDict, defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from functools import partial
+from itertools import product, repeat
 import time
 
 import logging
 import matplotlib.pyplot as plt
 import networkx as nx
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, WordIndex is the pure-Python fallback
+    np = None
+
 
 def read_word_list(filename):
     """Read the word list"""
@@ -43,8 +54,12 @@ def is_valid_word(word, box_edges):
 def filter_valid_words(list_of_words, box_edges):
     """
     Filters the word list to include only valid words that can be formed
-    according to the Letter Boxed rules.
+    according to the Letter Boxed rules. A WordIndex is answered with
+    mask lookups instead of a pass over every word.
     """
+    if isinstance(list_of_words, WordIndex):
+        return list_of_words.board_words(box_edges)
+
     available_letters = {letter for edge in box_edges for letter in edge}
     letter_to_edge = {}
     for i, edge in enumerate(box_edges):
@@ -68,12 +83,378 @@ def filter_valid_words(list_of_words, box_edges):
     return valid
 
 
+def clean_word(word):
+    """Strip the separators of compound words so they can be played"""
+    return word.replace("-", "").replace(" ", "").replace("'", "")
+
+
+# Bit 26 marks any character outside A-Z so such words never pass a mask test
+OTHER_LETTER_BIT = 1 << 26
+
+
+def letter_mask(word):
+    """26-bit mask of the letters used by a word, one bit per letter A-Z"""
+    mask = 0
+    for letter in word:
+        if "A" <= letter <= "Z":
+            mask |= 1 << (ord(letter) - 65)
+        else:
+            mask |= OTHER_LETTER_BIT
+    return mask
+
+
+def bigram_mask(word):
+    """Mask of the adjacent letter pairs in a word, bit 26 * first + second"""
+    mask = 0
+    for first, second in zip(word, word[1:]):
+        if "A" <= first <= "Z" and "A" <= second <= "Z":
+            mask |= 1 << ((ord(first) - 65) * 26 + ord(second) - 65)
+    return mask
+
+
+def submasks(mask):
+    """Yield every submask of mask, including mask itself and 0"""
+    submask = mask
+    while True:
+        yield submask
+        if submask == 0:
+            return
+        submask = (submask - 1) & mask
+
+
+def board_masks(box_edges):
+    """
+    Return the letter mask of the board and the mask of every letter pair
+    that shares an edge, which no valid word may contain.
+    """
+    letter_to_edge = {}
+    for i, edge in enumerate(box_edges):
+        for letter in edge:
+            letter_to_edge[letter] = i
+
+    board_mask = letter_mask("".join(letter_to_edge))
+    same_edge_mask = 0
+    for first, first_edge in letter_to_edge.items():
+        for second, second_edge in letter_to_edge.items():
+            if first_edge == second_edge:
+                same_edge_mask |= bigram_mask(first + second)
+    return board_mask, same_edge_mask
+
+
+def spellbee_score(length, is_pangram):
+    """Spell Bee points for a word of the given length"""
+    if length < 4:
+        return 0
+    if length == 4:
+        return 1
+    return length + 7 * is_pangram
+
+
+def solution_sort_key(chain):
+    """
+    Best-first order of Letter Boxed chains: fewest words, then most
+    distinct letters, then alphabetical
+    """
+    return (len(chain), -len(set("".join(chain))), tuple(chain))
+
+
+# Past 8 letters a puzzle has more submasks to look up (2^(n-1) with the
+# center letter fixed) than a pass over every word's mask costs
+SPELLBEE_SUBMASK_LETTERS = 8
+
+
+class WordIndex:
+    """
+    Preprocessed word list shared by every solver. Built once per process,
+    it holds the cleaned words, their letter masks, their adjacent letter
+    pairs and the words grouped by letter mask, so filtering a board is a
+    mask query instead of a pass over every string.
+    """
+
+    def __init__(self, list_of_words):
+        self.words = [clean_word(word) for word in list_of_words]
+        self.masks = [letter_mask(word) for word in self.words]
+        self.bigram_masks = [bigram_mask(word) for word in self.words]
+        self._build_indexes()
+
+    @classmethod
+    def from_dictionary(cls, dictionary):
+        """
+        Index a CompiledDictionary, taking its cleaned words and stored
+        masks instead of recomputing them.
+        """
+        index = cls.__new__(cls)
+        index.words = dictionary.words()
+        index.masks = dictionary.masks.tolist()
+        index.bigram_masks = dictionary.bigram_masks()
+        index._build_indexes()
+        return index
+
+    def _build_indexes(self):
+        # Words grouped by letter mask: a board only has to look up the
+        # submasks of its own alphabet, rejecting every other group unseen
+        self.words_by_mask = defaultdict(list)
+        for word_id, mask in enumerate(self.masks):
+            if mask:
+                self.words_by_mask[mask].append(word_id)
+
+        # Letter sets of the words using exactly 7 distinct letters: every
+        # Spell Bee puzzle with a pangram is one of these masks
+        self.pangram_masks = sorted(
+            mask for mask in self.words_by_mask
+            if not mask & OTHER_LETTER_BIT and bin(mask).count("1") == 7
+        )
+        self.pangram_mask_set = set(self.pangram_masks)
+        self._words_within = {}
+
+    def __len__(self):
+        return len(self.words)
+
+    def board_words(self, box_edges):
+        """
+        Words that can be played on the board: every letter is on the board
+        and no two consecutive letters share an edge.
+        """
+        board_mask, same_edge_mask = board_masks(box_edges)
+
+        valid_ids = []
+        for mask in submasks(board_mask):
+            for word_id in self.words_by_mask.get(mask, ()):
+                if self.bigram_masks[word_id] & same_edge_mask:
+                    continue
+                if mask & OTHER_LETTER_BIT and not is_valid_word(self.words[word_id], box_edges):
+                    continue
+                valid_ids.append(word_id)
+        valid_ids.sort()
+        return [self.words[word_id] for word_id in valid_ids]
+
+    def words_within(self, mask):
+        """
+        Sorted ids of the words whose letters all lie in mask. Results for
+        pangram masks are kept, so each 7-letter puzzle is built only once.
+        """
+        word_ids = self._words_within.get(mask)
+        if word_ids is None:
+            word_ids = sorted(
+                word_id for submask in submasks(mask)
+                for word_id in self.words_by_mask.get(submask, ())
+            )
+            if mask in self.pangram_mask_set:
+                self._words_within[mask] = word_ids
+        return word_ids
+
+    def _spellbee_ids(self, letters, center_letter):
+        allowed_mask = letter_mask("".join(letters))
+        center_mask = letter_mask(center_letter)
+        if not center_mask & allowed_mask or center_mask & OTHER_LETTER_BIT:
+            return [word_id for word_id, word in enumerate(self.words)
+                    if center_letter in word and set(word).issubset(letters)]
+
+        if allowed_mask in self.pangram_mask_set:
+            return [word_id for word_id in self.words_within(allowed_mask)
+                    if self.masks[word_id] & center_mask]
+
+        if bin(allowed_mask).count("1") > SPELLBEE_SUBMASK_LETTERS:
+            return [
+                word_id for word_id, mask in enumerate(self.masks)
+                if mask & center_mask and not mask & ~allowed_mask
+                and (not mask & OTHER_LETTER_BIT or set(self.words[word_id]).issubset(letters))
+            ]
+
+        valid_ids = []
+        # Only the submasks holding the center letter can contain valid words
+        for mask in submasks(allowed_mask & ~center_mask):
+            for word_id in self.words_by_mask.get(mask | center_mask, ()):
+                if mask & OTHER_LETTER_BIT and not set(self.words[word_id]).issubset(letters):
+                    continue
+                valid_ids.append(word_id)
+        valid_ids.sort()
+        return valid_ids
+
+    def spellbee_words(self, letters, center_letter):
+        """Words containing the center letter and no letter outside letters"""
+        return [self.words[word_id] for word_id in self._spellbee_ids(letters, center_letter)]
+
+    def spellbee_scores(self, letters, center_letter):
+        """Score every valid Spell Bee word, as (word, score) pairs"""
+        allowed_mask = letter_mask("".join(letters))
+        return [
+            (word, spellbee_score(len(word), letter_mask(word) == allowed_mask))
+            for word in self.spellbee_words(letters, center_letter)
+        ]
+
+
+# Bigram masks have 26 * 26 bits, stored as 11 uint64 chunks per word
+BIGRAM_CHUNKS = 11
+CHUNK_MASK = (1 << 64) - 1
+
+
+def _bigram_chunks(mask):
+    return [(mask >> (64 * chunk)) & CHUNK_MASK for chunk in range(BIGRAM_CHUNKS)]
+
+
+class NumpyWordIndex(WordIndex):
+    """
+    WordIndex that also stores the masks, bigram masks and word lengths as
+    NumPy arrays, so a board or Spell Bee filter is a few vectorized
+    operations over every word at once. Results match WordIndex exactly.
+    """
+
+    def __init__(self, list_of_words):
+        if np is None:
+            raise ImportError("NumpyWordIndex requires numpy")
+        super().__init__(list_of_words)
+        self._build_arrays(
+            np.array(self.masks, dtype=np.uint32),
+            np.array(
+                [_bigram_chunks(mask) for mask in self.bigram_masks], dtype=np.uint64
+            ).reshape(len(self.words), BIGRAM_CHUNKS),
+        )
+
+    @classmethod
+    def from_dictionary(cls, dictionary):
+        """
+        Index a CompiledDictionary. The mask and bigram arrays are read-only
+        views of the mapped file, so processes mapping it share those pages.
+        """
+        if np is None:
+            raise ImportError("NumpyWordIndex requires numpy")
+        index = super().from_dictionary(dictionary)
+        index._build_arrays(dictionary.mask_array(), dictionary.bigram_array())
+        return index
+
+    def _build_arrays(self, mask_array, bigram_array):
+        self.mask_array = mask_array
+        self.bigram_array = bigram_array
+        self.length_array = np.array([len(word) for word in self.words], dtype=np.int32)
+        self.other_ids = {
+            word_id for word_id, mask in enumerate(self.masks) if mask & OTHER_LETTER_BIT
+        }
+
+    def board_words(self, box_edges):
+        board_mask, same_edge_mask = board_masks(box_edges)
+        same_edge_chunks = np.array(_bigram_chunks(same_edge_mask), dtype=np.uint64)
+
+        on_board = (self.mask_array & np.uint32(~board_mask & 0xFFFFFFFF)) == 0
+        word_ids = np.flatnonzero(on_board & (self.length_array > 0))
+        # The pair test only runs on the few words whose letters are all on the board
+        word_ids = word_ids[~np.any(self.bigram_array[word_ids] & same_edge_chunks, axis=1)]
+        return [
+            self.words[word_id]
+            for word_id in word_ids.tolist()
+            if word_id not in self.other_ids or is_valid_word(self.words[word_id], box_edges)
+        ]
+
+    def _spellbee_ids(self, letters, center_letter):
+        allowed_mask = letter_mask("".join(letters))
+        center_mask = letter_mask(center_letter)
+        if allowed_mask in self.pangram_mask_set:
+            return super()._spellbee_ids(letters, center_letter)
+        if center_mask & OTHER_LETTER_BIT:
+            keep = np.array([center_letter in word for word in self.words], dtype=bool)
+        else:
+            keep = (self.mask_array & np.uint32(center_mask)) != 0
+        keep &= (self.mask_array & np.uint32(~allowed_mask & 0xFFFFFFFF)) == 0
+        return [
+            word_id
+            for word_id in np.flatnonzero(keep).tolist()
+            if word_id not in self.other_ids or set(self.words[word_id]).issubset(letters)
+        ]
+
+    def spellbee_scores(self, letters, center_letter):
+        """Score every valid Spell Bee word in bulk, as (word, score) pairs"""
+        word_ids = np.array(self._spellbee_ids(letters, center_letter), dtype=np.int64)
+        lengths = self.length_array[word_ids]
+        pangrams = self.mask_array[word_ids] == np.uint32(letter_mask("".join(letters)))
+        scores = np.where(lengths < 4, 0, np.where(lengths == 4, 1, lengths + 7 * pangrams))
+        return [
+            (self.words[word_id], score)
+            for word_id, score in zip(word_ids.tolist(), scores.tolist())
+        ]
+
+
+def build_word_index(list_of_words, use_numpy=None):
+    """
+    Build the shared word index. use_numpy=None picks the NumPy backend
+    when NumPy is installed and falls back to the pure-Python index.
+    """
+    if use_numpy is None:
+        use_numpy = np is not None
+    if use_numpy:
+        return NumpyWordIndex(list_of_words)
+    return WordIndex(list_of_words)
+
+
+class WordGraph(dict):
+    """
+    Word graph whose neighbour lists are shared: the neighbours of a word
+    are the words starting with its last letter, so every word ending in
+    that letter maps to the same list and building the graph is O(words)
+    instead of one entry per edge. A word that starts and ends with the
+    same letter gets its own copy without itself.
+
+    Each list is ordered by distinct letters, most first, which is what a
+    neighbour can add beyond the letter it shares with the word before
+    it; ties keep the given word order.
+    """
+
+    def __init__(self, words):
+        super().__init__()
+        self.words_by_start = defaultdict(list)
+        for word in words:
+            if word:
+                self.words_by_start[word[0]].append(word)
+        for neighbours in self.words_by_start.values():
+            neighbours.sort(key=lambda word: -len(set(word)))
+
+        no_neighbours = []
+        for word in words:
+            if not word:
+                continue
+            neighbours = self.words_by_start.get(word[-1], no_neighbours)
+            if word[0] == word[-1]:
+                neighbours = [other for other in neighbours if other != word]
+            self[word] = neighbours
+
+
+# max_path from which solve_auto meets in the middle instead of deepening
+LONG_CHAIN_MAX_PATH = 4
+
+# Approximate sys.getsizeof costs used to turn a memory budget into state
+# counts: a frontier entry is a 3-tuple with its parent-pointer node and
+# mask, a visited entry a (word, mask) key and its depth in a dict
+FRONTIER_ENTRY_BYTES = 160
+VISITED_ENTRY_BYTES = 190
+SET_COVERAGE_BYTES = 700  # extra per entry when coverage is a (frozen)set
+
+# Cost model of estimate_cost, fitted to exhaustive solves of 2of12 boards
+# on one core. Iterative deepening memoizes (class, used letters, words
+# left), so a length holds at most classes * 4096 states; meet-in-the-middle
+# merges half chains by (letter, used letters) and in practice keeps about
+# MEET_LAYER_STATES per layer, each joined against about JOIN_PROBES
+# partner masks. A state of each engine costs about this long
+MEET_LAYER_STATES = 4096
+JOIN_PROBES = 8
+SECONDS_PER_STATE = {
+    "pairs": 1e-7,
+    "iterative_deepening": 1.5e-7,
+    "meet_in_middle": 1.5e-6,
+}
+
+
 class GraphLetterBoxedSolver:
     """
     Graph Based Solver Class for the NYTimes LetterBoxd Puzzle
     """
 
-    def __init__(self, list_of_words, box_edges, max_path_length=2):
+    def __init__(self, list_of_words, box_edges, max_path_length=2, use_bitmask=False,
+                 word_order="random", seed=None, memory_budget=None, state_budget=None):
+        # Accepts a shared WordIndex or a plain word list, indexed on the spot
+        if isinstance(list_of_words, WordIndex):
+            self.word_index = list_of_words
+        else:
+            self.word_index = WordIndex(list_of_words)
+
         self.box_edges = box_edges
         self.available_letters = {letter for edge in box_edges for letter in edge}
         self.letter_to_edge = {}
@@ -81,51 +462,129 @@ class GraphLetterBoxedSolver:
             for letter in edge:
                 self.letter_to_edge[letter] = i
 
-        self.cleaned_word_list = [
-            word.replace("-", "").replace(" ", "").replace("'", "")
-            for word in list_of_words
-        ]
-        
+        self.cleaned_word_list = self.word_index.words
+
+        # Per-phase timings and counters of the last build and search
+        self.stats = {}
+
         # Filter the word list to include only valid words
-        self.valid_words = self._filter_valid_words(self.cleaned_word_list)
-        random.shuffle(self.valid_words)
+        start = time.perf_counter()
+        self.valid_words = self.word_index.board_words(box_edges)
+        self.word_order = word_order
+        self.seed = seed
+        self._order_words(word_order, seed)
+        self.stats["filter_seconds"] = time.perf_counter() - start
+
+        start = time.perf_counter()
         self.graph = self._build_graph(self.valid_words)
         self.letters = self.available_letters
         self.max_path_length = max_path_length
 
-    def _is_valid_word(self, word):
-        if not word:
-            return False
-        word_set = set(word)
-        if not word_set.issubset(self.available_letters):
-            return False
-        for i in range(len(word) - 1):
-            if self.letter_to_edge.get(word[i]) == self.letter_to_edge.get(word[i + 1]):
-                return False
-        return True
-
-    def _filter_valid_words(self, words):
-        return [word for word in words if self._is_valid_word(word)]
+        # Optional search limits: estimated bytes held by a search, and
+        # states expanded; each engine falls back to its own iteration cap
+        self.memory_budget = memory_budget
+        self.state_budget = state_budget
+
+        # Bitmask mode: every board letter owns one bit of a 12-bit mask, so
+        # letter coverage, visited keys and completion checks are integer ops
+        self.use_bitmask = use_bitmask
+        self.letter_bits = {
+            letter: 1 << i for i, letter in enumerate(sorted(self.available_letters))
+        }
+        self.full_mask = (1 << len(self.letter_bits)) - 1
+        self.word_masks = {word: self._letter_mask(word) for word in self.valid_words}
+
+        # Words sharing first letter, last letter and mask are interchangeable
+        # during search, so the compressed graph has one node per such class
+        self.word_classes = self._build_word_classes(self.valid_words)
+        self.class_graph = self._build_class_graph(self.word_classes)
+        self.stats["graph_seconds"] = time.perf_counter() - start
+        self.stats["nodes"] = len(self.valid_words)
+        self.stats["edges"] = sum(len(neighbours) for neighbours in self.graph.values())
+        self.stats["classes"] = len(self.word_classes)
+        self._start_search(None)
+
+    def _order_words(self, word_order, seed):
+        """
+        Order the valid words, which fixes the search order and so which
+        solutions are kept under the caps. "random" shuffles, reproducibly
+        when a seed is given; "coverage" is the canonical order, words with
+        the most distinct letters first, then alphabetical.
+        """
+        if word_order == "coverage":
+            self.valid_words.sort(key=lambda word: (-len(set(word)), word))
+        elif word_order == "random":
+            rng = random if seed is None else random.Random(seed)
+            rng.shuffle(self.valid_words)
+        else:
+            raise ValueError(f"Unknown word_order: {word_order}")
+
+    def _start_search(self, engine):
+        """Reset the search counters in self.stats and return the start time"""
+        self.stats.update(
+            engine=engine,
+            states_expanded=0,
+            peak_queue=0,
+            visited=0,
+            time_capped=False,
+            iteration_capped=False,
+            memory_capped=False,
+            depth_first=False,
+            solution_capped=False,
+            solutions=0,
+            search_seconds=0.0,
+        )
+        return time.perf_counter()
+
+    def _finish_search(self, start, solutions):
+        self.stats["solutions"] = solutions
+        self.stats["search_seconds"] = time.perf_counter() - start
+
+    def _letter_mask(self, word):
+        """Bitmask of the board letters used by a word"""
+        mask = 0
+        for letter in word:
+            mask |= self.letter_bits[letter]
+        return mask
+
+    def _word_letters(self, word):
+        """Letter coverage of a word: a bitmask in bitmask mode, otherwise a set"""
+        if self.use_bitmask:
+            return self.word_masks[word]
+        return set(word)
+
+    def _coverage_key(self, used_letters):
+        """Hashable form of the letter coverage for visited-state keys"""
+        if self.use_bitmask:
+            return used_letters
+        return frozenset(used_letters)
 
     def _build_graph(self, list_of_words):
         """
         Build a graph where each word is a node and there's an
         edge if one word can transition to another.
         """
-        words_by_start = defaultdict(list)
+        return WordGraph(list_of_words)
+
+    def _build_word_classes(self, list_of_words):
+        """
+        Group words into classes keyed by (first letter, last letter, mask).
+        """
+        word_classes = defaultdict(list)
         for word in list_of_words:
-            if word:
-                words_by_start[word[0]].append(word)
+            word_classes[(word[0], word[-1], self.word_masks[word])].append(word)
+        return word_classes
 
-        graph = defaultdict(list)
-        for word1 in list_of_words:
-            if not word1:
-                continue
-            last_char = word1[-1]
-            for word2 in words_by_start.get(last_char, []):
-                if word1 != word2:
-                    graph[word1].append(word2)
-        return graph
+    def _build_class_graph(self, word_classes):
+        """
+        Build the compressed graph where each class links to every class
+        starting with its last letter. Classes with the same last letter
+        share one neighbour list.
+        """
+        classes_by_start = defaultdict(list)
+        for key in word_classes:
+            classes_by_start[key[0]].append(key)
+        return {key: classes_by_start.get(key[1], []) for key in word_classes}
 
     def generate_dot_file(self, filename="graph.dot"):
         """
@@ -166,6 +625,8 @@ class GraphLetterBoxedSolver:
         plt.show()
 
     def _all_letters_used(self, used_letters):
+        if self.use_bitmask:
+            return used_letters == self.full_mask
         return used_letters == self.letters
 
     def _dfs(self, current_word, used_letters, current_chain, visited=None, solution_fingerprints=None,
@@ -198,7 +659,7 @@ class GraphLetterBoxedSolver:
                 return [tuple(current_chain)]
             return []
 
-        state_key = (current_word, frozenset(used_letters))
+        state_key = (current_word, self._coverage_key(used_letters))
         if state_key in visited:
             return []
         visited.add(state_key)
@@ -210,9 +671,8 @@ class GraphLetterBoxedSolver:
             for next_word in next_words:
                 if next_word in current_chain:
                     continue
-                new_letters = set(next_word) - used_letters
-                if new_letters or not (used_letters & set(next_word)):
-                    new_used_letters = used_letters | set(next_word)
+                new_used_letters = used_letters | self._word_letters(next_word)
+                if new_used_letters != used_letters:
                     result = self._dfs(
                         next_word,
                         new_used_letters,
@@ -249,6 +709,7 @@ class GraphLetterBoxedSolver:
                 f"Invalid max_path_length: {self.max_path_length}, using default of 10")
             self.max_path_length = 10
 
+        search_start = self._start_search("dfs")
         unique_solutions = []
         solution_fingerprints = set()
         total_words = len(self.valid_words)
@@ -265,9 +726,10 @@ class GraphLetterBoxedSolver:
 
                 if time.time() - overall_start_time > 60:  # 1 minute timeout
                     logging.warning("Overall solve timeout reached")
+                    self.stats["time_capped"] = True
                     break
 
-                solutions = self._dfs(start_word, set(start_word), [start_word],
+                solutions = self._dfs(start_word, self._word_letters(start_word), [start_word],
                                       solution_fingerprints=solution_fingerprints)
 
                 for solution in solutions:
@@ -276,6 +738,7 @@ class GraphLetterBoxedSolver:
                 if len(unique_solutions) >= 1000:  
                     logging.info(
                         f"Found {len(unique_solutions)} total solutions, stopping early")
+                    self.stats["solution_capped"] = True
                     break
 
         except Exception as e:
@@ -284,22 +747,60 @@ class GraphLetterBoxedSolver:
         if len(unique_solutions) == 0:
             logging.warning("No solutions found, try a larger path size")
 
+        self._finish_search(search_start, len(unique_solutions))
         return set(unique_solutions)
 
+    def _chain(self, node):
+        """Rebuild a word chain from its last parent-pointer node"""
+        chain = []
+        while node is not None:
+            word, node = node
+            chain.append(word)
+        chain.reverse()
+        return tuple(chain)
+
+    def _search_bytes(self, frontier_size, visited_size):
+        """Estimated bytes held by a search frontier and its visited states"""
+        frontier_bytes, visited_bytes = FRONTIER_ENTRY_BYTES, VISITED_ENTRY_BYTES
+        if not self.use_bitmask:
+            frontier_bytes += SET_COVERAGE_BYTES
+            visited_bytes += SET_COVERAGE_BYTES
+        return frontier_size * frontier_bytes + visited_size * visited_bytes
+
+    def _apply_budget(self, frontier, visited, depth_first):
+        """
+        Check a search against memory_budget. Returns None when the search
+        must stop, otherwise whether to continue depth-first, which it does
+        from the moment the frontier alone passes half the budget. Popping
+        the newest states first keeps the frontier from growing further.
+        """
+        if self.memory_budget is None:
+            return depth_first
+        if self._search_bytes(len(frontier), len(visited)) > self.memory_budget:
+            logging.warning(f"Search stopped at its memory budget of {self.memory_budget} bytes")
+            self.stats["memory_capped"] = True
+            return None
+        if not depth_first and self._search_bytes(len(frontier), 0) > self.memory_budget // 2:
+            logging.warning(f"Frontier of {len(frontier)} states, continuing depth-first")
+            self.stats["depth_first"] = True
+            return True
+        return depth_first
+
     def _bfs(self, start_word):
         """Perform BFS starting from the given word with improved resilience"""
-        if not start_word or start_word not in self.valid_words:
+        if not start_word or start_word not in self.word_masks:
             logging.warning(f"Invalid start word: {start_word}")
             return []
 
-        # Queue entries: (current_word, used_letters, current_chain)
-        queue = deque([(start_word, set(start_word), [start_word])])
+        # Queue entries: (node, used_letters, depth), where a node is a
+        # (word, parent node) pair so chains are shared rather than copied
+        queue = deque([((start_word, None), self._word_letters(start_word), 1)])
         all_solutions = []
-        visited = set()
+        visited = {}  # state -> shallowest depth it was expanded at
         iterations = 0
         fingerprints = set()  # To track unique states
-        max_iterations = 1000000  # Safety limit
-        max_queue_size = 100000   # Memory safety
+        max_iterations = self.state_budget or 1000000  # Safety limit
+        depth_first = False
 
         start_time = time.time()
         time_limit = 10  # seconds
@@ -311,33 +812,34 @@ class GraphLetterBoxedSolver:
                 if iterations % 1000 == 0 and time.time() - start_time > time_limit:
                     break
 
-                if len(queue) > max_queue_size:
+                depth_first = self._apply_budget(queue, visited, depth_first)
+                if depth_first is None:
                     break
 
-                current_word, used_letters, current_chain = queue.popleft()
+                node, used_letters, depth = queue.pop() if depth_first else queue.popleft()
+                current_word = node[0]
 
-                state_key = (current_word, frozenset(used_letters))
-                if state_key in visited:
+                state_key = (current_word, self._coverage_key(used_letters))
+                if visited.get(state_key, self.max_path_length + 1) <= depth:
                     continue
-                visited.add(state_key)
+                visited[state_key] = depth
 
                 if self._all_letters_used(used_letters):
-                    solution_words = frozenset(current_chain)
+                    solution = self._chain(node)
+                    solution_words = frozenset(solution)
                     if solution_words not in fingerprints:
                         fingerprints.add(solution_words)
-                        all_solutions.append(tuple(current_chain))
+                        all_solutions.append(solution)
                     continue
 
-                if len(current_chain) >= self.max_path_length:
+                if depth >= self.max_path_length:
                     continue
 
                 next_words = self.graph.get(current_word, [])
                 for next_word in next_words:
-                    new_letters = set(next_word) - used_letters
-                    if new_letters or not (used_letters & set(next_word)):
-                        new_used_letters = used_letters | set(next_word)
-                        new_chain = current_chain + [next_word]
-                        queue.append((next_word, new_used_letters, new_chain))
+                    new_used_letters = used_letters | self._word_letters(next_word)
+                    if new_used_letters != used_letters:
+                        queue.append(((next_word, node), new_used_letters, depth + 1))
 
         except Exception as e:
             logging.error(f"Error in BFS for word {start_word}: {str(e)}")
@@ -345,22 +847,29 @@ class GraphLetterBoxedSolver:
         return all_solutions
 
     def solve_bfs(self):
-        """Solve using a global multi-source BFS from all possible starting words for optimal speed"""
+        """
+        Solve using a global multi-source BFS from all possible starting
+        words. Chains are parent-pointer nodes; under a memory_budget the
+        search turns depth-first when the frontier grows too big and stops
+        before exceeding the budget.
+        """
         if not hasattr(self, 'valid_words') or not self.valid_words:
             logging.error("No valid words available")
             return set()
 
+        search_start = self._start_search("bfs")
         all_solutions = set()
         fingerprints = set() 
         
         # Initialize queue with all valid starting words
-        queue = deque([(word, set(word), [word]) for word in self.valid_words])
-        visited = set()
+        queue = deque([((word, None), self._word_letters(word), 1) for word in self.valid_words])
+        visited = {}  # state -> shallowest depth it was expanded at
+        depth_first = False
         
         start_time = time.time()
         time_limit = 30  # seconds
         iterations = 0
-        max_iterations = 2000000
+        max_iterations = self.state_budget or 2000000
         
         try:
             while queue and iterations < max_iterations:
@@ -368,35 +877,43 @@ class GraphLetterBoxedSolver:
                 
                 if iterations % 10000 == 0 and time.time() - start_time > time_limit:
                     logging.warning(f"Global BFS timed out after {time_limit} seconds")
+                    self.stats["time_capped"] = True
                     break
-                    
-                current_word, used_letters, current_chain = queue.popleft()
+
+                if len(queue) > self.stats["peak_queue"]:
+                    self.stats["peak_queue"] = len(queue)
+                depth_first = self._apply_budget(queue, visited, depth_first)
+                if depth_first is None:
+                    break
+
+                node, used_letters, depth = queue.pop() if depth_first else queue.popleft()
+                current_word = node[0]
                 
                 if self._all_letters_used(used_letters):
-                    solution_set = frozenset(current_chain)
+                    solution = self._chain(node)
+                    solution_set = frozenset(solution)
                     if solution_set not in fingerprints:
                         fingerprints.add(solution_set)
-                        all_solutions.add(tuple(current_chain))
+                        all_solutions.add(solution)
                         if len(all_solutions) >= 1000:
                             logging.info("Found 1000 solutions, stopping early")
+                            self.stats["solution_capped"] = True
                             break
                     continue
                     
-                if len(current_chain) >= self.max_path_length:
+                if depth >= self.max_path_length:
                     continue
                     
-                state_key = (current_word, frozenset(used_letters))
-                if state_key in visited:
+                state_key = (current_word, self._coverage_key(used_letters))
+                if visited.get(state_key, self.max_path_length + 1) <= depth:
                     continue
-                visited.add(state_key)
+                visited[state_key] = depth
                 
                 next_words = self.graph.get(current_word, [])
                 for next_word in next_words:
-                    new_letters = set(next_word) - used_letters
-                    if new_letters or not (used_letters & set(next_word)):
-                        new_used_letters = used_letters | set(next_word)
-                        new_chain = current_chain + [next_word]
-                        queue.append((next_word, new_used_letters, new_chain))
+                    new_used_letters = used_letters | self._word_letters(next_word)
+                    if new_used_letters != used_letters:
+                        queue.append(((next_word, node), new_used_letters, depth + 1))
                         
         except Exception as e:
             logging.error(f"Error in solve_bfs: {str(e)}")
@@ -404,8 +921,756 @@ class GraphLetterBoxedSolver:
         if len(all_solutions) == 0:
             logging.warning("No solutions found, try a larger path size")
 
+        self.stats["states_expanded"] = iterations
+        self.stats["visited"] = len(visited)
+        self.stats["iteration_capped"] = iterations >= max_iterations
+        self._finish_search(search_start, len(all_solutions))
         return all_solutions
 
+    def _expand_class_chain(self, class_chain, fingerprints):
+        """Yield the word chains of a class chain whose word set is new"""
+        for chain in product(*(self.word_classes[key] for key in class_chain)):
+            solution_set = frozenset(chain)
+            if solution_set not in fingerprints:
+                fingerprints.add(solution_set)
+                yield chain
+
+    def solve_pairs(self):
+        """
+        Find every solution of at most two words without graph traversal.
+        Words are indexed by (first letter, mask); each word is joined with
+        the partners that start with its last letter and whose mask
+        completes the board. There is no early-stop cap.
+        """
+        if not self.valid_words:
+            logging.error("No valid words available")
+            return set()
+
+        search_start = self._start_search("pairs")
+        masks_by_start = defaultdict(lambda: defaultdict(list))
+        for word in self.valid_words:
+            masks_by_start[word[0]][self.word_masks[word]].append(word)
+
+        all_solutions = set()
+        fingerprints = set()
+        for joined, word in enumerate(self.valid_words):
+            if self._pairs_over_budget(joined, len(all_solutions)):
+                break
+            word_mask = self.word_masks[word]
+            if word_mask == self.full_mask:
+                all_solutions.add((word,))
+                continue
+            for partner_mask, partners in masks_by_start[word[-1]].items():
+                if word_mask | partner_mask != self.full_mask:
+                    continue
+                for partner in partners:
+                    solution_set = frozenset((word, partner))
+                    if solution_set not in fingerprints:
+                        fingerprints.add(solution_set)
+                        all_solutions.add((word, partner))
+
+        if len(all_solutions) == 0:
+            logging.warning("No solutions found, try a larger path size")
+
+        self.stats["states_expanded"] = joined + 1
+        self._finish_search(search_start, len(all_solutions))
+        return all_solutions
+
+    def _pairs_over_budget(self, joined, solutions):
+        """
+        Check solve_pairs against its budgets before joining one more word;
+        the word index and the solutions count as visited entries
+        """
+        if self.state_budget is not None and joined >= self.state_budget:
+            logging.warning(f"Pair join reached its state budget of {self.state_budget}")
+            self.stats["iteration_capped"] = True
+            return True
+        if self.memory_budget is not None and \
+                self._search_bytes(0, len(self.valid_words) + solutions) > self.memory_budget:
+            logging.warning(f"Pair join stopped at its memory budget of {self.memory_budget} bytes")
+            self.stats["memory_capped"] = True
+            return True
+        return False
+
+    def _deepen(self, key, used_mask, remaining, class_chain, dead_states):
+        """
+        Depth-limited DFS over classes. Yield every class chain extending
+        class_chain that first covers the board after exactly `remaining`
+        more words. States proven to lead nowhere are recorded in
+        dead_states and skipped on later visits and later depths.
+        """
+        if used_mask == self.full_mask:
+            if remaining == 0:
+                yield list(class_chain)
+            return
+        if remaining == 0:
+            return
+
+        state = (key, used_mask, remaining)
+        if state in dead_states:
+            return
+        self.stats["states_expanded"] += 1
+
+        found = False
+        for next_key in self.class_graph[key]:
+            new_mask = used_mask | next_key[2]
+            if new_mask == used_mask:
+                continue
+            class_chain.append(next_key)
+            for solution in self._deepen(next_key, new_mask, remaining - 1, class_chain, dead_states):
+                found = True
+                yield solution
+            class_chain.pop()
+
+        if not found:
+            dead_states.add(state)
+
+    def _iter_depth(self, depth, dead_states, start_letter=None, deadline=None, cancel_event=None):
+        """
+        Yield the class chains that first cover the board after exactly
+        depth words, optionally only those starting with start_letter.
+        The deadline, cancel_event and state_budget are checked before each
+        start class; the dead-state memo is dropped when it outgrows the
+        memory_budget.
+        """
+        for key in self.word_classes:
+            if deadline is not None and time.time() > deadline:
+                return
+            if cancel_event is not None and cancel_event.is_set():
+                return
+            if self.state_budget is not None and self.stats["states_expanded"] >= self.state_budget:
+                self.stats["iteration_capped"] = True
+                return
+            if self.memory_budget is not None and \
+                    self._search_bytes(0, len(dead_states)) > self.memory_budget:
+                logging.warning(f"Dropping {len(dead_states)} dead states to stay within the memory budget")
+                dead_states.clear()
+            if start_letter is None or key[0] == start_letter:
+                yield from self._deepen(key, key[2], depth - 1, [key], dead_states)
+
+    def iter_solutions(self, stop_depth=None, deadline=None, cancel_event=None):
+        """
+        Yield solutions as they are found, shortest chains first, using
+        iterative deepening over word classes. Each depth is searched
+        exhaustively before the next one. By default the search stops after
+        the first depth with solutions; with stop_depth it keeps going until
+        that depth is exhausted. max_path_length is never exceeded.
+
+        The search stops early once time.time() passes deadline or
+        cancel_event (e.g. a threading.Event) is set; closing the generator
+        stops it as well.
+        """
+        if not self.valid_words:
+            logging.error("No valid words available")
+            return
+
+        last_depth = self.max_path_length
+        if stop_depth is not None:
+            last_depth = min(stop_depth, last_depth)
+
+        search_start = self._start_search("iterative_deepening")
+        fingerprints = set()
+        dead_states = set()
+
+        try:
+            for depth in range(1, last_depth + 1):
+                for class_chain in self._iter_depth(depth, dead_states, deadline=deadline,
+                                                    cancel_event=cancel_event):
+                    yield from self._expand_class_chain(class_chain, fingerprints)
+
+                if deadline is not None and time.time() > deadline:
+                    logging.warning(f"Solution stream reached its deadline at depth {depth}")
+                    self.stats["time_capped"] = True
+                    return
+                if cancel_event is not None and cancel_event.is_set():
+                    logging.info(f"Solution stream cancelled at depth {depth}")
+                    return
+                if self.stats["iteration_capped"]:
+                    logging.warning(f"Solution stream reached its state budget at depth {depth}")
+                    return
+
+                logging.info(f"Depth {depth} exhausted with {len(fingerprints)} solutions")
+                if fingerprints and stop_depth is None:
+                    return
+        finally:
+            self.stats["visited"] = len(dead_states)
+            self._finish_search(search_start, len(fingerprints))
+
+    def solve_iterative_deepening(self, stop_depth=None, max_solutions=1000):
+        """
+        Collect iter_solutions() into a set, shortest chains first, stopping
+        after max_solutions.
+        """
+        all_solutions = set()
+        solutions = self.iter_solutions(stop_depth)
+        for chain in solutions:
+            all_solutions.add(chain)
+            if len(all_solutions) >= max_solutions:
+                logging.info(f"Found {max_solutions} solutions, stopping early")
+                solutions.close()
+                self.stats["solution_capped"] = True
+                return all_solutions
+
+        if len(all_solutions) == 0:
+            logging.warning("No solutions found, try a larger path size")
+
+        return all_solutions
+
+    def solve_parallel(self, workers=None, stop_depth=None, max_solutions=1000, pool=None):
+        """
+        Iterative deepening spread over a process pool. Every depth is split
+        into one task per start letter. Without a pool, a fork pool is
+        started for this call and its workers receive this solver through
+        the pool initializer, inherited rather than pickled; a PartitionPool
+        skips that start-up and rebuilds the board in its workers instead.
+        Results are merged in sorted order, so the solutions kept under the
+        cap do not depend on which worker finishes first. Falls back to the
+        serial search where fork is unavailable.
+        """
+        if not self.valid_words:
+            logging.error("No valid words available")
+            return set()
+
+        if pool is None:
+            try:
+                context = multiprocessing.get_context("fork")
+            except ValueError:
+                logging.warning("fork start method unavailable, solving serially")
+                return self.solve_iterative_deepening(stop_depth, max_solutions)
+            executor = ProcessPoolExecutor(
+                max_workers=workers, mp_context=context,
+                initializer=_init_partition_worker, initargs=(self,))
+            partition = _solve_partition
+        else:
+            executor = nullcontext(pool.executor)
+            partition = partial(_solve_board_partition, self._board_spec())
+
+        last_depth = self.max_path_length
+        if stop_depth is not None:
+            last_depth = min(stop_depth, last_depth)
+
+        search_start = self._start_search("parallel")
+        start_letters = sorted({key[0] for key in self.word_classes})
+        all_solutions = set()
+        fingerprints = set()
+
+        try:
+            with executor as executor:
+                for depth in range(1, last_depth + 1):
+                    partitions = executor.map(
+                        partition, start_letters,
+                        repeat(depth), repeat(max_solutions))
+                    for chain in sorted(chain for part in partitions for chain in part):
+                        solution_set = frozenset(chain)
+                        if solution_set in fingerprints:
+                            continue
+                        fingerprints.add(solution_set)
+                        all_solutions.add(chain)
+                        if len(all_solutions) >= max_solutions:
+                            logging.info(f"Found {max_solutions} solutions, stopping early")
+                            self.stats["solution_capped"] = True
+                            return all_solutions
+
+                    logging.info(f"Depth {depth} exhausted with {len(all_solutions)} solutions")
+                    if all_solutions and stop_depth is None:
+                        break
+        finally:
+            self._finish_search(search_start, len(all_solutions))
+
+        if len(all_solutions) == 0:
+            logging.warning("No solutions found, try a larger path size")
+
+        return all_solutions
+
+    def _board_spec(self):
+        """Hashable arguments that rebuild this solver in a PartitionPool worker"""
+        return (
+            tuple(tuple(edge) for edge in self.box_edges), self.max_path_length,
+            self.use_bitmask, self.word_order, self.seed,
+            self.memory_budget, self.state_budget,
+        )
+
+    def estimate_cost(self, max_path_length=None):
+        """
+        Predict the cost of solve_auto before searching. With b = edges /
+        nodes, the engine it picks extends about classes * b ** (k - 1)
+        chains of k words, capped by the states that engine tells apart;
+        meet-in-the-middle builds half chains from each end and joins them.
+        Searches stop at the first length with solutions, so a board that
+        two classes already cover is priced up to two words only.
+        """
+        max_path_length = max_path_length or self.max_path_length
+        nodes = len(self.valid_words)
+        classes = self.stats["classes"]
+        branching = self.stats["edges"] / nodes if nodes else 0.0
+        last_length = max_path_length
+        if max_path_length > 2 and self._covers_in_two():
+            last_length = 2
+
+        def chains(length, cap):
+            return min(classes * branching ** (length - 1), cap)
+
+        engine = self.auto_engine(max_path_length)
+        if engine == "pairs":
+            states = classes * branching
+        elif engine == "meet_in_middle":
+            states = 2 * classes + sum(
+                chains(length, MEET_LAYER_STATES) * branching
+                for half in ((last_length + 1) // 2, last_length // 2)
+                for length in range(1, half)
+            )
+            states += sum(
+                chains((length + 1) // 2, MEET_LAYER_STATES)
+                * min(chains(length // 2, MEET_LAYER_STATES) / 12, JOIN_PROBES)
+                for length in range(2, last_length + 1)
+            )
+        else:
+            # Every depth searches the lengths below it again
+            states = sum(
+                chains(length, classes * 4096) * branching
+                for depth in range(2, last_length + 1)
+                for length in range(1, depth)
+            )
+        return {
+            "nodes": nodes,
+            "edges": self.stats["edges"],
+            "branching": round(branching, 2),
+            "max_path": max_path_length,
+            "engine": engine,
+            "states": int(states),
+            "seconds": round(states * SECONDS_PER_STATE[engine], 4),
+        }
+
+    def _covers_in_two(self):
+        """Check on the class graph whether one or two words can cover the board"""
+        for key, neighbours in self.class_graph.items():
+            if key[2] == self.full_mask:
+                return True
+            for next_key in neighbours:
+                if key[2] | next_key[2] == self.full_mask:
+                    return True
+        return False
+
+    def auto_engine(self, max_path_length=None):
+        """
+        Engine solve_auto uses for max_path_length: the pair join for two
+        words, meet-in-the-middle for long chains, and otherwise iterative
+        deepening
+        """
+        max_path_length = max_path_length or self.max_path_length
+        if max_path_length == 2:
+            return "pairs"
+        if max_path_length >= LONG_CHAIN_MAX_PATH:
+            return "meet_in_middle"
+        return "iterative_deepening"
+
+    def solve_auto(self, pool=None):
+        """
+        Solve with the engine auto_engine picks; iterative deepening runs
+        over a PartitionPool when given.
+        """
+        engine = self.auto_engine()
+        if engine == "pairs":
+            return self.solve_pairs()
+        if engine == "meet_in_middle":
+            return self.solve_meet_in_middle()
+        if pool is not None:
+            return self.solve_parallel(pool=pool)
+        return self.solve_iterative_deepening()
+
+    def _adds_letters_each_step(self, class_chain):
+        """Check that every class in the chain covers at least one new letter"""
+        used_mask = 0
+        for key in class_chain:
+            new_mask = used_mask | key[2]
+            if new_mask == used_mask:
+                return False
+            used_mask = new_mask
+        return True
+
+    def _extend_forward(self, layer, classes_by_start):
+        """Append one class to every forward chain, keyed by (last letter, mask)"""
+        next_layer = defaultdict(list)
+        for state in layer:
+            last_letter, used_mask = state
+            if used_mask == self.full_mask:
+                continue
+            for key in classes_by_start[last_letter]:
+                new_mask = used_mask | key[2]
+                if new_mask != used_mask:
+                    next_layer[(key[1], new_mask)].append((state, key))
+        return next_layer
+
+    def _extend_backward(self, layer, classes_by_end):
+        """Prepend one class to every backward chain, keyed by (first letter, mask)"""
+        next_layer = defaultdict(list)
+        for state in layer:
+            first_letter, used_mask = state
+            for key in classes_by_end[first_letter]:
+                next_layer[(key[0], used_mask | key[2])].append((state, key))
+        return next_layer
+
+    def _forward_chains(self, layers, depth, state):
+        """Yield every class chain that reaches a forward state"""
+        for prev_state, key in layers[depth][state]:
+            if prev_state is None:
+                yield [key]
+                continue
+            for chain in self._forward_chains(layers, depth - 1, prev_state):
+                chain.append(key)
+                yield chain
+
+    def _backward_chains(self, layers, depth, state):
+        """Yield every class chain that starts from a backward state"""
+        for next_state, key in layers[depth][state]:
+            if next_state is None:
+                yield [key]
+                continue
+            for chain in self._backward_chains(layers, depth - 1, next_state):
+                yield [key] + chain
+
+    def solve_meet_in_middle(self, max_solutions=1000, time_limit=90):
+        """
+        Solve long chains by meeting in the middle. Forward partial chains
+        are merged by (last letter, mask) and backward partial chains by
+        (first letter, mask); a chain of n words joins a forward half of
+        ceil(n / 2) words with a backward half of floor(n / 2) words that
+        starts with its last letter and completes the board. Both sides have
+        at most 12 * 4096 states per layer, so long chains stay tractable.
+        Chain lengths are tried shortest first and the search stops at the
+        first length with solutions.
+        """
+        if not self.valid_words:
+            logging.error("No valid words available")
+            return set()
+
+        classes_by_start = defaultdict(list)
+        classes_by_end = defaultdict(list)
+        for key in self.word_classes:
+            classes_by_start[key[0]].append(key)
+            classes_by_end[key[1]].append(key)
+
+        forward_layers = [defaultdict(list)]
+        backward_layers = [defaultdict(list)]
+        for key in self.word_classes:
+            forward_layers[0][(key[1], key[2])].append((None, key))
+            backward_layers[0][(key[0], key[2])].append((None, key))
+
+        search_start = self._start_search("meet_in_middle")
+        all_solutions = set()
+        fingerprints = set()
+        deadline = time.time() + time_limit
+
+        for length in range(1, self.max_path_length + 1):
+            if time.time() > deadline:
+                logging.warning(f"Meet-in-the-middle search timed out after {time_limit} seconds")
+                self.stats["time_capped"] = True
+                break
+
+            forward_depth = (length + 1) // 2
+            backward_depth = length // 2
+            while len(forward_layers) < forward_depth:
+                forward_layers.append(self._extend_forward(forward_layers[-1], classes_by_start))
+            while backward_depth and len(backward_layers) < backward_depth:
+                backward_layers.append(self._extend_backward(backward_layers[-1], classes_by_end))
+            layer_states = self._layer_states(forward_layers, backward_layers)
+            if self._meet_over_budget(layer_states, 0):
+                break
+
+            forward_layer = forward_layers[forward_depth - 1]
+            backward_by_letter = defaultdict(dict)
+            if backward_depth:
+                for state in backward_layers[backward_depth - 1]:
+                    backward_by_letter[state[0]][state[1]] = state
+
+            for joined, forward_state in enumerate(forward_layer):
+                if self._meet_over_budget(layer_states, joined):
+                    break
+                if time.time() > deadline:
+                    logging.warning(f"Meet-in-the-middle join timed out after {time_limit} seconds")
+                    self.stats["time_capped"] = True
+                    break
+                last_letter, forward_mask = forward_state
+                if not backward_depth:
+                    if forward_mask == self.full_mask:
+                        matches = [None]
+                    else:
+                        continue
+                elif forward_mask == self.full_mask:
+                    continue
+                else:
+                    matches = self._join_masks(forward_mask, backward_by_letter[last_letter])
+
+                for backward_state in matches:
+                    for head in self._forward_chains(forward_layers, forward_depth - 1, forward_state):
+                        tails = [[]]
+                        if backward_state is not None:
+                            tails = self._backward_chains(backward_layers, backward_depth - 1, backward_state)
+                        for tail in tails:
+                            class_chain = head + tail
+                            if not self._adds_letters_each_step(class_chain):
+                                continue
+                            for chain in self._expand_class_chain(class_chain, fingerprints):
+                                all_solutions.add(chain)
+                                if len(all_solutions) >= max_solutions:
+                                    logging.info(f"Found {max_solutions} solutions, stopping early")
+                                    self.stats["solution_capped"] = True
+                                    self._record_layers(forward_layers, backward_layers)
+                                    self._finish_search(search_start, len(all_solutions))
+                                    return all_solutions
+
+            if all_solutions or self.stats["iteration_capped"] or self.stats["memory_capped"] \
+                    or self.stats["time_capped"]:
+                break
+
+        if len(all_solutions) == 0:
+            logging.warning("No solutions found, try a larger path size")
+
+        self._record_layers(forward_layers, backward_layers)
+        self._finish_search(search_start, len(all_solutions))
+        return all_solutions
+
+    def _layer_states(self, forward_layers, backward_layers):
+        """Half chains held by meet-in-the-middle: one per state and class appended"""
+        return sum(len(links) for layer in forward_layers + backward_layers for links in layer.values())
+
+    def _meet_over_budget(self, layer_states, joined):
+        """
+        Check meet-in-the-middle against its budgets, after a layer is built
+        and before each forward state is joined. Held half chains count as
+        visited entries; the states budget covers them and the joins.
+        """
+        if self.state_budget is not None and layer_states + joined >= self.state_budget:
+            logging.warning(f"Meet-in-the-middle reached its state budget of {self.state_budget}")
+            self.stats["iteration_capped"] = True
+            return True
+        if self.memory_budget is not None and \
+                self._search_bytes(0, layer_states) > self.memory_budget:
+            logging.warning(f"Meet-in-the-middle stopped at its memory budget of {self.memory_budget} bytes")
+            self.stats["memory_capped"] = True
+            return True
+        return False
+
+    def _record_layers(self, forward_layers, backward_layers):
+        """Count the meet-in-the-middle states built, and the largest layer"""
+        layers = forward_layers + backward_layers
+        self.stats["states_expanded"] = sum(len(layer) for layer in layers)
+        self.stats["peak_queue"] = max(len(layer) for layer in layers)
+
+    def _join_masks(self, forward_mask, backward_states):
+        """
+        Return the backward states whose mask completes forward_mask,
+        enumerating whichever side is smaller: the backward masks, or the
+        supersets of the missing letters.
+        """
+        missing = self.full_mask & ~forward_mask
+        if 1 << bin(forward_mask).count("1") < len(backward_states):
+            matches = []
+            extra = forward_mask
+            while True:
+                state = backward_states.get(missing | extra)
+                if state is not None:
+                    matches.append(state)
+                if extra == 0:
+                    break
+                extra = (extra - 1) & forward_mask
+            return matches
+        return [state for mask, state in backward_states.items() if mask & missing == missing]
+
+    def _coverage_bound(self):
+        """
+        Admissible lower bound on the words needed to finish a chain, from
+        its last letter and mask. The next word covers at most the most
+        letters of any word starting with that letter, and every later word
+        at most the most letters of any word. None when no word can follow.
+        """
+        most_by_start = defaultdict(int)
+        for word in self.valid_words:
+            count = bin(self.word_masks[word]).count("1")
+            most_by_start[word[0]] = max(most_by_start[word[0]], count)
+        most = max(most_by_start.values())
+
+        def bound(last_letter, used_mask):
+            missing = bin(self.full_mask & ~used_mask).count("1")
+            if missing == 0:
+                return 0
+            first = most_by_start.get(last_letter, 0)
+            if first == 0:
+                return None
+            return 1 + -(-max(0, missing - first) // most)
+
+        return bound
+
+    def iter_best_first(self, deadline=None, cancel_event=None):
+        """
+        Yield solutions in solution_sort_key order with an A* search over
+        word chains. A chain's priority is its length plus a lower bound on
+        the words still needed, which shrinks as new letters are covered;
+        ties are broken alphabetically. Because the bound never overestimates,
+        every better solution is yielded before a worse one, so the first k
+        solutions are the best k without enumerating the rest.
+
+        Like iter_solutions, the search stops once time.time() passes
+        deadline or cancel_event is set, checked before each expansion.
+        """
+        if not self.valid_words:
+            logging.error("No valid words available")
+            return
+
+        bound = self._coverage_bound()
+        heap = []
+        for word in self.valid_words:
+            remaining = bound(word[-1], self.word_masks[word])
+            if remaining is not None and 1 + remaining <= self.max_path_length:
+                heap.append((1 + remaining, (word,), self.word_masks[word]))
+        heapq.heapify(heap)
+
+        search_start = self._start_search("best_first")
+        fingerprints = set()
+        expansions = 0
+        peak_queue = len(heap)
+        try:
+            while heap:
+                _, chain, used_mask = heapq.heappop(heap)
+                if used_mask == self.full_mask:
+                    solution_set = frozenset(chain)
+                    if solution_set not in fingerprints:
+                        fingerprints.add(solution_set)
+                        yield chain
+                    continue
+
+                if deadline is not None and time.time() > deadline:
+                    logging.warning(f"Best-first search reached its deadline after {expansions} expansions")
+                    self.stats["time_capped"] = True
+                    return
+                if cancel_event is not None and cancel_event.is_set():
+                    logging.info(f"Best-first search cancelled after {expansions} expansions")
+                    return
+
+                expansions += 1
+                if self.state_budget is not None and expansions > self.state_budget:
+                    logging.warning(f"Best-first search reached its state budget of {self.state_budget}")
+                    self.stats["iteration_capped"] = True
+                    return
+                if self.memory_budget is not None and \
+                        self._search_bytes(len(heap), 0) > self.memory_budget:
+                    logging.warning(f"Best-first search stopped at its memory budget of {self.memory_budget} bytes")
+                    self.stats["memory_capped"] = True
+                    return
+                for next_word in self.graph[chain[-1]]:
+                    new_mask = used_mask | self.word_masks[next_word]
+                    if new_mask == used_mask:
+                        continue
+                    remaining = bound(next_word[-1], new_mask)
+                    if remaining is None or len(chain) + 1 + remaining > self.max_path_length:
+                        continue
+                    heapq.heappush(heap, (len(chain) + 1 + remaining, chain + (next_word,), new_mask))
+                peak_queue = max(peak_queue, len(heap))
+        finally:
+            logging.info(f"Best-first search expanded {expansions} chains")
+            self.stats["states_expanded"] = expansions
+            self.stats["peak_queue"] = peak_queue
+            self._finish_search(search_start, len(fingerprints))
+
+    def solve_best_first(self, k=20):
+        """Return the best k solutions as a list, best first"""
+        solutions = []
+        stream = self.iter_best_first()
+        for chain in stream:
+            solutions.append(chain)
+            if len(solutions) >= k:
+                stream.close()
+                self.stats["solution_capped"] = True
+                break
+
+        if len(solutions) == 0:
+            logging.warning("No solutions found, try a larger path size")
+
+        return solutions
+
+
+# Solver of a per-call solve_parallel pool, set in each worker by its
+# initializer, with the dead states the worker has proven so far
+_partition_solver = None
+_partition_dead_states = set()
+
+# PartitionPool worker state: the shared word index, and the solvers of
+# the boards this worker served most recently, oldest first
+_pool_word_index = None
+_pool_solvers = OrderedDict()
+POOL_CACHED_BOARDS = 8
+
+
+def _init_partition_worker(solver):
+    global _partition_solver, _partition_dead_states
+    _partition_solver = solver
+    _partition_dead_states = set()
+
+
+def _init_pool_worker(word_index):
+    global _pool_word_index
+    _pool_word_index = word_index
+    _pool_solvers.clear()
+
+
+def _partition_chains(solver, dead_states, start_letter, depth, max_solutions):
+    """Solutions of exactly depth words starting with start_letter"""
+    solutions = []
+    fingerprints = set()
+    for class_chain in solver._iter_depth(depth, dead_states, start_letter):
+        for chain in solver._expand_class_chain(class_chain, fingerprints):
+            solutions.append(chain)
+            if len(solutions) >= max_solutions:
+                return solutions
+    return solutions
+
+
+def _solve_partition(start_letter, depth, max_solutions):
+    return _partition_chains(
+        _partition_solver, _partition_dead_states, start_letter, depth, max_solutions)
+
+
+def _solve_board_partition(board, start_letter, depth, max_solutions):
+    """_solve_partition for a PartitionPool worker, building the board's solver once"""
+    if board in _pool_solvers:
+        _pool_solvers.move_to_end(board)
+        solver, dead_states = _pool_solvers[board]
+    else:
+        edges, max_path, use_bitmask, word_order, seed, memory_budget, state_budget = board
+        solver = GraphLetterBoxedSolver(
+            _pool_word_index, [list(edge) for edge in edges], max_path_length=max_path,
+            use_bitmask=use_bitmask, word_order=word_order, seed=seed,
+            memory_budget=memory_budget, state_budget=state_budget)
+        dead_states = set()
+        _pool_solvers[board] = (solver, dead_states)
+        while len(_pool_solvers) > POOL_CACHED_BOARDS:
+            _pool_solvers.popitem(last=False)
+    solver._start_search("parallel")
+    return _partition_chains(solver, dead_states, start_letter, depth, max_solutions)
+
+
+class PartitionPool:
+    """
+    Long-lived fork pool for solve_parallel, shared by every solve in a
+    process. Workers inherit the word index once, when the pool starts,
+    and keep the solvers of the last POOL_CACHED_BOARDS boards, so a solve
+    pays for one task per start letter and depth rather than a pool
+    start-up. It pays off on multi-core hosts for iterative deepening
+    searches that run well past those round trips: dense boards and
+    exhaustive stop_depth enumerations. Pair joins and meet-in-the-middle
+    finish in under 0.1s on 2of12 and stay serial. Raises ValueError where
+    fork is unavailable.
+    """
+
+    def __init__(self, word_index, workers=None):
+        context = multiprocessing.get_context("fork")
+        self.executor = ProcessPoolExecutor(
+            max_workers=workers, mp_context=context,
+            initializer=_init_pool_worker, initargs=(word_index,))
+
+    def shutdown(self):
+        self.executor.shutdown()
+
 
 def unique_char_count(word):
     """Count the number of unique chars in the word"""
@@ -416,16 +1681,18 @@ class SpellBeeSolver:
     """Solver Class for the NYTimes Spell Bee"""
 
     def __init__(self, list_of_words, letters):
+        # A shared WordIndex answers the letter filter with masks
+        self.word_index = None
+        if isinstance(list_of_words, WordIndex):
+            self.word_index = list_of_words
+            list_of_words = self.word_index.words
         self.word_list = list_of_words
         self.letters = letters
         self.center_letter = letters[0]
 
     def clean_word_list(self):
         """Filter word list to allow for compound words to be used"""
-        self.word_list = [
-            word.replace("-", "").replace(" ", "").replace("'", "")
-            for word in self.word_list
-        ]
+        self.word_list = [clean_word(word) for word in self.word_list]
 
     def is_valid_word(self, word):
         """Check if the current word is a valid solution"""
@@ -437,24 +1704,30 @@ class SpellBeeSolver:
 
     def score(self, word):
         """Get the Score For the word based on Spell Bee rules"""
-        if len(word) < 4:
-            return 0
-        if len(word) == 4:
-            return 1
-        return len(word) + 7 * (self.is_pangram(word))
+        return spellbee_score(len(word), self.is_pangram(word))
 
     def solve(self):
         """Solve the current Letterboxd puzzle"""
         ans = {}
-        self.clean_word_list()
-        valid_words = list(filter(self.is_valid_word, self.word_list))
-
-        for word in valid_words:
+        if self.word_index is not None:
+            scored_words = self.word_index.spellbee_scores(self.letters, self.center_letter)
+        else:
+            self.clean_word_list()
+            valid_words = list(filter(self.is_valid_word, self.word_list))
+            scored_words = [(word, self.score(word)) for word in valid_words]
+
+        pangrams = set()
+        for word, score in scored_words:
             if self.is_pangram(word):
                 print(word)
-            ans[word] = self.score(word)
+                pangrams.add(word)
+            ans[word] = score
         ans = {word: score for word, score in ans.items() if score > 0}
         ans = dict(sorted(ans.items(), key=lambda item: item[1], reverse=True))
+
+        # Puzzle totals, as shown on the NYT rankings
+        self.total_points = sum(ans.values())
+        self.pangram_count = len(pangrams & ans.keys())
         return ans
 
 
@@ -481,10 +1754,11 @@ def generate_solvable_box_edges(word_list, max_attempts=1000):
     Generate a set of random box edges that has at least one solution.
     We try generating random boards and checking if they are solvable.
     """
+    word_index = word_list if isinstance(word_list, WordIndex) else WordIndex(word_list)
     for _ in range(max_attempts):
         edges = generate_random_box_edges()
-        solver = GraphLetterBoxedSolver(word_list, edges, max_path_length=3)
-        solutions = solver.solve_bfs()
+        solver = GraphLetterBoxedSolver(word_index, edges, max_path_length=3, use_bitmask=True)
+        solutions = solver.solve_iterative_deepening(max_solutions=1)
         if solutions:
             return edges, solutions
     # Fallback
@@ -495,7 +1769,15 @@ def generate_solvable_spellbee_letters(word_list):
     """
     Generate a Spelling Bee letters string (7 letters, first is center) 
     that is guaranteed to have at least one pangram.
+    A WordIndex samples its precomputed pangram letter sets directly.
     """
+    if isinstance(word_list, WordIndex) and word_list.pangram_masks:
+        mask = random.choice(word_list.pangram_masks)
+        unique_letters = [letter for letter in string.ascii_uppercase
+                          if mask & letter_mask(letter)]
+        random.shuffle(unique_letters)
+        return "".join(unique_letters)
+
     pangram_candidates = [
         word for word in word_list 
         if len(set(word)) == 7 and word.isalpha() and len(word) >= 7
@@ -533,13 +1815,14 @@ def test_solver(todays_word, word_list):
 
 def generate_random_test_cases(max_iters, word_list):
     """Generate Some Test Cases to Check Behaviour"""
+    word_index = WordIndex(word_list)
     iterations = 0
     while True:
         iterations += 1
         box_edges = generate_random_box_edges()
 
         solver = GraphLetterBoxedSolver(
-            word_list, box_edges, max_path_length=1)
+            word_index, box_edges, max_path_length=1)
         solutions = solver.solve()
         if solutions or iterations > max_iters:
             print("Solution found after", iterations, "iterations")
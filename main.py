@@ -1,6 +1,9 @@
 import argparse
+import sys
 
+from batch import run_batch
 from letterboxd_solver import (
+    build_word_index,
     generate_random_test_cases,
     read_word_list,
     test_solver,
@@ -9,6 +12,11 @@ from letterboxd_solver import (
 
 
 def main():
+    # `python main.py bench [options]` runs the benchmark suite
+    if sys.argv[1:2] == ["bench"]:
+        import benchmark
+        sys.exit(benchmark.main(["--suite", *sys.argv[2:]]))
+
     import os
     base_dir = os.path.dirname(os.path.abspath(__file__))
     word_list_path = os.path.join(base_dir, "word_lists", "2of12.txt")
@@ -21,13 +29,14 @@ def main():
             "  python main.py --puzzle letterboxd --input TIAUWLDBYRMO\n"
             "  python main.py --puzzle spellbee --input MAWRING\n"
             "  python main.py --puzzle letterboxd --random --max-iters 100\n"
+            "  python main.py --batch boards.txt --output solutions.jsonl\n"
+            "  python main.py bench --repeat 1\n"
         ),
         formatter_class=argparse.RawTextHelpFormatter,
     )
     parser.add_argument(
         "--puzzle",
         choices=["letterboxd", "spellbee"],
-        required=True,
         help=(
             "Type of puzzle to solve:\n"
             "  - 'letterboxd': Solve the Letterboxd puzzle.\n"
@@ -61,8 +70,33 @@ def main():
         help="Maximum iterations for random test cases (default: 50000).",
     )
 
+    parser.add_argument(
+        "--batch",
+        help=(
+            "Solve every Letterboxd board in this file ('-' for stdin), one\n"
+            "'LETTERS' or 'LETTERS:max_path' per line, writing JSON Lines."
+        ),
+    )
+    parser.add_argument(
+        "--output",
+        default="-",
+        help="Where --batch writes its JSON Lines (default: stdout).",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes for --batch (default: one per CPU, 1 solves serially).",
+    )
+
     args = parser.parse_args()
 
+    if args.batch:
+        solve_batch(args, word_list)
+        return
+    if not args.puzzle:
+        parser.error("The --puzzle argument is required unless --batch is specified.")
+
     if args.puzzle == "letterboxd" and not args.random:
         if not args.input:
             parser.error(
@@ -84,5 +118,25 @@ def main():
         test_spell_bee_solver(word_list=word_list, todays_word=args.input.upper())
 
 
+def solve_batch(args, word_list):
+    """Run --batch with one word index shared by every worker"""
+    word_index = build_word_index(word_list)
+    source = sys.stdin if args.batch == "-" else open(args.batch, encoding="UTF-8")
+    out = sys.stdout if args.output == "-" else open(args.output, "w", encoding="UTF-8")
+    try:
+        summary = run_batch(source, out, word_index, workers=args.workers,
+                            default_max_path=args.max_path)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if out is not sys.stdout:
+            out.close()
+    print(
+        f"Solved {summary['boards']} boards ({summary['errors']} errors) in "
+        f"{summary['seconds']:.2f}s, {summary['boards_per_second']} boards/sec",
+        file=sys.stderr,
+    )
+
+
 if __name__ == "__main__":
     main()
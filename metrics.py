@@ -0,0 +1,89 @@
+"""Solver statistics aggregated into Prometheus text-format metrics"""
+
+import threading
+
+SECONDS_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 10, 30, 60)
+COUNT_BUCKETS = (10, 100, 1000, 10000, 100000, 1000000, 10000000)
+
+# solver.stats key -> (metric name, help text, buckets)
+HISTOGRAMS = {
+    "filter_seconds": ("letterboxed_filter_seconds", "Board word filtering time", SECONDS_BUCKETS),
+    "graph_seconds": ("letterboxed_graph_seconds", "Word and class graph build time", SECONDS_BUCKETS),
+    "search_seconds": ("letterboxed_search_seconds", "Search time", SECONDS_BUCKETS),
+    "nodes": ("letterboxed_graph_nodes", "Words on the board", COUNT_BUCKETS),
+    "edges": ("letterboxed_graph_edges", "Word graph edges", COUNT_BUCKETS),
+    "states_expanded": ("letterboxed_states_expanded", "Search states expanded", COUNT_BUCKETS),
+    "peak_queue": ("letterboxed_peak_queue", "Largest search frontier", COUNT_BUCKETS),
+    "visited": ("letterboxed_visited_states", "Visited or memoised states", COUNT_BUCKETS),
+    "solutions": ("letterboxed_solutions", "Solutions found", COUNT_BUCKETS),
+}
+
+CAPS = ("time_capped", "iteration_capped", "memory_capped", "solution_capped", "depth_first")
+
+
+class Histogram:
+    """Cumulative Prometheus histogram with fixed upper bounds"""
+
+    def __init__(self, name, help_text, buckets):
+        self.name = name
+        self.help_text = help_text
+        self.buckets = buckets
+        self.counts = {}  # engine -> per-bucket counts, +Inf last
+        self.sums = {}
+
+    def observe(self, engine, value):
+        counts = self.counts.setdefault(engine, [0] * (len(self.buckets) + 1))
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                counts[i] += 1
+        counts[-1] += 1
+        self.sums[engine] = self.sums.get(engine, 0) + value
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        for engine, counts in sorted(self.counts.items()):
+            for bound, count in zip(self.buckets, counts):
+                lines.append(f'{self.name}_bucket{{engine="{engine}",le="{bound}"}} {count}')
+            lines.append(f'{self.name}_bucket{{engine="{engine}",le="+Inf"}} {counts[-1]}')
+            lines.append(f'{self.name}_sum{{engine="{engine}"}} {self.sums[engine]}')
+            lines.append(f'{self.name}_count{{engine="{engine}"}} {counts[-1]}')
+        return lines
+
+
+class SolverMetrics:
+    """
+    Thread-safe aggregate of GraphLetterBoxedSolver.stats, labelled by
+    search engine. Each gunicorn worker keeps its own copy, so scrape
+    every worker or sum over instances.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.histograms = {
+            key: Histogram(name, help_text, buckets)
+            for key, (name, help_text, buckets) in HISTOGRAMS.items()
+        }
+        self.caps = {}  # (engine, cap) -> count
+
+    def observe(self, stats):
+        """Record one solver's stats"""
+        engine = stats.get("engine") or "none"
+        with self._lock:
+            for key, histogram in self.histograms.items():
+                if key in stats:
+                    histogram.observe(engine, stats[key])
+            for cap in CAPS:
+                if stats.get(cap):
+                    self.caps[(engine, cap)] = self.caps.get((engine, cap), 0) + 1
+
+    def render(self):
+        """Prometheus text exposition of every metric"""
+        with self._lock:
+            lines = []
+            for histogram in self.histograms.values():
+                lines.extend(histogram.render())
+            lines.append("# HELP letterboxed_capped_total Searches stopped or turned depth-first by a cap")
+            lines.append("# TYPE letterboxed_capped_total counter")
+            for (engine, cap), count in sorted(self.caps.items()):
+                lines.append(f'letterboxed_capped_total{{engine="{engine}",cap="{cap}"}} {count}')
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,148 @@
+"""Bounded LRU cache of solved puzzles, keyed by canonical board"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+
+def canonical_letterboxed_key(box_edges, max_path):
+    """
+    Cache key for a Letter Boxed board. The order of the edges and of the
+    letters within each edge does not change the solutions.
+    """
+    edges = sorted("".join(sorted(edge)) for edge in box_edges)
+    return f"letterboxed:{'|'.join(edges)}:{max_path}"
+
+
+def canonical_spellbee_key(letters):
+    """
+    Cache key for a Spelling Bee puzzle. Only the center letter is
+    positional; the order of the other letters does not matter.
+    """
+    return f"spellbee:{letters[0]}:{''.join(sorted(set(letters)))}"
+
+
+class SqliteCacheBackend:
+    """
+    Cross-worker cache storage in a local sqlite file, so every gunicorn
+    worker on the host shares warm results. Values are stored as JSON and
+    a new connection is opened per call, which keeps it safe across fork.
+    """
+
+    def __init__(self, path, ttl):
+        self.path = path
+        self.ttl = ttl
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS solutions "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=5)
+
+    def get(self, key):
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT value FROM solutions WHERE key = ? AND expires_at > ?",
+                (key, time.time()),
+            ).fetchone()
+        return None if row is None else json.loads(row[0])
+
+    def set(self, key, value):
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute("DELETE FROM solutions WHERE expires_at <= ?", (now,))
+            conn.execute(
+                "INSERT OR REPLACE INTO solutions (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, json.dumps(value), now + self.ttl),
+            )
+
+
+class SolutionCache:
+    """
+    Thread-safe LRU cache that evicts by size and by age. On a local miss
+    the optional backend is consulted and a hit is copied into memory.
+    """
+
+    def __init__(self, maxsize=256, ttl=3600, backend=None, clock=time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.backend = backend
+        self.clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.backend_hits = 0
+        self.evictions = 0
+
+    def get(self, key):
+        """Return the cached value for key, or None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > self.clock():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+                self.evictions += 1
+
+        if self.backend is not None:
+            try:
+                value = self.backend.get(key)
+            except sqlite3.Error as e:
+                logging.warning(f"Cache backend read failed: {e}")
+                value = None
+            if value is not None:
+                self._store(key, value)
+                with self._lock:
+                    self.hits += 1
+                    self.backend_hits += 1
+                return value
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def set(self, key, value):
+        """Cache value under key, in memory and in the backend"""
+        self._store(key, value)
+        if self.backend is not None:
+            try:
+                self.backend.set(key, value)
+            except sqlite3.Error as e:
+                logging.warning(f"Cache backend write failed: {e}")
+
+    def _store(self, key, value):
+        with self._lock:
+            self._entries[key] = (self.clock() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self):
+        """Hit/miss counters and occupancy"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "backend_hits": self.backend_hits,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "backend": type(self.backend).__name__ if self.backend else None,
+            }
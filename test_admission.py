@@ -0,0 +1,41 @@
+import threading
+
+import pytest
+
+from admission import AdmissionController, Overloaded
+
+
+def test_slots_limit_concurrent_solves():
+    admission = AdmissionController(max_concurrent=1, max_wait=0)
+    with admission.slot(estimated_seconds=4.2):
+        assert admission.stats()["running"] == 1
+        with pytest.raises(Overloaded) as excinfo:
+            with admission.slot():
+                pass
+        # The hint is the estimated work still holding the slots
+        assert excinfo.value.retry_after == 5
+
+    with admission.slot():
+        pass
+    stats = admission.stats()
+    assert stats["admitted"] == 2 and stats["rejected"] == 1 and stats["running"] == 0
+
+
+def test_waiting_request_gets_the_freed_slot():
+    admission = AdmissionController(max_concurrent=1, max_wait=5)
+    holding = threading.Event()
+    release = threading.Event()
+
+    def hold():
+        with admission.slot():
+            holding.set()
+            release.wait(5)
+
+    thread = threading.Thread(target=hold)
+    thread.start()
+    holding.wait(5)
+    threading.Timer(0.05, release.set).start()
+    with admission.slot():
+        assert admission.stats()["running"] == 1
+    thread.join()
+    assert admission.stats()["rejected"] == 0
@@ -0,0 +1,366 @@
+import json
+
+import pytest
+
+from app import app
+
+
+@pytest.fixture
+def client():
+    app.config["TESTING"] = True
+    with app.test_client() as client:
+        yield client
+
+
+def test_stream_letterboxed(client):
+    response = client.get("/api/stream/letterboxed?letters=TIAUWLDBYRMO&max_path=3&limit=5")
+    assert response.status_code == 200
+    assert response.mimetype == "application/x-ndjson"
+
+    lines = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    chains = [line["chain"] for line in lines[:-1]]
+    assert len(chains) == 5
+    assert lines[-1]["done"] and lines[-1]["count"] == 5
+
+    # Shortest chains come first
+    lengths = [len(chain) for chain in chains]
+    assert lengths == sorted(lengths)
+    for chain in chains:
+        assert set("".join(chain)) == set("TIAUWLDBYRMO")
+
+
+def test_stream_letterboxed_rejects_bad_letters(client):
+    for letters in ["TIAUWLDBYRM", "TIAUWLDBYRM1", "TIAUWLDBYR M"]:
+        response = client.get(f"/api/stream/letterboxed?letters={letters}")
+        assert response.status_code == 400
+
+
+def test_stream_letterboxed_best_first(client, monkeypatch):
+    from app import sort_letterboxed_solutions
+
+    response = client.get(
+        "/api/stream/letterboxed?letters=TIAUWLDBYRMO&max_path=3&limit=20&order=best"
+    )
+    lines = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    chains = [line["chain"] for line in lines[:-1]]
+    assert len(chains) == 20
+    assert chains == sort_letterboxed_solutions(chains)
+
+    # The search itself stops at SOLVER_TIMEOUT, even before a first solution
+    monkeypatch.setattr("app.SOLVER_TIMEOUT", 0)
+    response = client.get("/api/stream/letterboxed?letters=RPLDIWQUKECA&max_path=6&order=best")
+    lines = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert lines == [lines[-1]] and lines[-1]["stats"]["time_capped"]
+
+
+def test_stream_letterboxed_admission(client, monkeypatch):
+    from admission import AdmissionController
+
+    admission = AdmissionController(max_concurrent=1, max_wait=0)
+    monkeypatch.setattr("app.admission", admission)
+
+    # A stream holds its slot until the response is closed
+    response = client.get("/api/stream/letterboxed?letters=TIAUWLDBYRMO&max_path=3&limit=5")
+    assert admission.stats()["running"] == 1
+    response.get_data()
+    assert admission.stats()["running"] == 0
+
+    # ...or if the client goes away before reading it
+    response = client.get("/api/stream/letterboxed?letters=TIAUWLDBYRMO&max_path=3&limit=5")
+    response.close()
+    assert admission.stats()["running"] == 0
+
+    # With every slot busy, the stream is turned away like a solve
+    with admission.slot(estimated_seconds=3):
+        response = client.get("/api/stream/letterboxed?letters=TIAUWLDBYRMO&max_path=3")
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "3"
+
+    # max_path is lowered until the estimate fits, as for solves
+    response = client.get("/api/stream/letterboxed?letters=IVRTAMQEWGNY&max_path=10&limit=1")
+    lines = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert lines[-1]["done"]
+    response.close()
+    stats = admission.stats()
+    assert (stats["admitted"], stats["rejected"], stats["running"]) == (4, 1, 0)
+
+
+def test_metrics_after_stream(client):
+    response = client.get("/api/stream/letterboxed?letters=TIAUWLDBYRMO&max_path=3&limit=5")
+    done = json.loads(response.get_data(as_text=True).splitlines()[-1])
+    assert done["stats"]["engine"] == "iterative_deepening"
+    assert done["stats"]["nodes"] > 0
+
+    response = client.get("/metrics")
+    assert response.mimetype == "text/plain"
+    text = response.get_data(as_text=True)
+    assert 'letterboxed_search_seconds_count{engine="iterative_deepening"}' in text
+
+
+def test_stream_letterboxed_rejects_bad_board(client):
+    response = client.get("/api/stream/letterboxed?letters=ABC")
+    assert response.status_code == 400
+
+
+def test_random_letterboxed_uses_board_index(client):
+    response = client.get("/api/random_letterboxed?vowels=4&difficulty=easy")
+    letters = response.get_json()["letters"]
+    assert len(letters) == 12
+    assert sum(letter in "AEIOU" for letter in letters) == 4
+
+
+def test_letterboxed_results_are_cached(client):
+    from app import solution_cache
+
+    form = {"game_type": "letterboxed", "letters": "TIAUWLDBYRMO", "max_path": "3"}
+    hits = solution_cache.stats()["hits"]
+    assert client.post("/", data=form).status_code == 200
+
+    # Same board with the edges and letters reordered
+    form["letters"] = "ORMUWLTIAYBD"
+    assert client.post("/", data=form).status_code == 200
+    assert solution_cache.stats()["hits"] == hits + 1
+    assert client.get("/api/cache_stats").get_json()["hits"] == hits + 1
+
+
+def test_warmup_and_ready(client, monkeypatch):
+    import app as app_module
+    from app import parse_warmup_boards, solution_cache, warmup
+
+    monkeypatch.setattr(app_module, "warmup_state", {"ready": False})
+    assert client.get("/ready").status_code == 503
+
+    assert parse_warmup_boards("tiauwldbyrmo:2, ABC ,GIYHUOTWNRAL") == [
+        ("TIAUWLDBYRMO", 2), ("GIYHUOTWNRAL", 3)]
+    warmup(boards=[("TIAUWLDBYRMO", 2)], spellbee_puzzles=["MAWRING"], freeze=False)
+
+    response = client.get("/ready")
+    assert response.status_code == 200
+    assert response.get_json()["boards"] == 1
+    assert solution_cache.get("letterboxed:AIT|BDY|LUW|MOR:2") is not None
+
+
+def test_warmup_then_fork_starts_pool_in_worker(monkeypatch):
+    import os
+    import signal
+
+    import app as app_module
+    from app import solve_letterboxed, warmup
+
+    # A preloading master warms up without starting the partition pool
+    monkeypatch.setattr(app_module, "PARALLEL_SOLVE_WORKERS", 2)
+    monkeypatch.setattr(app_module, "partition_pool", None)
+    monkeypatch.setattr(app_module, "warmup_state", {"ready": False})
+    warmup(boards=[("SLDCNTAIUBEM", 3)], spellbee_puzzles=[], freeze=False)
+    assert app_module.partition_pool is None
+
+    # Pair joins and meet-in-the-middle never start it either
+    box_edges = [list("CNBIAERTMGYO"[i : i + 3]) for i in range(0, 12, 3)]
+    for max_path in (2, 4):
+        solve_letterboxed(box_edges, max_path)
+    assert app_module.partition_pool is None
+
+    # A forked worker starts its own pool on its first solve
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        status = 1
+        try:
+            signal.alarm(60)
+            box_edges = [list("ATERSIGDMNOY"[i : i + 3]) for i in range(0, 12, 3)]
+            count = len(solve_letterboxed(box_edges, 3))
+            os.write(write_fd, str(count).encode())
+            app_module.partition_pool.shutdown()
+            status = 0
+        finally:
+            os._exit(status)
+
+    os.close(write_fd)
+    _, status = os.waitpid(pid, 0)
+    count = os.read(read_fd, 16)
+    os.close(read_fd)
+    assert os.waitstatus_to_exitcode(status) == 0
+    assert int(count) > 0
+
+
+def test_solve_letterboxed_api_pages(client):
+    from app import solve_letterboxed
+
+    # No two-word solutions, so the three-word result spans several pages
+    url = "/api/solve/letterboxed?letters=RBOILKYUATNE&max_path=3&limit=100"
+    pages = [client.get(url).get_json()]
+    while pages[-1]["next_cursor"]:
+        pages.append(client.get(f"{url}&cursor={pages[-1]['next_cursor']}").get_json())
+
+    solutions = [chain for page in pages for chain in page["solutions"]]
+    box_edges = [list("RBO"), list("ILK"), list("YUA"), list("TNE")]
+    assert solutions == solve_letterboxed(box_edges, 3)
+    assert len(pages) > 1 and pages[0]["count"] == len(solutions)
+
+    other = "/api/solve/letterboxed?letters=SVTGLREOIKAM&max_path=3"
+    assert client.get(f"{other}&cursor={pages[0]['next_cursor']}").status_code == 400
+    assert client.get(f"{other}&cursor=garbage").status_code == 400
+
+
+def test_solve_spellbee_api_pages(client):
+    first = client.get("/api/solve/spellbee?letters=MAWRING&limit=10").get_json()
+    assert len(first["words"]) == 10 and first["count"] == 30
+    scores = [score for _, score in first["words"]]
+    assert scores == sorted(scores, reverse=True)
+
+    rest = client.get(f"/api/solve/spellbee?letters=MAWRING&limit=500&cursor={first['next_cursor']}")
+    assert len(rest.get_json()["words"]) == 20
+    assert rest.get_json()["next_cursor"] is None
+
+
+def test_result_page_renders_first_page(client):
+    response = client.post("/", data={"game_type": "letterboxed", "letters": "RBOILKYUATNE",
+                                      "max_path": "3"})
+    html = response.get_data(as_text=True)
+    assert html.count('class="result-item"') == 100
+    assert 'id="loadMore"' in html and "/api/solve/letterboxed?letters=RBOILKYUATNE" in html
+
+
+def test_solve_batch_api(client):
+    response = client.post(
+        "/api/solve/batch?max_path=2", data="TIAUWLDBYRMO\nORACTLJSXNIU:3\nBAD\n"
+    )
+    assert response.status_code == 200
+    assert response.mimetype == "application/x-ndjson"
+    lines = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert [line.get("max_path") for line in lines[:2]] == [2, 3]
+    assert "error" in lines[2]
+    assert lines[-1]["done"] and lines[-1]["boards"] == 3 and lines[-1]["errors"] == 1
+
+    response = client.post("/api/solve/batch", json={"boards": ["TIAUWLDBYRMO"], "max_path": 2})
+    lines = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert lines[0]["count"] > 0 and lines[-1]["boards"] == 1
+
+
+def test_solve_batch_api_admission(client, monkeypatch):
+    from admission import AdmissionController
+    from app import solution_cache
+    from solution_cache import canonical_letterboxed_key
+
+    # Batch boards are cached like single solves
+    client.post("/api/solve/batch?max_path=2", data="GIYHUOTWNRAL\n").get_data()
+    box_edges = [list("GIYHUOTWNRAL"[i : i + 3]) for i in range(0, 12, 3)]
+    assert solution_cache.get(canonical_letterboxed_key(box_edges, 2)) is not None
+
+    # With every slot busy, cached boards are still answered and the others
+    # get an error line
+    admission = AdmissionController(max_concurrent=1, max_wait=0)
+    monkeypatch.setattr("app.admission", admission)
+    with admission.slot():
+        response = client.post("/api/solve/batch?max_path=2", data="GIYHUOTWNRAL\nCYMLOAEBRNTK\n")
+        lines = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert lines[0]["count"] > 0
+    assert "error" in lines[1]
+    assert lines[-1]["errors"] == 1
+
+
+def test_solve_batch_api_limits(client, monkeypatch):
+    monkeypatch.setattr("app.MAX_BATCH_BOARDS", 2)
+    assert client.post("/api/solve/batch", data="A\nB\nC\n").status_code == 413
+    assert client.post("/api/solve/batch", data="\n# nothing\n").status_code == 400
+    assert client.post("/api/solve/batch", json={"boards": "ABC"}).status_code == 400
+
+
+def test_long_solves_run_as_jobs(client):
+    import time
+
+    response = client.get("/api/solve/letterboxed?letters=PLANETSCRIBO&max_path=6")
+    assert response.status_code == 202
+    job = response.get_json()
+    assert job["params"] == {"letters": "PLANETSCRIBO", "max_path": 6}
+    assert response.headers["Location"] == job["status_url"]
+
+    for _ in range(200):
+        status = client.get(f"{job['status_url']}?limit=5").get_json()
+        if status["status"] not in ("queued", "running"):
+            break
+        time.sleep(0.02)
+    assert status["status"] == "done"
+    assert status["progress"]["stats"]["engine"] == "meet_in_middle"
+    assert len(status["solutions"]) == min(5, status["count"])
+
+    # The job cached its result, so the next request is answered inline
+    response = client.get("/api/solve/letterboxed?letters=PLANETSCRIBO&max_path=6&limit=5")
+    assert response.status_code == 200
+    assert response.get_json()["solutions"] == status["solutions"]
+    assert client.get("/api/jobs/unknown").status_code == 404
+
+    # Another worker that never saw the job answers from the shared cache
+    from app import job_queue, solution_cache
+
+    with job_queue._cond:
+        job_queue._finished.pop(job["job_id"])
+        job_queue._jobs.pop(job["job_id"])
+    submitted = job_queue.submitted
+    status = client.get(f"{job['status_url']}?limit=5").get_json()
+    assert status["job_id"] == job["job_id"] == "letterboxed-ALP-BIO-CRS-ENT-6"
+    assert status["status"] == "done"
+    assert status["solutions"] == response.get_json()["solutions"]
+
+    # An in-progress job is reported from its record, and an unknown one
+    # must be resubmitted; neither is solved by the polled worker
+    job_id = "letterboxed-ABC-DEF-GHI-JKL-9"
+    assert client.get(f"/api/jobs/{job_id}").status_code == 404
+    solution_cache.set(f"job:{job_id}", {"status": "queued", "updated_at": time.time()})
+    response = client.get(f"/api/jobs/{job_id}")
+    assert response.status_code == 200
+    status = response.get_json()
+    assert status["status"] == "queued"
+    # The page shows a generic message for the fields only the holder knows
+    assert status["position"] is None and status["run_seconds"] is None
+    assert job_queue.submitted == submitted
+
+
+def test_job_queue_full(client, monkeypatch):
+    from jobs import QueueFull
+
+    def full(*args, **kwargs):
+        raise QueueFull("full")
+
+    monkeypatch.setattr("app.job_queue.submit", full)
+    response = client.post("/api/jobs/letterboxed", data={"letters": "TIAUWLDBYRMO", "max_path": 3})
+    assert response.status_code == 429
+    assert "Retry-After" in response.headers
+
+
+def test_result_page_polls_long_solve(client):
+    form = {"game_type": "letterboxed", "letters": "RBOILKYUATNE", "max_path": "7"}
+    html = client.post("/", data=form).get_data(as_text=True)
+    assert 'id="jobStatus"' in html
+    assert "/api/jobs/" in html
+
+
+def test_admission_control(client, monkeypatch):
+    from admission import AdmissionController
+
+    # With the default limits, a dense board is solved inline, a sparse one
+    # over the inline estimate is queued, and a sparse board at max_path 10
+    # has max_path lowered until the estimate fits
+    response = client.get("/api/solve/letterboxed?letters=NTCHIESWRADO&max_path=3")
+    assert response.status_code == 200
+    assert response.get_json()["max_path"] == 3
+
+    response = client.get("/api/solve/letterboxed?letters=RPLDIWQUKECA&max_path=4")
+    assert response.status_code == 202
+    assert response.get_json()["params"]["max_path"] == 4
+
+    response = client.get("/api/solve/letterboxed?letters=IVRTAMQEWGNY&max_path=10")
+    assert response.status_code == 202
+    assert response.get_json()["params"]["max_path"] < 10
+
+    # With every slot busy, uncached solves are turned away with a hint
+    admission = AdmissionController(max_concurrent=1, max_wait=0)
+    monkeypatch.setattr("app.admission", admission)
+    with admission.slot(estimated_seconds=3):
+        response = client.get("/api/solve/letterboxed?letters=TWINSLEAGDRY&max_path=2")
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "3"
+
+        form = {"game_type": "letterboxed", "letters": "TWINSLEAGDRY", "max_path": "2"}
+        assert client.post("/", data=form).status_code == 503
+    assert client.get("/api/admission_stats").get_json()["rejected"] == 2
@@ -0,0 +1,50 @@
+import io
+import json
+
+import pytest
+
+from batch import parse_board, run_batch, solve_board
+from letterboxd_solver import build_word_index, read_word_list
+
+BOARDS = ["TIAUWLDBYRMO", "# comment", "", "orActljsxniu:2", "SHORT", "RBOILKYUATNE:x"]
+
+
+@pytest.fixture(scope="module")
+def word_index():
+    return build_word_index(read_word_list("word_lists/2of12.txt"))
+
+
+def test_parse_board():
+    assert parse_board("tiauwldbyrmo\n") == ("TIAUWLDBYRMO", 3)
+    assert parse_board("TIAUWLDBYRMO:4", default_max_path=2) == ("TIAUWLDBYRMO", 4)
+    assert parse_board("TIAUWLDBYRMO:x") == ("TIAUWLDBYRMO", None)
+    assert parse_board("  ") is None
+    assert parse_board("# boards") is None
+
+
+def test_solve_board_errors(word_index):
+    assert "error" in solve_board(("SHORT", 3), word_index)
+    assert "error" in solve_board(("TIAUWLDBYRMO", None), word_index)
+    assert "error" in solve_board(("TIAUWLDBYRMO", 11), word_index)
+
+
+def test_run_batch_pool_matches_serial(word_index):
+    outputs = []
+    for workers in (1, 2):
+        out = io.StringIO()
+        summary = run_batch(BOARDS, out, word_index, workers=workers, max_solutions=10)
+        assert summary["done"] and summary["boards"] == 4 and summary["errors"] == 2
+        lines = [json.loads(line) for line in out.getvalue().splitlines()]
+        for line in lines:
+            line.pop("solve_time", None)
+        outputs.append(lines[:-1])
+
+    serial, pooled = outputs
+    assert serial == pooled
+    assert [line["letters"] for line in serial] == [
+        "TIAUWLDBYRMO", "ORACTLJSXNIU", "SHORT", "RBOILKYUATNE"
+    ]
+    assert serial[1]["max_path"] == 2
+    for line in serial[:2]:
+        assert 0 < line["count"] <= 10
+        assert all(set("".join(chain)) == set(line["letters"]) for chain in line["solutions"])
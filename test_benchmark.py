@@ -0,0 +1,33 @@
+from benchmark import compare_to_baseline, run_suite
+
+
+def test_run_suite_times_every_stage(tmp_path):
+    word_file = tmp_path / "words.txt"
+    word_file.write_text("ACEG\nGBHD\nDFCA\nHAGE\nMAWRING\nWARMING\n")
+
+    results = run_suite(boards=["ABCDEFGHIJKL"], max_paths=(2, 3), spellbee_puzzles=["MAWRING"],
+                        repeat=1, word_list_path=str(word_file), handlers=False)
+
+    for name in ("load_word_list", "build_word_index", "build_graph/ABCDEFGHIJKL",
+                 "solve/ABCDEFGHIJKL/2", "solve_bfs/ABCDEFGHIJKL/3", "spellbee/MAWRING",
+                 "random_letterboxed", "random_spellbee"):
+        assert results[name]["seconds"] >= 0
+    assert results["spellbee/MAWRING"]["solutions"] == 2
+
+
+def test_compare_to_baseline():
+    baseline = {
+        "fast": {"seconds": 0.001},
+        "steady": {"seconds": 1.0, "solutions": 10},
+        "slow": {"seconds": 1.0},
+        "changed": {"seconds": 1.0, "solutions": 10},
+    }
+    results = {
+        "fast": {"seconds": 0.003},  # 3x slower but under the noise floor
+        "steady": {"seconds": 1.1, "solutions": 10},
+        "slow": {"seconds": 1.5},
+        "changed": {"seconds": 1.0, "solutions": 9},
+        "new": {"seconds": 5.0},
+    }
+
+    assert [name for name, _, _ in compare_to_baseline(results, baseline)] == ["slow", "changed"]
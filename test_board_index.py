@@ -0,0 +1,55 @@
+import random
+
+from board_index import (
+    BoardIndex,
+    _assign_edges,
+    build_board_index,
+    difficulty_for,
+    write_board_index,
+)
+from letterboxd_solver import GraphLetterBoxedSolver, WordIndex
+
+
+def test_difficulty_for():
+    assert difficulty_for(50) == "easy"
+    assert difficulty_for(5) == "medium"
+    assert difficulty_for(1) == "hard"
+
+
+def test_assign_edges_separates_adjacent_letters():
+    letters = set("ABCDEFGHIJKL")
+    pairs = set(zip("ABCDEFGHIJKL", "BCDEFGHIJKLA"))
+    edges = _assign_edges(letters, pairs, random.Random(0))
+
+    assert sorted(len(edge) for edge in edges) == [3, 3, 3, 3]
+    assert set("".join("".join(edge) for edge in edges)) == letters
+    for first, second in pairs:
+        assert not any(first in edge and second in edge for edge in edges)
+
+
+def test_build_board_index_boards_are_solvable(tmp_path):
+    words = ["PLANKS", "SHOWCARD", "SUBJECT", "TYPO", "QUIZ", "ZEBRA", "BLIND", "DOGMA"]
+    word_index = WordIndex(words + ["JUMBLE", "EXIT", "TOWNSHIP"])
+    rows = build_board_index(word_index, count=3, seed=1)
+
+    assert rows
+    for letters, vowels, pair_count in rows:
+        edges = [list(letters[i: i + 3]) for i in range(0, 12, 3)]
+        solver = GraphLetterBoxedSolver(word_index, edges, max_path_length=2)
+        assert len(solver.solve_pairs()) == pair_count >= 1
+        assert vowels == sum(letter in "AEIOU" for letter in letters)
+
+    path = tmp_path / "boards.txt"
+    write_board_index(rows, path)
+    board_index = BoardIndex.load(path)
+    assert len(board_index) == len(rows)
+
+
+def test_board_index_sample_filters_buckets():
+    board_index = BoardIndex([("TIAUWLDBYRMO", 4, 2), ("ABCDEFGHIJKL", 3, 40)])
+
+    assert board_index.sample(vowels=3) == [list("ABC"), list("DEF"), list("GHI"), list("JKL")]
+    assert board_index.sample(difficulty="hard") == [
+        list("TIA"), list("UWL"), list("DBY"), list("RMO")]
+    assert board_index.sample(vowels=5) is None
+    assert board_index.sample() is not None
@@ -0,0 +1,45 @@
+import pytest
+
+from compiled_dictionary import CompiledDictionary, compile_word_list, load_word_index
+from letterboxd_solver import WordIndex
+
+WORDS = ["MAWRING", "WARMING", "ACE-G", "GBHD", "", "X'Y", "ABALONE"]
+
+
+def test_compiled_dictionary_round_trip(tmp_path):
+    filename = tmp_path / "words.dict"
+    compile_word_list(WORDS, filename)
+    dictionary = CompiledDictionary(filename)
+
+    reference = WordIndex(WORDS)
+    assert len(dictionary) == len(WORDS)
+    assert dictionary.words() == reference.words
+    assert dictionary.word(2) == "ACEG"
+    assert list(dictionary.masks) == reference.masks
+    assert dictionary.bigram_masks() == reference.bigram_masks
+    assert bytes(dictionary.first_letters) == b"MWAG\x00XA"
+    assert bytes(dictionary.last_letters) == b"GGGD\x00YE"
+
+
+@pytest.mark.parametrize("use_numpy", [False, True])
+def test_load_word_index_matches_word_list(tmp_path, use_numpy):
+    if use_numpy:
+        pytest.importorskip("numpy")
+    filename = tmp_path / "words.dict"
+    compile_word_list(WORDS, filename)
+
+    index = load_word_index(filename, use_numpy=use_numpy)
+    reference = WordIndex(WORDS)
+    assert index.words == reference.words
+    assert index.pangram_masks == reference.pangram_masks
+    box_edges = [["M", "A", "W"], ["R", "I", "N"], ["G", "C", "E"], ["B", "H", "D"]]
+    assert index.board_words(box_edges) == reference.board_words(box_edges)
+    assert index.spellbee_scores(list("MAWRING"), "M") == \
+        reference.spellbee_scores(list("MAWRING"), "M")
+
+
+def test_compiled_dictionary_rejects_other_files(tmp_path):
+    filename = tmp_path / "words.txt"
+    filename.write_bytes(b"AARDVARK\nABALONE\nZYMURGY\n")
+    with pytest.raises(ValueError):
+        CompiledDictionary(filename)
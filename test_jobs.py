@@ -0,0 +1,85 @@
+import threading
+
+import pytest
+
+from jobs import DONE, FAILED, QUEUED, JobQueue, QueueFull
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def wait_for(queue, job):
+    for _ in range(200):
+        if queue.get(job.id).finished:
+            return
+        threading.Event().wait(0.01)
+    raise AssertionError(f"job {job.id} did not finish")
+
+
+def test_job_runs_and_reports_progress():
+    queue = JobQueue(workers=1)
+
+    def solve(job):
+        job.progress["stage"] = "solving"
+        return [["WORD"]]
+
+    job = queue.submit("test", {"n": 1}, solve)
+    wait_for(queue, job)
+    info = queue.describe(job)
+    assert info["status"] == DONE and info["progress"] == {"stage": "solving"}
+    assert info["params"] == {"n": 1} and info["run_seconds"] is not None
+    assert job.result == [["WORD"]]
+    assert queue.stats()["submitted"] == 1
+
+
+def test_failed_job_keeps_error():
+    queue = JobQueue(workers=1)
+    job = queue.submit("test", {}, lambda job: 1 / 0)
+    wait_for(queue, job)
+    assert job.status == FAILED and "division" in queue.describe(job)["error"]
+    assert queue.stats()["failed"] == 1
+
+
+def test_queue_bound_and_job_ids():
+    release = threading.Event()
+    queue = JobQueue(workers=1, max_queued=2)
+    running = queue.submit("test", {}, lambda job: release.wait(5), job_id="a")
+    for _ in range(200):
+        if queue.stats()["running"]:
+            break
+        threading.Event().wait(0.01)
+
+    queued = queue.submit("test", {}, lambda job: None, job_id="b")
+    assert queue.submit("test", {}, lambda job: None, job_id="b") is queued
+    assert queue.submit("test", {}, lambda job: None, job_id="a") is running
+    assert queue.describe(queued)["status"] == QUEUED
+    assert queue.describe(queued)["position"] == 1
+    queue.submit("test", {}, lambda job: None)
+    with pytest.raises(QueueFull):
+        queue.submit("test", {}, lambda job: None)
+    assert queue.stats()["rejected"] == 1
+
+    release.set()
+    wait_for(queue, queued)
+    # A retained job is returned for its ID rather than solved again
+    assert queue.submit("test", {}, lambda job: None, job_id="b") is queued
+
+
+def test_finished_jobs_are_evicted():
+    clock = FakeClock()
+    queue = JobQueue(workers=1, retention=60, max_retained=2, clock=clock)
+    jobs = [queue.submit("test", {}, lambda job: None) for _ in range(3)]
+    # One worker runs jobs in order, so the last one finishes last
+    wait_for(queue, jobs[-1])
+    # Only the two most recent finished jobs are kept
+    assert queue.get(jobs[0].id) is None
+    assert queue.get(jobs[2].id) is jobs[2]
+
+    clock.now = 61
+    assert queue.get(jobs[2].id) is None
+    assert queue.stats()["retained"] == 0
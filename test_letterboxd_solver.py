@@ -1,6 +1,7 @@
 import pytest
 from collections import defaultdict
 import os
+import threading
 from typing import List, Set, Dict, Tuple
 
 # filepath: /Users/dhruvcharan/code/Letterboxdsolver-django/test_letterboxd_solver.py
@@ -10,7 +11,17 @@ from letterboxd_solver import (
     read_word_list,
     is_valid_word,
     filter_valid_words,
-    GraphLetterBoxedSolver
+    GraphLetterBoxedSolver,
+    PartitionPool,
+    SpellBeeSolver,
+    WordGraph,
+    WordIndex,
+    NumpyWordIndex,
+    build_word_index,
+    generate_random_box_edges,
+    letter_mask,
+    bigram_mask,
+    solution_sort_key,
 )
 
 # Test fixtures
@@ -32,6 +43,10 @@ def small_box_edges():
         ["G", "H"]
     ]
 
+@pytest.fixture
+def small_word_list():
+    return ["ACEG", "GBHD", "DFCA", "ACEGAH", "HBDF", "HAGE", "EDFB"]
+
 @pytest.fixture
 def simple_word_list():
     return ["ABC", "CAT", "BAT", "DOG", "CLAW", "LAMB", "BIKE", "EGG", "FIG", "HAT", "JOB"]
@@ -105,7 +120,7 @@ def test_init(simple_solver, simple_box_edges):
         assert is_valid_word(word, simple_box_edges)
     
     # Test that the graph was built
-    assert isinstance(simple_solver.graph, defaultdict)
+    assert isinstance(simple_solver.graph, WordGraph)
     
     # Test that the letters set is populated
     assert isinstance(simple_solver.letters, set)
@@ -138,6 +153,21 @@ def test_build_graph(simple_word_list, simple_box_edges):
                 assert word2 not in graph[word1], f"{word2} should not be connected to {word1}"
 
 
+def test_word_graph_shares_neighbour_lists():
+    """Test that the implicit graph matches the explicit edges and orders them by coverage"""
+    words = ["ACEG", "GBHD", "GAH", "GHAG", "DFCA", "AH", "HBDF", "HAGE", "HAG"]
+    graph = WordGraph(words)
+
+    for word in words:
+        assert sorted(graph[word]) == sorted(
+            other for other in words if other != word and other[0] == word[-1])
+    assert graph["ACEG"] == ["GBHD", "GAH", "GHAG"]
+    assert graph["GHAG"] == ["GBHD", "GAH"]
+    # Words ending in the same letter share one list
+    assert graph["ACEG"] is graph["HAG"]
+    assert len(graph) == len(words)
+
+
 def test_all_letters_used(simple_solver):
     # Test with all letters
     all_letters = simple_solver.letters
@@ -335,3 +365,515 @@ def test_no_solution_case():
     # No solutions should be found
     assert len(solver.solve()) == 0
     assert len(solver.solve_bfs()) == 0
+
+
+def word_sets(solutions):
+    return {frozenset(solution) for solution in solutions}
+
+
+def test_bitmask_masks(small_box_edges):
+    """Test that bitmask mode assigns one bit per board letter"""
+    words = ["ACEG", "GBHD", "DFCA"]
+
+    solver = GraphLetterBoxedSolver(words, small_box_edges, max_path_length=3, use_bitmask=True)
+
+    assert solver.full_mask == 0b11111111
+    assert solver.word_masks["ACEG"] == solver.letter_bits["A"] | solver.letter_bits["C"] \
+        | solver.letter_bits["E"] | solver.letter_bits["G"]
+    assert solver._all_letters_used(solver.full_mask)
+    assert not solver._all_letters_used(solver.word_masks["ACEG"] | solver.word_masks["GBHD"])
+
+
+def test_bitmask_matches_set_search(small_box_edges):
+    """Test that every search gives the same answers in set and bitmask mode"""
+    words = ["ACEG", "GBHD", "DFCA", "AH", "HBDF", "FACE", "EGAD"]
+
+    set_solver = GraphLetterBoxedSolver(words, small_box_edges, max_path_length=3)
+    mask_solver = GraphLetterBoxedSolver(words, small_box_edges, max_path_length=3,
+                                         use_bitmask=True)
+
+    # Rotations of a chain are deduplicated in shuffled word order, so compare word sets
+    assert word_sets(set_solver.solve()) == word_sets(mask_solver.solve())
+    assert word_sets(set_solver.solve_bfs()) == word_sets(mask_solver.solve_bfs())
+    assert word_sets(set_solver._bfs("ACEG")) == word_sets(mask_solver._bfs("ACEG"))
+
+
+def test_word_classes(small_box_edges):
+    """Test that words with equal first letter, last letter and mask share a class"""
+    words = ["ACEG", "AECG", "GBHD", "DFCA"]
+
+    solver = GraphLetterBoxedSolver(words, small_box_edges, max_path_length=3)
+
+    assert len(solver.word_classes) == 3
+    key = ("A", "G", solver.word_masks["ACEG"])
+    assert sorted(solver.word_classes[key]) == ["ACEG", "AECG"]
+    assert solver.class_graph[key] == [("G", "D", solver.word_masks["GBHD"])]
+
+
+def test_class_search_expands_interchangeable_words(small_box_edges):
+    """Test that the class search expands every interchangeable word"""
+    words = ["ACEG", "AECG", "GBHD", "DFCA"]
+
+    solver = GraphLetterBoxedSolver(words, small_box_edges, max_path_length=3)
+    solutions = solver.solve_iterative_deepening()
+
+    assert word_sets(solutions) == {
+        frozenset(["ACEG", "GBHD", "DFCA"]),
+        frozenset(["AECG", "GBHD", "DFCA"]),
+    }
+    for solution in solutions:
+        assert len(solution) <= solver.max_path_length
+        for i in range(len(solution) - 1):
+            assert solution[i][-1] == solution[i + 1][0]
+        assert set("".join(solution)) == solver.letters
+
+
+def test_solve_pairs(small_box_edges):
+    """Test that the pair join finds every one and two word solution"""
+    words = ["ACEG", "GBHD", "DFCA", "ACEGAH", "HBDF", "ACEGAD", "DBHF", "BDFHACEG"]
+
+    solver = GraphLetterBoxedSolver(words, small_box_edges, max_path_length=2)
+    solutions = solver.solve_pairs()
+
+    assert solutions == {
+        ("ACEGAH", "HBDF"),
+        ("ACEGAD", "DBHF"),
+        ("BDFHACEG",),
+    }
+    assert word_sets(solutions) == word_sets(solver.solve_bfs())
+
+
+def test_solve_iterative_deepening(small_box_edges, small_word_list):
+    """Test that iterative deepening stops at the shortest solved depth"""
+
+    solver = GraphLetterBoxedSolver(small_word_list, small_box_edges, max_path_length=4)
+
+    shortest = solver.solve_iterative_deepening()
+    assert word_sets(shortest) == {frozenset(["ACEGAH", "HBDF"])}
+
+    # With stop_depth the search continues until that depth is exhausted
+    up_to_three = solver.solve_iterative_deepening(stop_depth=3)
+    assert {len(chain) for chain in up_to_three} == {2, 3}
+    assert word_sets(up_to_three) == word_sets(
+        GraphLetterBoxedSolver(small_word_list, small_box_edges, max_path_length=3).solve_bfs()
+    )
+
+
+def test_solve_iterative_deepening_respects_max_path(small_box_edges):
+    """Test that stop_depth never exceeds max_path_length"""
+    words = ["ACEG", "GBHD", "DFCA"]
+
+    solver = GraphLetterBoxedSolver(words, small_box_edges, max_path_length=2)
+    assert len(solver.solve_iterative_deepening(stop_depth=5)) == 0
+
+    solver = GraphLetterBoxedSolver(words, small_box_edges, max_path_length=3)
+    assert word_sets(solver.solve_iterative_deepening()) == {frozenset(words)}
+
+
+def test_solve_meet_in_middle(small_box_edges):
+    """Test that meet-in-the-middle joins halves into the shortest chains"""
+    words = ["AC", "CE", "EG", "GB", "BD", "DF", "FH", "HA"]
+
+    solver = GraphLetterBoxedSolver(words, small_box_edges, max_path_length=10)
+    solutions = solver.solve_meet_in_middle()
+
+    # Every rotation of the 8 word cycle that covers all letters in 7 words
+    assert len(solutions) == 8
+    assert {len(chain) for chain in solutions} == {7}
+    assert word_sets(solutions) == word_sets(solver.solve_iterative_deepening())
+    for solution in solutions:
+        for i in range(len(solution) - 1):
+            assert solution[i][-1] == solution[i + 1][0]
+        assert set("".join(solution)) == solver.letters
+
+
+def test_solve_meet_in_middle_join_deadline(monkeypatch, small_box_edges):
+    """Test that the time limit is checked between joins, not only per length"""
+    import letterboxd_solver
+
+    words = ["AC", "CE", "EG", "GB", "BD", "DF", "FH", "HA"]
+    solver = GraphLetterBoxedSolver(words, small_box_edges, max_path_length=10)
+
+    # The clock jumps past the limit during the first join that matches
+    clock = [0.0]
+    join_masks = solver._join_masks
+
+    def slow_join(forward_mask, backward_states):
+        matches = join_masks(forward_mask, backward_states)
+        if matches:
+            clock[0] = 100.0
+        return matches
+
+    monkeypatch.setattr(letterboxd_solver.time, "time", lambda: clock[0])
+    monkeypatch.setattr(solver, "_join_masks", slow_join)
+    solutions = solver.solve_meet_in_middle(time_limit=10)
+    assert len(solutions) == 1
+    assert solver.stats["time_capped"]
+
+
+def test_solve_meet_in_middle_matches_iterative_deepening(small_box_edges):
+    """Test meet-in-the-middle against iterative deepening for every length"""
+    words = ["ACEG", "GBHD", "DFCA", "HAGE", "EDFB", "BHAC", "CGAD"]
+
+    for max_path in range(1, 5):
+        solver = GraphLetterBoxedSolver(words, small_box_edges, max_path_length=max_path)
+        assert word_sets(solver.solve_meet_in_middle()) == \
+            word_sets(solver.solve_iterative_deepening())
+
+
+def test_join_masks(small_box_edges):
+    """Test that both join strategies return the completing backward states"""
+    solver = GraphLetterBoxedSolver(["ACEG"], small_box_edges)
+
+    backward_states = {mask: ("A", mask) for mask in range(256)}
+    forward_mask = 0b00001111
+    expected = sorted(("A", 0b11110000 | low) for low in range(16))
+
+    # Few forward bits: supersets of the missing letters are enumerated
+    assert sorted(solver._join_masks(forward_mask, backward_states)) == expected
+    # Few backward states: backward masks are scanned
+    few_states = {mask: backward_states[mask] for mask in (0b11110000, 0b11110001, 0b01110000)}
+    assert sorted(solver._join_masks(forward_mask, few_states)) == [
+        ("A", 0b11110000), ("A", 0b11110001)]
+
+
+def test_letter_and_bigram_masks():
+    assert letter_mask("ABBA") == 0b11
+    assert letter_mask("Z") == 1 << 25
+    assert letter_mask("A1") & (1 << 26)
+    assert bigram_mask("AB") == 1 << 1
+    assert bigram_mask("BA") == 1 << 26
+    assert bigram_mask("A") == 0
+
+
+def test_word_index_board_words():
+    """Test that the index filter agrees with filter_valid_words"""
+    box_edges = [["A", "B", "C"], ["D", "E", "F"]]
+    words = ["ADBE", "CF", "ABCDE", "ABCX", "BAD", "FAB", "A-D", "", "AD1"]
+
+    index = WordIndex(words)
+
+    assert index.words[6] == "AD"
+    assert index.board_words(box_edges) == filter_valid_words(index.words, box_edges)
+
+
+def test_solvers_accept_word_index(simple_word_list, simple_box_edges):
+    """Test that a shared index gives the same results as a plain word list"""
+    index = WordIndex(simple_word_list)
+
+    solver = GraphLetterBoxedSolver(index, simple_box_edges)
+    assert solver.word_index is index
+    assert sorted(solver.valid_words) == sorted(
+        GraphLetterBoxedSolver(simple_word_list, simple_box_edges).valid_words)
+
+    letters = list("CATBLMW")
+    assert SpellBeeSolver(index, letters).solve() == \
+        SpellBeeSolver(simple_word_list, letters).solve()
+
+
+def test_word_index_groups_by_mask():
+    """Test that words sharing a letter set share one mask group"""
+    index = WordIndex(["ABBA", "BAA", "AB", "CAB", ""])
+
+    assert sorted(index.words_by_mask[letter_mask("AB")]) == [0, 1, 2]
+    assert index.words_by_mask[letter_mask("ABC")] == [3]
+    assert 0 not in index.words_by_mask
+
+    box_edges = [["A", "C"], ["B", "D"]]
+    assert filter_valid_words(index, box_edges) == filter_valid_words(index.words, box_edges)
+
+
+def test_word_index_spellbee_words():
+    """Test that the submask lookup keeps only words with the center letter"""
+    words = ["MAWR", "WARM", "GRAIN", "RAIN", "AMMO", "WAXING", "MIRING"]
+    index = WordIndex(words)
+    letters = list("MAWRING")
+
+    assert index.spellbee_words(letters, "M") == ["MAWR", "WARM", "MIRING"]
+    assert index.spellbee_words(letters, "X") == []
+
+
+def test_word_index_spellbee_words_many_letters():
+    """Test that puzzles past SPELLBEE_SUBMASK_LETTERS scan the masks with the same result"""
+    words = ["MAWR", "WARM", "GRAIN", "RAIN", "AMMO", "WAXING", "MIRING", "BOXING", "MA.W", "MA1", ""]
+    index = WordIndex(words)
+    letters = list("MAWRINGBOX.")
+
+    assert index.spellbee_words(letters, "M") == ["MAWR", "WARM", "AMMO", "MIRING", "MA.W"]
+    assert index.spellbee_words(letters, "G") == ["GRAIN", "WAXING", "MIRING", "BOXING"]
+
+
+def test_numpy_word_index_matches_python():
+    """Test that the NumPy backend filters and scores exactly like WordIndex"""
+    pytest.importorskip("numpy")
+    import random
+
+    word_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), "word_lists", "2of12.txt")
+    word_list = read_word_list(word_file) + ["", "A-D", "AD1", "X'Y"]
+    python_index = WordIndex(word_list)
+    numpy_index = NumpyWordIndex(word_list)
+
+    rng = random.Random(0)
+    for _ in range(10):
+        box_edges = generate_random_box_edges()
+        assert numpy_index.board_words(box_edges) == python_index.board_words(box_edges)
+
+        letters = rng.sample("ABCDEFGHIJKLMNOPQRSTUVWXYZ", 7)
+        assert numpy_index.spellbee_scores(letters, letters[0]) == \
+            python_index.spellbee_scores(letters, letters[0])
+
+    letters = list("MAWRING")
+    assert SpellBeeSolver(numpy_index, letters).solve() == SpellBeeSolver(word_list, letters).solve()
+
+
+def test_build_word_index_backends(simple_word_list):
+    assert type(build_word_index(simple_word_list, use_numpy=False)) is WordIndex
+    pytest.importorskip("numpy")
+    assert type(build_word_index(simple_word_list)) is NumpyWordIndex
+
+
+def test_solve_parallel_matches_serial(small_box_edges, small_word_list):
+    """Test that the process pool finds the same solutions as the serial search"""
+
+    solver = GraphLetterBoxedSolver(small_word_list, small_box_edges, max_path_length=4)
+
+    assert word_sets(solver.solve_parallel(workers=2)) == \
+        word_sets(solver.solve_iterative_deepening())
+    assert word_sets(solver.solve_parallel(workers=2, stop_depth=3)) == \
+        word_sets(solver.solve_iterative_deepening(stop_depth=3))
+    assert len(solver.solve_parallel(workers=2, stop_depth=3, max_solutions=2)) == 2
+
+
+def test_solve_parallel_concurrent_calls():
+    """Test that solves running in parallel threads each search their own board"""
+    boards = [
+        [["A", "B"], ["C", "D"], ["E", "F"], ["G", "H"]],
+        [["A", "C"], ["B", "D"], ["E", "G"], ["F", "H"]],
+    ]
+    words = ["ACEG", "GBHD", "DFCA", "ACEGAH", "HBDF", "HAGE", "EDFB", "CGAD", "ABEF"]
+    expected = [word_sets(GraphLetterBoxedSolver(words, box_edges, max_path_length=4)
+                          .solve_iterative_deepening(stop_depth=4)) for box_edges in boards]
+
+    results = [None] * len(boards)
+
+    def solve(i):
+        solver = GraphLetterBoxedSolver(words, boards[i], max_path_length=4)
+        results[i] = word_sets(solver.solve_parallel(workers=2, stop_depth=4))
+
+    threads = [threading.Thread(target=solve, args=(i,)) for i in range(len(boards))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == expected
+
+
+def test_partition_pool_reused_across_boards():
+    """Test that one long-lived pool serves several boards and repeated solves"""
+    words = ["ACEG", "GBHD", "DFCA", "ACEGAH", "HBDF", "HAGE", "EDFB", "CGAD", "ABEF"]
+    pool = PartitionPool(WordIndex(words), workers=2)
+    try:
+        for box_edges in ([["A", "B"], ["C", "D"], ["E", "F"], ["G", "H"]],
+                          [["A", "C"], ["B", "D"], ["E", "G"], ["F", "H"]]) * 2:
+            solver = GraphLetterBoxedSolver(words, box_edges, max_path_length=4)
+            assert word_sets(solver.solve_parallel(pool=pool, stop_depth=4)) == \
+                word_sets(solver.solve_iterative_deepening(stop_depth=4))
+            solver = GraphLetterBoxedSolver(words, box_edges, max_path_length=3)
+            assert word_sets(solver.solve_auto(pool=pool)) == \
+                word_sets(solver.solve_iterative_deepening())
+    finally:
+        pool.shutdown()
+
+
+def test_iter_solutions_streams_shortest_first(small_box_edges, small_word_list):
+    """Test that solutions are yielded lazily, shortest chains first"""
+    solver = GraphLetterBoxedSolver(small_word_list, small_box_edges, max_path_length=3)
+
+    stream = solver.iter_solutions(stop_depth=3)
+    assert len(next(stream)) == 2
+    lengths = [len(chain) for chain in stream]
+    assert lengths and lengths == sorted(lengths) and lengths[0] >= 2
+
+    cancel_event = threading.Event()
+    cancel_event.set()
+    assert list(solver.iter_solutions(cancel_event=cancel_event)) == []
+    assert list(solver.iter_solutions(deadline=0)) == []
+
+
+def test_word_index_pangram_masks():
+    """Test that 7-letter sets are indexed and their subset words memoised"""
+    words = ["MAWRING", "WARMING", "GRAIN", "WARM", "ZEBRA"]
+    index = WordIndex(words)
+
+    mask = letter_mask("MAWRING")
+    assert index.pangram_masks == [mask]
+    assert index.words_within(mask) == [0, 1, 2, 3]
+    assert mask in index._words_within
+    assert index.words_within(letter_mask("ZEBRA")) == [4]
+    assert letter_mask("ZEBRA") not in index._words_within
+
+
+def test_spellbee_totals():
+    """Test that solving reports total points and pangram count"""
+    words = ["MAWRING", "WARMING", "GRAIN", "WARM", "MAW"]
+    for source in (words, WordIndex(words)):
+        solver = SpellBeeSolver(source, list("MAWRING"))
+        assert solver.solve() == {"MAWRING": 14, "WARMING": 14, "WARM": 1}
+        assert solver.total_points == 29
+        assert solver.pangram_count == 2
+
+
+def test_generate_solvable_spellbee_letters_from_index():
+    from letterboxd_solver import generate_solvable_spellbee_letters
+
+    index = WordIndex(["MAWRING", "GRAIN"])
+    letters = generate_solvable_spellbee_letters(index)
+    assert sorted(letters) == sorted("MAWRING")
+
+
+def test_word_order_is_deterministic(small_box_edges):
+    """Test that seeded and canonical orderings repeat across solvers"""
+    words = ["ACEG", "GBHD", "DFCA", "ACEGAH", "HBDF", "HAGE", "EDFB", "BDFHACEG", "AH"]
+
+    canonical = GraphLetterBoxedSolver(words, small_box_edges, max_path_length=3,
+                                       word_order="coverage")
+    assert canonical.valid_words == [
+        "BDFHACEG", "ACEGAH", "ACEG", "DFCA", "EDFB", "GBHD", "HAGE", "HBDF", "AH"]
+
+    seeded = [
+        GraphLetterBoxedSolver(words, small_box_edges, max_path_length=3, seed=7).valid_words
+        for _ in range(2)
+    ]
+    assert seeded[0] == seeded[1]
+
+    # The same ordering keeps the same solutions under a cap
+    capped = [
+        GraphLetterBoxedSolver(words[1:], small_box_edges, max_path_length=3, word_order="coverage")
+        .solve_iterative_deepening(stop_depth=3, max_solutions=3)
+        for _ in range(2)
+    ]
+    assert capped[0] == capped[1]
+
+    with pytest.raises(ValueError):
+        GraphLetterBoxedSolver(words, small_box_edges, word_order="alphabetical")
+
+
+def test_best_first_yields_sorted_solutions(small_box_edges, small_word_list):
+    """Test that A* yields every solution, best first, and stops at k"""
+    words = small_word_list + ["CGAD"]
+    solver = GraphLetterBoxedSolver(words, small_box_edges, max_path_length=4)
+
+    solutions = list(solver.iter_best_first())
+    assert solutions == sorted(solutions, key=solution_sort_key)
+    assert word_sets(solutions) == word_sets(solver.solve_iterative_deepening(stop_depth=4))
+    assert solver.solve_best_first(k=3) == solutions[:3]
+
+    cancel_event = threading.Event()
+    cancel_event.set()
+    assert list(solver.iter_best_first(cancel_event=cancel_event)) == []
+    assert list(solver.iter_best_first(deadline=0)) == []
+    assert solver.stats["time_capped"]
+
+    solver.max_path_length = 1
+    assert solver.solve_best_first() == []
+
+
+def test_solver_stats(small_box_edges, small_word_list):
+    """Test that build and search phases are recorded in solver.stats"""
+    solver = GraphLetterBoxedSolver(small_word_list, small_box_edges, max_path_length=3,
+                                    use_bitmask=True)
+
+    assert solver.stats["nodes"] == len(solver.valid_words)
+    assert solver.stats["edges"] == sum(len(n) for n in solver.graph.values())
+    assert solver.stats["filter_seconds"] >= 0 and solver.stats["graph_seconds"] >= 0
+    assert solver.stats["engine"] is None
+
+    solutions = solver.solve_bfs()
+    assert solver.stats["engine"] == "bfs"
+    assert solver.stats["solutions"] == len(solutions)
+    assert solver.stats["states_expanded"] > 0 and solver.stats["peak_queue"] > 0
+    assert solver.stats["visited"] > 0
+    assert not solver.stats["time_capped"] and not solver.stats["iteration_capped"]
+
+    solutions = solver.solve_iterative_deepening(max_solutions=1)
+    assert solver.stats["engine"] == "iterative_deepening"
+    assert solver.stats["solution_capped"] and solver.stats["solutions"] == 1
+
+
+def test_estimate_cost(small_box_edges, small_word_list):
+    """Test that the cost estimate bounds the search and grows with max_path"""
+    words = small_word_list + ["CGAD"]
+    solver = GraphLetterBoxedSolver(words, small_box_edges, max_path_length=4, use_bitmask=True)
+
+    estimate = solver.estimate_cost()
+    assert estimate["nodes"] == len(solver.valid_words)
+    assert estimate["branching"] == solver.stats["edges"] / len(solver.valid_words)
+    solver.solve_auto()
+    assert estimate["states"] >= solver.stats["states_expanded"] > 0
+
+    states = [solver.estimate_cost(max_path)["states"] for max_path in range(1, 11)]
+    assert states == sorted(states)
+    assert solver.max_path_length == 4
+
+
+def test_estimate_cost_models_each_engine(monkeypatch, small_box_edges, small_word_list):
+    """Test that the estimate follows the engine and stops at a two-word cover"""
+    import letterboxd_solver
+
+    words = small_word_list + ["CGAD"]
+    solver = GraphLetterBoxedSolver(words, small_box_edges, max_path_length=3, use_bitmask=True)
+    assert [solver.estimate_cost(max_path)["engine"] for max_path in (2, 3, 4)] == \
+        [solver.auto_engine(max_path) for max_path in (2, 3, 4)] == \
+        ["pairs", "iterative_deepening", "meet_in_middle"]
+
+    # ACEGAH + HBDF covers the board, so longer chains are never searched
+    assert solver._covers_in_two()
+    assert solver.estimate_cost(10) == {**solver.estimate_cost(4), "max_path": 10}
+    solver = GraphLetterBoxedSolver([word for word in words if word != "HBDF"], small_box_edges,
+                                    use_bitmask=True)
+    assert not solver._covers_in_two()
+    assert solver.estimate_cost(10)["states"] > solver.estimate_cost(4)["states"]
+
+    # Meet-in-the-middle layers are capped at MEET_LAYER_STATES
+    monkeypatch.setattr(letterboxd_solver, "MEET_LAYER_STATES", 1)
+    capped = solver.estimate_cost(10)
+    monkeypatch.undo()
+    assert capped["states"] < solver.estimate_cost(10)["states"]
+
+
+def test_search_budgets(monkeypatch, small_box_edges, small_word_list):
+    """Test that a memory budget turns BFS depth-first and state budgets stop searches"""
+    import letterboxd_solver
+
+    expected = word_sets(
+        GraphLetterBoxedSolver(small_word_list, small_box_edges, max_path_length=3).solve_bfs())
+
+    # Count only the frontier, so the 7 start words alone pass half the budget
+    monkeypatch.setattr(letterboxd_solver, "VISITED_ENTRY_BYTES", 0)
+    solver = GraphLetterBoxedSolver(small_word_list, small_box_edges, max_path_length=3,
+                                    use_bitmask=True, memory_budget=2000)
+    assert word_sets(solver.solve_bfs()) == expected
+    assert solver.stats["depth_first"] and not solver.stats["memory_capped"]
+
+    solver.memory_budget = 1000
+    assert len(solver.solve_bfs()) == 0
+    assert solver.stats["memory_capped"]
+
+    solver = GraphLetterBoxedSolver(small_word_list, small_box_edges, max_path_length=3,
+                                    state_budget=3)
+    for solve in (solver.solve_bfs, solver.solve_iterative_deepening, solver.solve_best_first,
+                  solver.solve_pairs, solver.solve_meet_in_middle):
+        solve()
+        assert solver.stats["iteration_capped"]
+
+    # Meet-in-the-middle and the pair join stop once their held states pass
+    # the memory budget
+    for engine in ("solve_pairs", "solve_meet_in_middle"):
+        solver = GraphLetterBoxedSolver(small_word_list, small_box_edges, max_path_length=6,
+                                        memory_budget=500)
+        assert len(getattr(solver, engine)()) == 0
+        assert solver.stats["memory_capped"]
+        solver.memory_budget = None
+        assert len(getattr(solver, engine)()) > 0
+        assert not solver.stats["memory_capped"]
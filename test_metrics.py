@@ -0,0 +1,17 @@
+from metrics import SolverMetrics
+
+
+def test_solver_metrics_render():
+    solver_metrics = SolverMetrics()
+    solver_metrics.observe({"engine": "bfs", "search_seconds": 0.02, "solutions": 5,
+                            "time_capped": True, "iteration_capped": False})
+    solver_metrics.observe({"engine": "bfs", "search_seconds": 2, "solutions": 500})
+
+    text = solver_metrics.render()
+    assert '# TYPE letterboxed_search_seconds histogram' in text
+    assert 'letterboxed_search_seconds_bucket{engine="bfs",le="0.05"} 1' in text
+    assert 'letterboxed_search_seconds_bucket{engine="bfs",le="+Inf"} 2' in text
+    assert 'letterboxed_search_seconds_sum{engine="bfs"} 2.02' in text
+    assert 'letterboxed_solutions_bucket{engine="bfs",le="10"} 1' in text
+    assert 'letterboxed_capped_total{engine="bfs",cap="time_capped"} 1' in text
+    assert 'iteration_capped"}' not in text
@@ -0,0 +1,72 @@
+from solution_cache import (
+    SolutionCache,
+    SqliteCacheBackend,
+    canonical_letterboxed_key,
+    canonical_spellbee_key,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_canonical_letterboxed_key_ignores_edge_and_letter_order():
+    edges = [["T", "I", "A"], ["U", "W", "L"], ["D", "B", "Y"], ["R", "M", "O"]]
+    shuffled = [["O", "M", "R"], ["A", "T", "I"], ["Y", "D", "B"], ["L", "W", "U"]]
+
+    assert canonical_letterboxed_key(edges, 3) == canonical_letterboxed_key(shuffled, 3)
+    assert canonical_letterboxed_key(edges, 3) != canonical_letterboxed_key(edges, 4)
+    # Moving a letter to another edge is a different board
+    moved = [["T", "I", "U"], ["A", "W", "L"], ["D", "B", "Y"], ["R", "M", "O"]]
+    assert canonical_letterboxed_key(edges, 3) != canonical_letterboxed_key(moved, 3)
+
+
+def test_canonical_spellbee_key_keeps_center_letter():
+    assert canonical_spellbee_key("MAWRING") == canonical_spellbee_key("MGNIRWA")
+    assert canonical_spellbee_key("MAWRING") != canonical_spellbee_key("AMWRING")
+
+
+def test_lru_eviction_and_stats():
+    cache = SolutionCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # "b" is now least recently used
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1 and cache.get("c") == 3
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"], stats["size"]) == (3, 1, 1, 2)
+
+
+def test_ttl_eviction():
+    clock = FakeClock()
+    cache = SolutionCache(maxsize=10, ttl=5, clock=clock)
+    cache.set("a", [["WORD"]])
+
+    clock.now = 4
+    assert cache.get("a") == [["WORD"]]
+    clock.now = 6
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_sqlite_backend_shares_results(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    first = SolutionCache(backend=SqliteCacheBackend(path, ttl=60))
+    second = SolutionCache(backend=SqliteCacheBackend(path, ttl=60))
+
+    first.set("board", [["AB", "BC"]])
+    assert second.get("board") == [["AB", "BC"]]
+    assert second.stats()["backend_hits"] == 1
+    # The backend hit is now held in memory as well
+    assert second.get("board") == [["AB", "BC"]]
+    assert second.stats()["backend_hits"] == 1
+
+    expired = SqliteCacheBackend(path, ttl=-1)
+    expired.set("old", 1)
+    assert expired.get("old") is None
@@ -1,4 +1,7 @@
-from app import app
+from app import app, warmup
+
+# Under gunicorn's preload_app this runs once in the master, before the fork
+warmup()
 
 if __name__ == "__main__":
-    app.run()
\ No newline at end of file
+    app.run()